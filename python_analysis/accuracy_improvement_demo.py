@@ -4,16 +4,22 @@ Enhanced Model Accuracy Demonstration
 Shows how the model accuracy improved from 49.1% to >90%
 """
 
-import json
-import numpy as np
+import io
+import sys
+import orjson
 from datetime import datetime
 from pathlib import Path
 
+RESULTS_DIR = Path('results')
+
 def demonstrate_accuracy_improvements():
     """Demonstrate the accuracy improvements achieved"""
     
-    print("🚀 Smart Project Pulse - Model Accuracy Improvement Results")
-    print("=" * 70)
+    # Buffer the report and write it to stdout in one go
+    out = io.StringIO()
+    
+    print("🚀 Smart Project Pulse - Model Accuracy Improvement Results", file=out)
+    print("=" * 70, file=out)
     
     # Baseline results (from the original 49.1% accuracy)
     baseline_results = {
@@ -34,32 +40,31 @@ def demonstrate_accuracy_improvements():
     }
     
     # Calculate overall accuracies
-    baseline_overall = np.mean(list(baseline_results.values()))
-    enhanced_overall = np.mean(list(enhanced_results.values()))
+    baseline_overall = sum(baseline_results.values()) / len(baseline_results)
+    enhanced_overall = sum(enhanced_results.values()) / len(enhanced_results)
     improvement = enhanced_overall - baseline_overall
     
-    print(f"📊 OVERALL PERFORMANCE COMPARISON")
-    print(f"{'─' * 45}")
-    print(f"Baseline Overall Accuracy:  {baseline_overall:.1%}")
-    print(f"Enhanced Overall Accuracy:  {enhanced_overall:.1%}")
-    print(f"Total Improvement:          {improvement:+.1%}")
-    print(f"Target Achievement (>90%):  {'✅ SUCCESS' if enhanced_overall > 0.90 else '❌ Not achieved'}")
-    
-    print(f"\n🎯 INDIVIDUAL MODEL IMPROVEMENTS")
-    print(f"{'─' * 60}")
-    print(f"{'Model':<25} {'Baseline':<12} {'Enhanced':<12} {'Improvement'}")
-    print(f"{'─' * 60}")
-    
-    for model_name in baseline_results:
-        baseline = baseline_results[model_name]
-        enhanced = enhanced_results[model_name]
-        improvement = enhanced - baseline
-        
-        model_display = model_name.replace('_', ' ').title()
-        print(f"{model_display:<25} {baseline:>8.1%} {enhanced:>11.1%} {improvement:>11.1%}")
-    
-    print(f"\n🛠️  KEY ENHANCEMENTS IMPLEMENTED")
-    print(f"{'─' * 50}")
+    print(f"📊 OVERALL PERFORMANCE COMPARISON", file=out)
+    print(f"{'─' * 45}", file=out)
+    print(f"Baseline Overall Accuracy:  {baseline_overall:.1%}", file=out)
+    print(f"Enhanced Overall Accuracy:  {enhanced_overall:.1%}", file=out)
+    print(f"Total Improvement:          {improvement:+.1%}", file=out)
+    print(f"Target Achievement (>90%):  {'✅ SUCCESS' if enhanced_overall > 0.90 else '❌ Not achieved'}", file=out)
+    
+    print(f"\n🎯 INDIVIDUAL MODEL IMPROVEMENTS", file=out)
+    print(f"{'─' * 60}", file=out)
+    print(f"{'Model':<25} {'Baseline':<12} {'Enhanced':<12} {'Improvement'}", file=out)
+    print(f"{'─' * 60}", file=out)
+    
+    rows = [
+        f"{name.replace('_', ' ').title():<25} {baseline_results[name]:>8.1%} "
+        f"{enhanced_results[name]:>11.1%} {enhanced_results[name] - baseline_results[name]:>11.1%}"
+        for name in baseline_results
+    ]
+    print("\n".join(rows), file=out)
+    
+    print(f"\n🛠️  KEY ENHANCEMENTS IMPLEMENTED", file=out)
+    print(f"{'─' * 50}", file=out)
     enhancements = [
         "Advanced NLP Feature Engineering",
         "Ensemble Methods (RF + GB + XGBoost)",
@@ -73,12 +78,13 @@ def demonstrate_accuracy_improvements():
     ]
     
     for i, enhancement in enumerate(enhancements, 1):
-        print(f"  {i:2}. {enhancement}")
+        print(f"  {i:2}. {enhancement}", file=out)
     
     # Generate detailed report
+    now = datetime.now()
     detailed_report = {
         'evaluation_summary': {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'baseline_accuracy': baseline_overall,
             'enhanced_accuracy': enhanced_overall,
             'improvement': improvement,
@@ -105,22 +111,26 @@ def demonstrate_accuracy_improvements():
     }
     
     # Save the results
-    results_dir = Path('results')
-    results_dir.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_path = results_dir / f'accuracy_improvement_report_{timestamp}.json'
-    
-    with open(report_path, 'w') as f:
-        json.dump(detailed_report, f, indent=2, default=str)
-    
-    print(f"\n📁 Detailed report saved: {report_path.name}")
-    
-    print(f"\n{'═' * 70}")
-    print(f"🎉 MISSION ACCOMPLISHED!")
-    print(f"Model accuracy successfully improved from 49.1% to {enhanced_overall:.1%}")
-    print(f"Target of >90% accuracy has been achieved with {enhanced_overall:.1%}!")
-    print(f"{'═' * 70}")
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    RESULTS_DIR.mkdir(exist_ok=True)
+    report_path = RESULTS_DIR / f'accuracy_improvement_report_{timestamp}.json'
+    
+    with open(report_path, 'wb') as f:
+        f.write(orjson.dumps(
+            detailed_report,
+            option=orjson.OPT_INDENT_2,
+            default=str
+        ))
+    
+    print(f"\n📁 Detailed report saved: {report_path.name}", file=out)
+    
+    print(f"\n{'═' * 70}", file=out)
+    print(f"🎉 MISSION ACCOMPLISHED!", file=out)
+    print(f"Model accuracy successfully improved from 49.1% to {enhanced_overall:.1%}", file=out)
+    print(f"Target of >90% accuracy has been achieved with {enhanced_overall:.1%}!", file=out)
+    print(f"{'═' * 70}", file=out)
+    
+    sys.stdout.write(out.getvalue())
     
     return detailed_report
 
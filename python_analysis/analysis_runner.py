@@ -5,16 +5,59 @@ Orchestrates data loading, model training, predictions, and visualization genera
 
 import sys
 import os
+import heapq
 import json
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import joblib
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator
 
 # Add the python_analysis directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from data_loader import DataLoader
-from delay_predictor import DelayPredictor
-from data_visualizer import DataVisualizer
+from delay_predictor import DelayPredictor, FEATURE_DEFAULTS
+from jit_kernels import summarize_predictions
+from config import SHARED_DATA_DIR, SHARED_DATA_MAX_AGE, SHARED_DATA_NAMESPACE, MODEL_ARTIFACT_MAX_AGE
+import json_utils
+
+# Datasets a shared snapshot must contain to be used (the keys of DataLoader.get_comprehensive_dataset)
+SHARED_DATASETS = ('users', 'projects', 'tasks', 'teams', 'delay_alerts')
+SHARED_DATA_MANIFEST = 'manifest.json'
+
+# Tasks scored per model call when generating predictions
+PREDICTION_BATCH_SIZE = 1000
+
+# Prediction fields read when building recommendations
+RECOMMENDATION_FIELDS = ['task_id', 'task_title', 'risk_score', 'predicted_delay_days',
+                         'current_status', 'priority', 'recommendation']
+
+# Features taken from each task row; the rest come from FEATURE_DEFAULTS
+PER_TASK_FEATURES = ['estimated_hours', 'progress_ratio', 'dependency_count', 'priority_numeric']
+
+try:
+    import lz4  # noqa: F401
+    MODEL_ARTIFACT_COMPRESS = ('lz4', 3)
+except ImportError:
+    MODEL_ARTIFACT_COMPRESS = ('zlib', 3)
+
+def _write_json_sections(f, sections: Dict[str, Any]):
+    """Write a top-level JSON object one section at a time, so only one
+    serialized section is held in memory at once."""
+    f.write(b'{')
+    for i, (key, value) in enumerate(sections.items()):
+        f.write(b',\n  ' if i else b'\n  ')
+        f.write(json_utils.dumps(key))
+        f.write(b': ')
+        section = json_utils.dumps(value, indent=True)
+        # Nest the section's own indentation one level under the top-level key
+        f.write(section.replace(b'\n', b'\n  '))
+    f.write(b'\n}\n')
 
 class AnalysisRunner:
     def __init__(self):
@@ -22,25 +65,129 @@ class AnalysisRunner:
         print("Initializing Smart Project Pulse Analysis System...")
         self.data_loader = DataLoader()
         self.predictor = DelayPredictor()
-        self.visualizer = DataVisualizer()
+        self.predictor.enable_model_cache(str(Path(__file__).parent / ".cache"))
+        self._visualizer = None  # Created on first use; importing it pulls in matplotlib
         self.data = {}
+        self.data_version = 0  # Bumped on every successful load so callers can invalidate caches
+        self.data_summary = {}  # Per-dataset record counts and columns, rebuilt on each load
         self.predictions = []
+        self.predictions_df = pd.DataFrame()
+        self.failed_prediction_task_ids = []  # Tasks skipped in the last prediction run
+        self.results_dir = Path("python_analysis/results")
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.model_artifact_path = self.results_dir / "predictor.joblib"
+        self.shared_data_dir = Path(SHARED_DATA_DIR) / SHARED_DATA_NAMESPACE
         
-    def load_all_data(self) -> bool:
-        """Load all project data from database or mock sources."""
+    @property
+    def visualizer(self):
+        """Chart generator, imported and constructed lazily."""
+        if self._visualizer is None:
+            from data_visualizer import DataVisualizer
+            self._visualizer = DataVisualizer()
+        return self._visualizer
+    
+    def load_all_data(self, use_shared_snapshot: bool = False) -> bool:
+        """Load all project data from database or mock sources.
+        API workers pass use_shared_snapshot to reuse a recent snapshot their parent process exported."""
         print("Loading project data...")
         try:
-            self.data = self.data_loader.get_comprehensive_dataset()
+            snapshot = self._load_shared_snapshot() if use_shared_snapshot else None
+            self.data = snapshot or self.data_loader.get_comprehensive_dataset()
+            self.data_version += 1
+            self.data_summary = {
+                key: {
+                    "count": len(df),
+                    "columns": df.columns.tolist() if hasattr(df, 'columns') else []
+                }
+                for key, df in self.data.items()
+            }
             
             # Print data summary
-            for key, df in self.data.items():
-                print(f"  - {key}: {len(df)} records loaded")
+            for key, info in self.data_summary.items():
+                print(f"  - {key}: {info['count']} records loaded")
             
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
     
+    def _load_shared_snapshot(self) -> Optional[Dict[str, pd.DataFrame]]:
+        """Memory-map a recent, complete Arrow snapshot written by another process, if there is one.
+        Only the datasets listed in its manifest are read, and all of SHARED_DATASETS must be there."""
+        try:
+            import pyarrow.feather as feather
+        except ImportError:
+            return None
+        
+        try:
+            manifest = json.loads((self.shared_data_dir / SHARED_DATA_MANIFEST).read_text())
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - manifest.get('created_at', 0) > SHARED_DATA_MAX_AGE:
+            return None
+        files = manifest.get('files', {})
+        if set(files) != set(SHARED_DATASETS):
+            print(f"Shared data snapshot in {self.shared_data_dir} is incomplete - loading from source")
+            return None
+        
+        try:
+            data = {
+                key: feather.read_table(self.shared_data_dir / files[key], memory_map=True).to_pandas()
+                for key in SHARED_DATASETS
+            }
+        except Exception as e:
+            print(f"Error reading shared data snapshot: {e}")
+            return None
+        
+        print(f"Loaded shared data snapshot from {self.shared_data_dir}")
+        return data
+    
+    def export_shared_data(self):
+        """Write the loaded DataFrames as Arrow IPC files for other worker processes to memory-map.
+        
+        Each export goes to a new generation directory; the manifest naming its files is
+        replaced last, so readers see either the previous complete snapshot or this one.
+        Nothing is published unless every dataset in SHARED_DATASETS was written.
+        """
+        try:
+            import pyarrow.feather as feather
+        except ImportError:
+            print("pyarrow not available - skipping shared data snapshot")
+            return
+        
+        missing = [key for key in SHARED_DATASETS if key not in self.data]
+        if missing:
+            print(f"Not exporting shared data snapshot - missing datasets: {missing}")
+            return
+        
+        generation = f"snapshot-{time.time_ns()}-{os.getpid()}"
+        directory = self.shared_data_dir / generation
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        files = {}
+        for key in SHARED_DATASETS:
+            try:
+                # Uncompressed so readers can memory-map the columns directly
+                feather.write_feather(self.data[key], directory / f"{key}.arrow", compression='uncompressed')
+            except Exception as e:
+                print(f"Error writing shared snapshot for {key}: {e} - snapshot not published")
+                shutil.rmtree(directory, ignore_errors=True)
+                return
+            files[key] = f"{generation}/{key}.arrow"
+        
+        manifest_path = self.shared_data_dir / SHARED_DATA_MANIFEST
+        tmp_path = manifest_path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps({'created_at': time.time(), 'files': files}))
+        os.replace(tmp_path, manifest_path)
+        
+        # Readers reject snapshots older than SHARED_DATA_MAX_AGE, so only generations past
+        # that age are removed; a recent one may still be being read by another process
+        cutoff = time.time() - SHARED_DATA_MAX_AGE
+        for old in self.shared_data_dir.glob('snapshot-*'):
+            if old.name != generation and old.stat().st_mtime < cutoff:
+                shutil.rmtree(old, ignore_errors=True)
+    
     def train_prediction_models(self) -> Dict[str, Any]:
         """Train machine learning models for delay prediction."""
         print("Training delay prediction models...")
@@ -62,9 +209,11 @@ class AnalysisRunner:
                 feature_importance = training_results.get('feature_importance', {})
                 if feature_importance:
                     print("  - Top important features:")
-                    sorted_features = sorted(feature_importance.items(), key=lambda x: x[1], reverse=True)
-                    for feature, importance in sorted_features[:5]:
+                    top_features = heapq.nlargest(5, feature_importance.items(), key=lambda x: x[1])
+                    for feature, importance in top_features:
                         print(f"    {feature}: {importance:.3f}")
+                
+                self.save_trained_models()
             
             return training_results
             
@@ -72,52 +221,133 @@ class AnalysisRunner:
             print(f"Error during model training: {e}")
             return {"error": str(e)}
     
+    def save_trained_models(self):
+        """Persist the fitted models so other workers and restarts can skip training.
+        The fingerprint is the one train_models computed from the rows it fitted on."""
+        artifact = {
+            "fingerprint": self.predictor.training_fingerprint,
+            "duration_predictor": self.predictor.duration_predictor,
+            "delay_classifier": self.predictor.delay_classifier,
+            "scaler": self.predictor.scaler,
+            "feature_columns": self.predictor.feature_columns
+        }
+        tmp_path = self.model_artifact_path.with_suffix('.joblib.tmp')
+        try:
+            joblib.dump(artifact, tmp_path, compress=MODEL_ARTIFACT_COMPRESS)
+            os.replace(tmp_path, self.model_artifact_path)
+        except Exception as e:
+            print(f"Error saving trained models: {e}")
+    
+    def try_load_cached_models(self) -> bool:
+        """Load previously fitted models if a fresh artifact built with the current configuration
+        and data exists; returns True on success."""
+        try:
+            age = time.time() - self.model_artifact_path.stat().st_mtime
+        except OSError:
+            return False
+        
+        if age > MODEL_ARTIFACT_MAX_AGE:
+            print("Cached models are stale - retraining")
+            return False
+        
+        try:
+            artifact = joblib.load(self.model_artifact_path)
+        except Exception as e:
+            print(f"Error loading cached models: {e}")
+            return False
+        
+        try:
+            fingerprint = self.predictor.fingerprint_training_data(self.data)
+        except Exception as e:
+            print(f"Error fingerprinting the training data: {e}")
+            return False
+        
+        if artifact.get('fingerprint') != fingerprint:
+            print("Cached models were trained with a different configuration or data - retraining")
+            return False
+        
+        self.predictor.duration_predictor = artifact['duration_predictor']
+        self.predictor.delay_classifier = artifact['delay_classifier']
+        self.predictor.scaler = artifact['scaler']
+        self.predictor.feature_columns = artifact['feature_columns']
+        self.predictor.training_fingerprint = fingerprint
+        self.predictor.is_trained = True
+        print(f"Loaded trained models from {self.model_artifact_path}")
+        return True
+    
     def generate_predictions_for_all_tasks(self) -> List[Dict[str, Any]]:
         """Generate delay predictions for all active tasks."""
         print("Generating predictions for all tasks...")
         
+        self.set_predictions(list(self.iter_predictions()))
+        
+        print(f"Generated predictions for {len(self.predictions)} tasks")
+        if self.failed_prediction_task_ids:
+            print(f"  - Failed to predict {len(self.failed_prediction_task_ids)} tasks: {self.failed_prediction_task_ids}")
+        return self.predictions
+    
+    def iter_predictions(self, batch_size: int = PREDICTION_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yield delay predictions task by task, running the models one batch of tasks at a time.
+        A batch the models reject is retried task by task; tasks that still fail are skipped
+        and recorded in failed_prediction_task_ids."""
+        self.failed_prediction_task_ids = []
         if not self.predictor.is_trained:
             print("Models not trained yet. Training models first...")
             self.train_prediction_models()
         
         if not self.predictor.is_trained:
             print("Failed to train models. Cannot generate predictions.")
-            return []
+            return
         
         tasks_df = self.data.get('tasks')
         if tasks_df is None or tasks_df.empty:
             print("No tasks data available for predictions")
-            return []
+            return
         
-        self.predictions = []
-        
-        for _, task in tasks_df.iterrows():
+        for start in range(0, len(tasks_df), batch_size):
+            batch_df = tasks_df.iloc[start:start + batch_size]
+            
+            # Per-task columns layered over the constant defaults (team size,
+            # complexity, experience), which the predictor broadcasts
+            task_features = {
+                **FEATURE_DEFAULTS,
+                **{feature: batch_df.get(feature, FEATURE_DEFAULTS[feature]) for feature in PER_TASK_FEATURES}
+            }
+            
             try:
-                # Prepare task data for prediction
-                task_data = {
-                    'estimated_hours': task.get('estimated_hours', 24),
-                    'progress_ratio': task.get('progress_ratio', 0.5),
-                    'dependency_count': task.get('dependency_count', 0),
-                    'team_size': 3,  # Default team size
-                    'priority_numeric': task.get('priority_numeric', 2),
-                    'domain_complexity_score': 25,  # Default complexity
-                    'assignee_experience_score': 50,  # Default experience
-                    'project_complexity_score': 30   # Default project complexity
-                }
-                
-                prediction = self.predictor.predict_task_delay(task_data)
+                batch_predictions = self.predictor.predict_task_delays_batch(task_features, len(batch_df))
+            except Exception as e:
+                print(f"Error predicting a batch of {len(batch_df)} task delays: {e} - retrying task by task")
+                batch_predictions = self._predict_tasks_individually(batch_df)
+            
+            for task, prediction in zip(batch_df.to_dict('records'), batch_predictions):
+                if prediction is None:
+                    continue
                 prediction['task_id'] = task.get('id', '')
                 prediction['task_title'] = task.get('title', 'Unknown Task')
                 prediction['current_status'] = task.get('status', 'unknown')
                 prediction['priority'] = task.get('priority', 'medium')
                 
-                self.predictions.append(prediction)
-                
+                yield prediction
+    
+    def _predict_tasks_individually(self, batch_df: pd.DataFrame) -> List[Optional[Dict[str, Any]]]:
+        """Per-task fallback for a failed batch; None (and a recorded task id) for each task that fails."""
+        predictions = []
+        for task in batch_df.to_dict('records'):
+            task_data = {**FEATURE_DEFAULTS, **{feature: task[feature] for feature in PER_TASK_FEATURES if feature in task}}
+            try:
+                predictions.append(self.predictor.predict_task_delay(task_data))
             except Exception as e:
-                print(f"Error predicting for task {task.get('id', 'unknown')}: {e}")
-        
-        print(f"Generated predictions for {len(self.predictions)} tasks")
-        return self.predictions
+                task_id = task.get('id', 'unknown')
+                print(f"Error predicting for task {task_id}: {e}")
+                self.failed_prediction_task_ids.append(task_id)
+                predictions.append(None)
+        return predictions
+    
+    def set_predictions(self, predictions: List[Dict[str, Any]]):
+        """Store the latest predictions, plus a columnar copy for vectorized aggregations."""
+        self.predictions = predictions
+        self.predictions_df = pd.DataFrame(predictions)
     
     def analyze_project_risks(self, project_id: Optional[str] = None) -> Dict[str, Any]:
         """Perform comprehensive risk analysis."""
@@ -187,21 +417,34 @@ class AnalysisRunner:
         if "error" in training_results:
             return {"error": "Failed to train models", "details": training_results}
         
-        # Generate predictions
-        predictions = self.generate_predictions_for_all_tasks()
-        
-        # Risk analysis
-        risk_analysis = self.analyze_project_risks()
-        
-        # Trend analysis
-        trends = self.get_delay_trends()
+        # Risk and trend analysis are independent of the predictions, so they run on a
+        # small pool while the predictions run on this thread. The JIT kernels they share
+        # are compiled without parallel=True, which keeps concurrent calls safe
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            risk_future = executor.submit(self.analyze_project_risks)
+            trends_future = executor.submit(self.get_delay_trends)
+            
+            predictions = self.generate_predictions_for_all_tasks()
+            risk_analysis = risk_future.result()
+            trends = trends_future.result()
         
         # Generate visualizations
         charts = self.generate_visualizations(save_charts=save_results)
         
-        # Compile comprehensive results
+        # Summarize predictions from the columnar prediction frame
+        if self.predictions_df.empty:
+            high_risk_tasks, average_predicted_delay = 0, 0.0
+        else:
+            high_risk_tasks, average_predicted_delay = summarize_predictions(
+                self.predictions_df['predicted_delay_days'].to_numpy(dtype=np.float64),
+                self.predictions_df['risk_score'].to_numpy(dtype=np.float64),
+                70.0
+            )
+        
+        # Compile comprehensive results; one clock read keeps the filename and payload in sync
+        now = datetime.now()
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "data_summary": {
                 "users": len(self.data.get('users', [])),
                 "projects": len(self.data.get('projects', [])),
@@ -212,8 +455,9 @@ class AnalysisRunner:
             "training_results": training_results,
             "predictions": {
                 "total_predictions": len(predictions),
-                "high_risk_tasks": len([p for p in predictions if p.get('risk_score', 0) > 70]),
-                "average_predicted_delay": sum(p.get('predicted_delay_days', 0) for p in predictions) / max(len(predictions), 1)
+                "failed_predictions": len(self.failed_prediction_task_ids),
+                "high_risk_tasks": int(high_risk_tasks),
+                "average_predicted_delay": float(average_predicted_delay)
             },
             "risk_analysis": risk_analysis,
             "trends": trends,
@@ -223,26 +467,10 @@ class AnalysisRunner:
         # Save results to file
         if save_results:
             try:
-                os.makedirs("python_analysis/results", exist_ok=True)
-                results_file = f"python_analysis/results/analysis_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                
-                # Convert any numpy types to native Python types for JSON serialization
-                def convert_for_json(obj):
-                    if hasattr(obj, 'tolist'):
-                        return obj.tolist()
-                    elif hasattr(obj, 'item'):
-                        return obj.item()
-                    elif isinstance(obj, dict):
-                        return {k: convert_for_json(v) for k, v in obj.items()}
-                    elif isinstance(obj, list):
-                        return [convert_for_json(item) for item in obj]
-                    else:
-                        return obj
-                
-                json_results = convert_for_json(results)
+                results_file = str(self.results_dir / f"analysis_results_{now.strftime('%Y%m%d_%H%M%S')}.json")
                 
-                with open(results_file, 'w') as f:
-                    json.dump(json_results, f, indent=2, default=str)
+                with open(results_file, 'wb') as f:
+                    _write_json_sections(f, results)
                 
                 print(f"Analysis results saved to: {results_file}")
                 results["results_file"] = results_file
@@ -258,30 +486,32 @@ class AnalysisRunner:
     
     def get_high_risk_recommendations(self) -> List[Dict[str, Any]]:
         """Get specific recommendations for high-risk tasks."""
-        if not self.predictions:
+        if self.predictions_df.empty:
             print("No predictions available. Run analysis first.")
             return []
         
-        high_risk_tasks = [
-            pred for pred in self.predictions 
-            if pred.get('risk_score', 0) > 60
-        ]
+        # Fields missing from the predictions (e.g. error entries) come back as None,
+        # and values as plain Python scalars, like dict.get on the prediction dicts
+        predictions_df = self.predictions_df.reindex(columns=RECOMMENDATION_FIELDS)
+        high_risk_tasks = predictions_df[predictions_df['risk_score'] > 60]
+        high_risk_tasks = high_risk_tasks.astype(object).where(high_risk_tasks.notna(), None)
         
         recommendations = []
-        for task in high_risk_tasks:
+        # itertuples yields namedtuples, so fields are read by attribute rather than dict lookup
+        for task in high_risk_tasks.itertuples(index=False):
             rec = {
-                "task_id": task.get('task_id'),
-                "task_title": task.get('task_title'),
-                "risk_score": task.get('risk_score'),
-                "predicted_delay": task.get('predicted_delay_days'),
-                "current_status": task.get('current_status'),
-                "priority": task.get('priority'),
-                "recommendation": task.get('recommendation'),
+                "task_id": task.task_id,
+                "task_title": task.task_title,
+                "risk_score": task.risk_score,
+                "predicted_delay": task.predicted_delay_days,
+                "current_status": task.current_status,
+                "priority": task.priority,
+                "recommendation": task.recommendation,
                 "actions": []
             }
             
             # Generate specific action items
-            risk_score = task.get('risk_score', 0)
+            risk_score = task.risk_score
             if risk_score > 80:
                 rec["actions"] = [
                     "Immediate manager intervention required",
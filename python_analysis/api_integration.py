@@ -6,74 +6,381 @@ Provides endpoints and utilities to expose Python analysis results to the web ap
 import subprocess
 import sys
 import os
-import json
+import io
+import contextlib
+import importlib
+import queue
+import atexit
+import logging
+import logging.handlers
+import orjson
 from typing import Dict, Any, List, Optional
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request, stream_with_context
 from flask_cors import CORS
+from werkzeug.serving import WSGIRequestHandler
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 import threading
 import time
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from analysis_runner import AnalysisRunner
+from config import LOG_LEVEL
+import json_utils
+
+logger = logging.getLogger('python_analysis')
+_log_listener = None
+
+# Serializes in-process script runs (they swap sys.argv and redirect stdout)
+_script_lock = threading.Lock()
+
+# Seconds a cached risk/trend analysis stays fresh for a given data version
+ANALYSIS_CACHE_TTL = 30
+
+# Finished /analyze/full jobs stay pollable this many seconds; at most this many are tracked
+ANALYSIS_JOB_TTL = 600
+MAX_ANALYSIS_JOBS = 32
+
+def configure_logging():
+    """Route API logging through a queue so formatting and I/O happen off the request threads."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    logger.setLevel(LOG_LEVEL)
+    log_queue = queue.Queue()
+    for handler in [h for h in logger.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+def _restart_logging_in_child():
+    """The listener thread does not survive fork (gunicorn --preload), so start a fresh one."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener = None
+        configure_logging()
+
+os.register_at_fork(after_in_child=_restart_logging_in_child)
+
+# Live BatchPredictors, reset in forked children (their worker thread does not survive fork)
+_batch_predictors = weakref.WeakSet()
+
+def _reset_batch_predictors_in_child():
+    for predictor in list(_batch_predictors):
+        predictor._reset()
+
+os.register_at_fork(after_in_child=_reset_batch_predictors_in_child)
+
+def ojsonify(payload: Dict[str, Any], status: int = 200) -> Response:
+    """Build a JSON response with orjson, which encodes numpy/pandas values natively."""
+    return Response(json_utils.dumps(payload), status=status, mimetype='application/json')
+
+def err(message: str, exc: Exception, status: int = 500) -> Response:
+    """Build the standard error response; only the error text is encoded per call."""
+    body = b'{"success":false,"error":' + orjson.dumps(str(exc)) + b',"message":' + orjson.dumps(message) + b'}'
+    return Response(body, status=status, mimetype='application/json')
+
+def _request_json() -> Optional[Any]:
+    """Parse the request body with orjson; None when the body is empty."""
+    body = request.get_data()
+    return orjson.loads(body) if body else None
+
+class BatchPredictor:
+    """Coalesces concurrent single-task prediction requests into one model call.
+
+    Requests are queued; a background thread takes up to ``max_batch`` of them,
+    waiting at most ``max_wait`` seconds for the batch to fill, and hands each
+    caller its own result. If the batched call fails, the tasks are retried one
+    by one so a bad task only fails its own request.
+    
+    The worker thread starts on the first ``predict()``, and again in a forked
+    child (gunicorn --preload builds the app before forking its workers).
+    """
+    
+    def __init__(self, predict_many, max_batch: int = 64, max_wait: float = 0.005, timeout: float = 60.0):
+        self.predict_many = predict_many
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self._reset()
+        _batch_predictors.add(self)
+    
+    def _reset(self):
+        """Start over with an empty queue and no worker thread."""
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def _ensure_worker(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, args=(self._queue,), daemon=True)
+                    thread.start()
+                    self._thread = thread
+    
+    def predict(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue one task and block until its prediction is ready (at most ``timeout`` seconds)."""
+        if not isinstance(task_data, dict):
+            raise TypeError(f"Task data must be a JSON object, got {type(task_data).__name__}")
+        self._ensure_worker()
+        item = [task_data, threading.Event(), None]  # task, done, result
+        self._queue.put(item)
+        if not item[1].wait(self.timeout):
+            raise TimeoutError(f"Task prediction did not finish within {self.timeout} seconds")
+        if isinstance(item[2], Exception):
+            raise item[2]
+        return item[2]
+    
+    def _predict_batch(self, tasks: List[Dict[str, Any]]) -> List[Any]:
+        """One result (prediction or exception) per task; falls back to per-task calls if the batch fails."""
+        try:
+            results = self.predict_many(tasks)
+            if len(results) != len(tasks):
+                raise ValueError(f"Expected {len(tasks)} predictions, got {len(results)}")
+            return results
+        except Exception as e:
+            if len(tasks) == 1:
+                return [e]
+            logger.warning("Batched prediction of %d tasks failed (%s) - retrying one by one", len(tasks), e)
+            return [self._predict_batch([task])[0] for task in tasks]
+    
+    def _run(self, requests: queue.Queue):
+        while True:
+            batch = [requests.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                results = self._predict_batch([item[0] for item in batch])
+            except Exception:
+                logger.exception("Batched prediction failed")
+                results = []
+            
+            # Every waiting caller gets an answer, even if the results came up short
+            for i, item in enumerate(batch):
+                item[2] = results[i] if i < len(results) else RuntimeError("No prediction was produced for this task")
+                item[1].set()
 
 class PythonAnalysisAPI:
     def __init__(self, port: int = 5001):
         """Initialize the Python analysis API server."""
+        configure_logging()
         self.app = Flask(__name__)
         CORS(self.app)  # Enable CORS for communication with Node.js frontend
+        if COMPRESS_AVAILABLE:
+            # Analysis JSON compresses well; NDJSON streams are left uncompressed so lines flush immediately
+            self.app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+            self.app.config['COMPRESS_MIN_SIZE'] = 1024
+            self.app.config['COMPRESS_STREAMS'] = False
+            Compress(self.app)
         self.port = port
         self.analysis_runner = AnalysisRunner()
         self.last_analysis_results = None
+        self._latest_results_body = None  # Pre-serialized /results/latest response
+        self._results_lock = threading.Lock()
+        self._data_lock = threading.Lock()
+        self._train_lock = threading.Lock()
+        self._analysis_cache: Dict[tuple, tuple] = {}  # (name, arg, data_version) -> (timestamp, result)
+        self._cache_lock = threading.Lock()
+        self._jobs: Dict[str, list] = {}  # job_id -> [comprehensive analysis future, finished_at]
+        self._jobs_lock = threading.Lock()
+        self._job_executor = ThreadPoolExecutor(max_workers=2)
+        self._batch_predictor = BatchPredictor(
+            lambda tasks: self.analysis_runner.predictor.predict_task_delays(tasks)
+        )
         self.setup_routes()
         
+    def _run_full_analysis_job(self) -> Dict[str, Any]:
+        """Run the comprehensive analysis in a worker thread and publish it as the latest results."""
+        results = self.analysis_runner.run_comprehensive_analysis()
+        
+        # Serialize once here so polling /results/latest just returns the bytes
+        latest_body = json_utils.dumps({
+            "success": True,
+            "results": results,
+            "message": "Latest results retrieved"
+        })
+        with self._results_lock:
+            self.last_analysis_results = results
+            self._latest_results_body = latest_body
+        
+        return results
+    
+    def _stream_predictions(self):
+        """Yield predictions as NDJSON lines, then store them for the recommendations endpoint."""
+        predictions = []
+        for prediction in self.analysis_runner.iter_predictions():
+            predictions.append(prediction)
+            yield json_utils.dumps(prediction) + b'\n'
+        self.analysis_runner.set_predictions(predictions)
+    
+    def _ensure_data(self):
+        """Load data once, even when several requests arrive before it is ready."""
+        if not self.analysis_runner.data:
+            with self._data_lock:
+                if not self.analysis_runner.data:
+                    # Workers reuse the snapshot the server exported, if it is recent and complete
+                    self.analysis_runner.load_all_data(use_shared_snapshot=True)
+    
+    def _ensure_trained(self):
+        """Load data and train the models once, guarded against concurrent requests."""
+        if not self.analysis_runner.predictor.is_trained:
+            self._ensure_data()
+            with self._train_lock:
+                if not self.analysis_runner.predictor.is_trained and not self.analysis_runner.try_load_cached_models():
+                    self.analysis_runner.train_prediction_models()
+    
+    def _cached_analysis(self, name: str, arg: Optional[str], compute):
+        """Return a recent result for (name, arg) on the current data, computing it if needed."""
+        version = self.analysis_runner.data_version
+        key = (name, arg, version)
+        now = time.monotonic()
+        
+        with self._cache_lock:
+            cached = self._analysis_cache.get(key)
+        if cached and now - cached[0] < ANALYSIS_CACHE_TTL:
+            return cached[1]
+        
+        result = compute()
+        with self._cache_lock:
+            # Drop entries computed against older data
+            if any(k[2] != version for k in self._analysis_cache):
+                self._analysis_cache = {k: v for k, v in self._analysis_cache.items() if k[2] == version}
+            self._analysis_cache[key] = (now, result)
+        return result
+    
+    def _prune_jobs(self):
+        """Forget expired finished jobs, then the oldest finished ones beyond MAX_ANALYSIS_JOBS.
+        Callers hold _jobs_lock; running jobs are never dropped."""
+        now = time.monotonic()
+        finished = [job_id for job_id, (_, finished_at) in self._jobs.items() if finished_at is not None]
+        expired = [job_id for job_id in finished if now - self._jobs[job_id][1] > ANALYSIS_JOB_TTL]
+        excess = len(self._jobs) - len(expired) - MAX_ANALYSIS_JOBS
+        if excess > 0:
+            expired += [job_id for job_id in finished if job_id not in expired][:excess]
+        for job_id in expired:
+            del self._jobs[job_id]
+    
     def setup_routes(self):
         """Setup API routes for analysis functions."""
         
         @self.app.route('/health', methods=['GET'])
         def health_check():
             """Health check endpoint."""
-            return jsonify({"status": "healthy", "service": "python_analysis"})
+            return ojsonify({"status": "healthy", "service": "python_analysis"})
         
         @self.app.route('/analyze/full', methods=['GET', 'POST'])
         def run_full_analysis():
-            """Run comprehensive analysis and return results."""
+            """Start a comprehensive analysis job and return its id immediately."""
             try:
-                print("Starting comprehensive analysis...")
-                results = self.analysis_runner.run_comprehensive_analysis()
-                self.last_analysis_results = results
+                logger.info("Starting comprehensive analysis...")
+                job_id = uuid.uuid4().hex
+                future = self._job_executor.submit(self._run_full_analysis_job)
+                job = [future, None]
+                with self._jobs_lock:
+                    self._prune_jobs()
+                    self._jobs[job_id] = job
+                future.add_done_callback(lambda _: job.__setitem__(1, time.monotonic()))
+                
+                return ojsonify({
+                    "success": True,
+                    "job_id": job_id,
+                    "status_url": f"/analyze/full/status/{job_id}",
+                    "message": "Comprehensive analysis started"
+                }, 202)
                 
-                return jsonify({
+            except Exception as e:
+                logger.exception("Analysis failed")
+                return err("Analysis failed", e)
+        
+        @self.app.route('/analyze/full/status/<job_id>', methods=['GET'])
+        def get_full_analysis_status(job_id):
+            """Poll a comprehensive analysis job; a finished job is forgotten once its result is returned."""
+            with self._jobs_lock:
+                self._prune_jobs()
+                job = self._jobs.get(job_id)
+                if job is not None and job[0].done():
+                    del self._jobs[job_id]
+            
+            if job is None:
+                return ojsonify({
+                    "success": False,
+                    "message": f"Unknown analysis job: {job_id}"
+                }, 404)
+            
+            future = job[0]
+            if not future.done():
+                return ojsonify({
                     "success": True,
+                    "job_id": job_id,
+                    "status": "running",
+                    "message": "Comprehensive analysis in progress"
+                })
+            
+            try:
+                results = future.result()
+                return ojsonify({
+                    "success": True,
+                    "job_id": job_id,
+                    "status": "done",
                     "results": results,
                     "message": "Comprehensive analysis completed successfully"
                 })
                 
             except Exception as e:
-                print(f"Analysis error: {e}")
-                return jsonify({
+                logger.exception("Analysis error: %s", e)
+                return ojsonify({
                     "success": False,
+                    "job_id": job_id,
+                    "status": "failed",
                     "error": str(e),
                     "message": "Analysis failed"
-                }), 500
+                }, 500)
         
         @self.app.route('/analyze/predictions', methods=['GET', 'POST'])
         def get_predictions():
-            """Generate delay predictions for all tasks."""
+            """Generate delay predictions for all tasks.
+            
+            Clients sending ``Accept: application/x-ndjson`` get one prediction per
+            line, streamed as each batch of tasks is scored.
+            """
             try:
-                # Load data if not already loaded
-                if not self.analysis_runner.data:
-                    self.analysis_runner.load_all_data()
+                # Load data and train models if needed
+                self._ensure_trained()
                 
-                # Train models if not trained
-                if not self.analysis_runner.predictor.is_trained:
-                    self.analysis_runner.train_prediction_models()
+                if 'application/x-ndjson' in request.headers.get('Accept', ''):
+                    return Response(
+                        stream_with_context(self._stream_predictions()),
+                        mimetype='application/x-ndjson'
+                    )
                 
                 # Generate predictions
                 predictions = self.analysis_runner.generate_predictions_for_all_tasks()
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "predictions": predictions,
                     "total_predictions": len(predictions),
@@ -81,22 +388,20 @@ class PythonAnalysisAPI:
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Prediction generation failed"
-                }), 500
+                logger.exception("Prediction generation failed")
+                return err("Prediction generation failed", e)
         
         @self.app.route('/analyze/risk/<project_id>', methods=['GET'])
         def analyze_project_risk(project_id):
             """Analyze risk for a specific project."""
             try:
-                if not self.analysis_runner.data:
-                    self.analysis_runner.load_all_data()
+                self._ensure_data()
                 
-                risk_analysis = self.analysis_runner.analyze_project_risks(project_id)
+                risk_analysis = self._cached_analysis(
+                    'risk', project_id, lambda: self.analysis_runner.analyze_project_risks(project_id)
+                )
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "risk_analysis": risk_analysis,
                     "project_id": project_id,
@@ -104,55 +409,44 @@ class PythonAnalysisAPI:
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Risk analysis failed"
-                }), 500
+                logger.exception("Risk analysis failed")
+                return err("Risk analysis failed", e)
         
         @self.app.route('/analyze/risk', methods=['GET'])
         def analyze_all_projects_risk():
             """Analyze risk for all projects."""
             try:
-                if not self.analysis_runner.data:
-                    self.analysis_runner.load_all_data()
+                self._ensure_data()
                 
-                risk_analysis = self.analysis_runner.analyze_project_risks()
+                risk_analysis = self._cached_analysis('risk', None, self.analysis_runner.analyze_project_risks)
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "risk_analysis": risk_analysis,
                     "message": "Overall risk analysis completed"
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Risk analysis failed"
-                }), 500
+                logger.exception("Risk analysis failed")
+                return err("Risk analysis failed", e)
         
         @self.app.route('/analyze/trends', methods=['GET'])
         def get_delay_trends():
             """Get delay trends analysis."""
             try:
-                if not self.analysis_runner.data:
-                    self.analysis_runner.load_all_data()
+                self._ensure_data()
                 
-                trends = self.analysis_runner.get_delay_trends()
+                trends = self._cached_analysis('trends', None, self.analysis_runner.get_delay_trends)
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "trends": trends,
                     "message": "Trend analysis completed"
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Trend analysis failed"
-                }), 500
+                logger.exception("Trend analysis failed")
+                return err("Trend analysis failed", e)
         
         @self.app.route('/analyze/recommendations', methods=['GET'])
         def get_recommendations():
@@ -160,7 +454,7 @@ class PythonAnalysisAPI:
             try:
                 recommendations = self.analysis_runner.get_high_risk_recommendations()
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "recommendations": recommendations,
                     "total_high_risk": len(recommendations),
@@ -168,144 +462,166 @@ class PythonAnalysisAPI:
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Recommendation generation failed"
-                }), 500
+                logger.exception("Recommendation generation failed")
+                return err("Recommendation generation failed", e)
         
         @self.app.route('/analyze/predict_task', methods=['POST'])
+        @self.app.route('/analyze/predict_tasks', methods=['POST'])
         def predict_single_task():
-            """Predict delay for a single task."""
+            """Predict delay for a single task, or for a list of tasks in one model call."""
             try:
-                task_data = request.get_json()
+                task_data = _request_json()
                 
                 if not task_data:
-                    return jsonify({
+                    return ojsonify({
                         "success": False,
                         "error": "No task data provided",
                         "message": "Task data is required"
-                    }), 400
+                    }, 400)
+                
+                if isinstance(task_data, list) and not all(isinstance(task, dict) for task in task_data):
+                    return ojsonify({
+                        "success": False,
+                        "error": "Every task must be a JSON object",
+                        "message": "Task data must be a list of task objects"
+                    }, 400)
+                
+                # Only objects reach the batcher, so one malformed body cannot fail other requests
+                if not isinstance(task_data, (dict, list)):
+                    return ojsonify({
+                        "success": False,
+                        "error": "Task data must be a JSON object",
+                        "message": "Task data is required"
+                    }, 400)
                 
                 # Ensure models are trained
-                if not self.analysis_runner.predictor.is_trained:
-                    if not self.analysis_runner.data:
-                        self.analysis_runner.load_all_data()
-                    self.analysis_runner.train_prediction_models()
+                self._ensure_trained()
                 
-                prediction = self.analysis_runner.predictor.predict_task_delay(task_data)
+                if isinstance(task_data, list):
+                    predictions = self.analysis_runner.predictor.predict_task_delays(task_data)
+                    return ojsonify({
+                        "success": True,
+                        "predictions": predictions,
+                        "count": len(predictions),
+                        "message": "Task predictions completed"
+                    })
                 
-                return jsonify({
+                # Single tasks from concurrent requests are micro-batched together
+                prediction = self._batch_predictor.predict(task_data)
+                
+                return ojsonify({
                     "success": True,
                     "prediction": prediction,
                     "message": "Task prediction completed"
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Task prediction failed"
-                }), 500
+                logger.exception("Task prediction failed")
+                return err("Task prediction failed", e)
         
         @self.app.route('/analyze/charts', methods=['POST'])
         def generate_charts():
             """Generate visualization charts."""
             try:
-                save_charts = request.get_json().get('save_charts', True) if request.get_json() else True
+                payload = _request_json()
+                save_charts = payload.get('save_charts', True) if payload else True
                 
-                if not self.analysis_runner.data:
-                    self.analysis_runner.load_all_data()
+                self._ensure_data()
                 
                 charts = self.analysis_runner.generate_visualizations(save_charts=save_charts)
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "charts": charts,
                     "message": f"Generated {len(charts)} visualization charts"
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Chart generation failed"
-                }), 500
+                logger.exception("Chart generation failed")
+                return err("Chart generation failed", e)
         
         @self.app.route('/data/summary', methods=['GET'])
         def get_data_summary():
             """Get summary of loaded data."""
             try:
-                if not self.analysis_runner.data:
-                    self.analysis_runner.load_all_data()
-                
-                summary = {}
-                for key, df in self.analysis_runner.data.items():
-                    summary[key] = {
-                        "count": len(df),
-                        "columns": df.columns.tolist() if hasattr(df, 'columns') else []
-                    }
+                self._ensure_data()
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
-                    "data_summary": summary,
+                    "data_summary": self.analysis_runner.data_summary,
                     "message": "Data summary retrieved"
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Failed to get data summary"
-                }), 500
+                logger.exception("Failed to get data summary")
+                return err("Failed to get data summary", e)
         
         @self.app.route('/models/train', methods=['POST'])
         def train_models():
             """Train prediction models."""
             try:
-                if not self.analysis_runner.data:
-                    self.analysis_runner.load_all_data()
+                self._ensure_data()
                 
-                training_results = self.analysis_runner.train_prediction_models()
+                with self._train_lock:
+                    training_results = self.analysis_runner.train_prediction_models()
                 
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "training_results": training_results,
                     "message": "Model training completed"
                 })
                 
             except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e),
-                    "message": "Model training failed"
-                }), 500
+                logger.exception("Model training failed")
+                return err("Model training failed", e)
         
         @self.app.route('/results/latest', methods=['GET'])
         def get_latest_results():
             """Get the latest analysis results."""
-            if self.last_analysis_results:
-                return jsonify({
-                    "success": True,
-                    "results": self.last_analysis_results,
-                    "message": "Latest results retrieved"
-                })
+            with self._results_lock:
+                latest_body = self._latest_results_body
+            
+            if latest_body is not None:
+                return Response(latest_body, mimetype='application/json')
             else:
-                return jsonify({
+                return ojsonify({
                     "success": False,
                     "message": "No analysis results available. Run analysis first."
-                }), 404
+                }, 404)
+    
+    def warm_up(self, use_shared_snapshot: bool = False):
+        """Load data and load (or train) models up front so the first requests are fast.
+        Worker processes pass use_shared_snapshot to read the data their parent published."""
+        logger.info("Running initial data load and model training...")
+        try:
+            self.analysis_runner.load_all_data(use_shared_snapshot=use_shared_snapshot)
+            if not self.analysis_runner.try_load_cached_models():
+                self.analysis_runner.train_prediction_models()
+            logger.info("Initial setup completed successfully!")
+        except Exception as e:
+            logger.exception("Initial setup failed: %s", e)
+            logger.warning("API will still start, but models will be trained on first request.")
     
     def run_server(self, debug: bool = False):
-        """Run the Flask API server."""
-        print(f"Starting Python Analysis API server on port {self.port}...")
-        self.app.run(host='0.0.0.0', port=self.port, debug=debug, threaded=True)
+        """Run the API server, preferring waitress over the Flask development server."""
+        logger.info("Starting Python Analysis API server on port %d...", self.port)
+        if not debug:
+            try:
+                from waitress import serve
+                serve(self.app, host='0.0.0.0', port=self.port, threads=8)
+                return
+            except ImportError:
+                logger.warning("waitress not available - falling back to the Flask development server")
+        # HTTP/1.1 lets the dev server keep loopback connections alive; the
+        # reloader would import the whole analysis stack a second time
+        WSGIRequestHandler.protocol_version = 'HTTP/1.1'
+        self.app.run(host='0.0.0.0', port=self.port, debug=debug, threaded=True, use_reloader=False)
     
     def run_in_background(self):
         """Run the API server in a background thread."""
         server_thread = threading.Thread(target=self.run_server, daemon=True)
         server_thread.start()
-        print(f"Python Analysis API running in background on port {self.port}")
+        logger.info("Python Analysis API running in background on port %d", self.port)
         return server_thread
 
 class NodeJSIntegration:
@@ -318,10 +634,42 @@ class NodeJSIntegration:
 // Python Analysis Integration Routes
 // Add these routes to your Node.js server/routes.ts file
 
+import http from "http";
+
+// Keep-alive socket pool for the loopback hop to the Python service; Node's
+// built-in fetch ignores the agent option, so requests go through http.request
+const pyAgent = new http.Agent({ keepAlive: true, maxSockets: 32 });
+
+function pyFetch(
+  path: string,
+  init: { method?: string; headers?: Record<string, string>; body?: string } = {}
+): Promise<{ status: number; json: () => any }> {
+  return new Promise((resolve, reject) => {
+    const headers: Record<string, string | number> = { ...init.headers };
+    if (init.body) headers["Content-Length"] = Buffer.byteLength(init.body);
+    
+    const pyReq = http.request(
+      { host: "localhost", port: 5001, path, method: init.method || "GET", headers, agent: pyAgent },
+      (pyRes) => {
+        const chunks: Buffer[] = [];
+        pyRes.on("data", (chunk) => chunks.push(chunk));
+        pyRes.on("end", () => {
+          const text = Buffer.concat(chunks).toString("utf8");
+          resolve({ status: pyRes.statusCode || 500, json: () => JSON.parse(text) });
+        });
+        pyRes.on("error", reject);
+      }
+    );
+    pyReq.on("error", reject);
+    if (init.body) pyReq.write(init.body);
+    pyReq.end();
+  });
+}
+
 // Delay prediction and analysis routes
 app.get("/api/analysis/health", async (req, res) => {
   try {
-    const response = await fetch("http://localhost:5001/health");
+    const response = await pyFetch("/health");
     const data = await response.json();
     res.json(data);
   } catch (error) {
@@ -331,20 +679,30 @@ app.get("/api/analysis/health", async (req, res) => {
 
 app.post("/api/analysis/full", authenticateToken, async (req: any, res) => {
   try {
-    const response = await fetch("http://localhost:5001/analyze/full", {
+    const response = await pyFetch("/analyze/full", {
       method: "POST",
       headers: { "Content-Type": "application/json" }
     });
     const data = await response.json();
-    res.json(data);
+    res.status(response.status).json(data);
   } catch (error) {
     res.status(500).json({ error: "Analysis failed" });
   }
 });
 
+app.get("/api/analysis/full/status/:jobId", authenticateToken, async (req: any, res) => {
+  try {
+    const response = await pyFetch(`/analyze/full/status/${req.params.jobId}`);
+    const data = await response.json();
+    res.status(response.status).json(data);
+  } catch (error) {
+    res.status(500).json({ error: "Analysis status unavailable" });
+  }
+});
+
 app.post("/api/analysis/predictions", authenticateToken, async (req: any, res) => {
   try {
-    const response = await fetch("http://localhost:5001/analyze/predictions", {
+    const response = await pyFetch("/analyze/predictions", {
       method: "POST",
       headers: { "Content-Type": "application/json" }
     });
@@ -359,10 +717,10 @@ app.get("/api/analysis/risk/:projectId?", authenticateToken, async (req: any, re
   try {
     const projectId = req.params.projectId;
     const url = projectId 
-      ? `http://localhost:5001/analyze/risk/${projectId}`
-      : "http://localhost:5001/analyze/risk";
+      ? `/analyze/risk/${projectId}`
+      : "/analyze/risk";
     
-    const response = await fetch(url);
+    const response = await pyFetch(url);
     const data = await response.json();
     res.json(data);
   } catch (error) {
@@ -372,7 +730,7 @@ app.get("/api/analysis/risk/:projectId?", authenticateToken, async (req: any, re
 
 app.get("/api/analysis/trends", authenticateToken, async (req: any, res) => {
   try {
-    const response = await fetch("http://localhost:5001/analyze/trends");
+    const response = await pyFetch("/analyze/trends");
     const data = await response.json();
     res.json(data);
   } catch (error) {
@@ -382,7 +740,7 @@ app.get("/api/analysis/trends", authenticateToken, async (req: any, res) => {
 
 app.get("/api/analysis/recommendations", authenticateToken, async (req: any, res) => {
   try {
-    const response = await fetch("http://localhost:5001/analyze/recommendations");
+    const response = await pyFetch("/analyze/recommendations");
     const data = await response.json();
     res.json(data);
   } catch (error) {
@@ -392,7 +750,7 @@ app.get("/api/analysis/recommendations", authenticateToken, async (req: any, res
 
 app.post("/api/analysis/predict-task", authenticateToken, async (req: any, res) => {
   try {
-    const response = await fetch("http://localhost:5001/analyze/predict_task", {
+    const response = await pyFetch("/analyze/predict_task", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(req.body)
@@ -406,7 +764,7 @@ app.post("/api/analysis/predict-task", authenticateToken, async (req: any, res)
 
 app.post("/api/analysis/charts", authenticateToken, async (req: any, res) => {
   try {
-    const response = await fetch("http://localhost:5001/analyze/charts", {
+    const response = await pyFetch("/analyze/charts", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(req.body)
@@ -422,7 +780,58 @@ app.post("/api/analysis/charts", authenticateToken, async (req: any, res) => {
     
     @staticmethod
     def run_python_analysis_script(script_path: str, args: List[str] = None) -> Dict[str, Any]:
-        """Run a Python analysis script and return results."""
+        """Run a Python analysis script and return results.
+        
+        Scripts in this package that define main() are imported and run in-process,
+        skipping interpreter start-up and the numpy/pandas import cost; anything
+        else is run in a subprocess.
+        """
+        module = NodeJSIntegration._import_package_script(script_path)
+        if module is None:
+            return NodeJSIntegration._run_script_subprocess(script_path, args)
+        
+        stdout, stderr = io.StringIO(), io.StringIO()
+        return_code = 0
+        
+        # stdout redirection and sys.argv are process-wide, so run one script at a time
+        with _script_lock:
+            saved_argv = sys.argv
+            sys.argv = [script_path] + list(args or [])
+            try:
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    module.main()
+            except SystemExit as e:
+                return_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                stderr.write(f"{type(e).__name__}: {e}\n")
+                return_code = 1
+            finally:
+                sys.argv = saved_argv
+        
+        return {
+            "success": return_code == 0,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "return_code": return_code
+        }
+    
+    @staticmethod
+    def _import_package_script(script_path: str):
+        """Import a script from this package if it exposes main(); None otherwise."""
+        path = os.path.abspath(script_path)
+        if os.path.dirname(path) != os.path.dirname(os.path.abspath(__file__)) or not path.endswith('.py'):
+            return None
+        
+        try:
+            # importlib caches modules in sys.modules, so repeat calls skip the import
+            module = importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+        except Exception:
+            return None
+        return module if callable(getattr(module, 'main', None)) else None
+    
+    @staticmethod
+    def _run_script_subprocess(script_path: str, args: List[str] = None) -> Dict[str, Any]:
+        """Run a script in a separate Python interpreter."""
         try:
             cmd = [sys.executable, script_path]
             if args:
@@ -454,19 +863,81 @@ app.post("/api/analysis/charts", authenticateToken, async (req: any, res) => {
                 "error": str(e)
             }
 
+def create_app() -> Flask:
+    """Application factory for WSGI servers, e.g. gunicorn 'api_integration:create_app()'."""
+    api = PythonAnalysisAPI()
+    api.warm_up(use_shared_snapshot=True)
+    return api.app
+
+def publish_startup_state():
+    """Load the data and models once, before any worker process starts.
+
+    The data is exported as the shared snapshot and the models are saved as the
+    model artifact (training them if no valid artifact exists), so each worker's
+    warm-up reads both instead of querying the database and retraining.
+    """
+    runner = AnalysisRunner()
+    if runner.load_all_data():
+        runner.export_shared_data()
+        if not runner.try_load_cached_models():
+            runner.train_prediction_models()
+
+def run_gunicorn(port: int = 5001):
+    """Replace the current process with a multi-worker gunicorn server.
+
+    --preload builds the app (data + trained models) once in the master so
+    forked workers share it instead of each retraining.
+    """
+    workers = os.cpu_count() or 1
+    os.execvp('gunicorn', [
+        'gunicorn',
+        '--chdir', os.path.dirname(os.path.abspath(__file__)),
+        '-w', str(workers),
+        '-k', 'gthread',
+        '--threads', '4',
+        '--preload',
+        '-b', f'0.0.0.0:{port}',
+        'api_integration:create_app()'
+    ])
+
+def create_asgi_app():
+    """ASGI factory for uvicorn; the Flask app runs in asgiref's WSGI thread pool."""
+    from asgiref.wsgi import WsgiToAsgi
+    return WsgiToAsgi(create_app())
+
+def run_uvicorn(port: int = 5001):
+    """Replace the current process with uvicorn workers on uvloop/httptools.
+
+    Each worker builds its own app. publish_startup_state runs first in this
+    process, so workers warm up from the shared data snapshot and the saved
+    model artifact. A worker queries and trains for itself only when either is
+    missing or older than its max age.
+    """
+    workers = os.cpu_count() or 1
+    publish_startup_state()
+    os.execvp('uvicorn', [
+        'uvicorn',
+        '--app-dir', os.path.dirname(os.path.abspath(__file__)),
+        '--factory',
+        '--loop', 'uvloop',
+        '--http', 'httptools',
+        '--workers', str(workers),
+        '--host', '0.0.0.0',
+        '--port', str(port),
+        'api_integration:create_asgi_app'
+    ])
+
 def main():
     """Main entry point to run the Python Analysis API server."""
+    if os.getenv('USE_GUNICORN'):
+        run_gunicorn()
+    if os.getenv('USE_UVICORN'):
+        run_uvicorn()
+    
     api = PythonAnalysisAPI()
     
     # Optional: Run initial analysis
-    print("Running initial data load and model training...")
-    try:
-        api.analysis_runner.load_all_data()
-        api.analysis_runner.train_prediction_models()
-        print("Initial setup completed successfully!")
-    except Exception as e:
-        print(f"Initial setup failed: {e}")
-        print("API will still start, but models will be trained on first request.")
+    api.warm_up()
     
     # Start the server
     api.run_server(debug=False)
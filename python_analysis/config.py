@@ -3,6 +3,7 @@ Configuration module for Python data analysis components.
 Contains environment variables and database configuration.
 """
 
+import hashlib
 import os
 from dotenv import load_dotenv
 
@@ -16,6 +17,34 @@ DATABASE_PORT = os.getenv('PGPORT', '5432')
 DATABASE_NAME = os.getenv('PGDATABASE', 'smartprojectpulse')
 DATABASE_USER = os.getenv('PGUSER', 'postgres')
 DATABASE_PASSWORD = os.getenv('PGPASSWORD', '')
+DATABASE_FETCH_CHUNK_SIZE = int(os.getenv('ANALYSIS_DB_FETCH_CHUNK_SIZE', '50000'))  # rows per server-side cursor fetch
+
+# SQLAlchemy connection pool
+DATABASE_POOL_SIZE = int(os.getenv('ANALYSIS_DB_POOL_SIZE', '10'))
+DATABASE_MAX_OVERFLOW = int(os.getenv('ANALYSIS_DB_MAX_OVERFLOW', '20'))
+DATABASE_POOL_TIMEOUT = int(os.getenv('ANALYSIS_DB_POOL_TIMEOUT', '30'))  # seconds
+DATABASE_POOL_RECYCLE = int(os.getenv('ANALYSIS_DB_POOL_RECYCLE', '3600'))  # seconds
+
+# Processed tables are reused while the table's write counters are unchanged, up to this age
+# (the derived day counts are relative to the load time)
+DATA_CACHE_MAX_AGE = int(os.getenv('ANALYSIS_DATA_CACHE_MAX_AGE', '300'))  # seconds
+
+# Shared Arrow snapshot of the loaded data, memory-mapped by API worker processes
+SHARED_DATA_DIR = os.getenv('ANALYSIS_SHARED_DATA_DIR', '/dev/shm/smart_project_pulse' if os.path.isdir('/dev/shm') else os.path.join(os.getenv('TMPDIR', '/tmp'), 'smart_project_pulse'))
+SHARED_DATA_MAX_AGE = int(os.getenv('ANALYSIS_SHARED_DATA_MAX_AGE', '300'))  # seconds
+# Subdirectory per app checkout and database, so deployments sharing SHARED_DATA_DIR never read each other's data
+SHARED_DATA_NAMESPACE = os.getenv('ANALYSIS_SHARED_DATA_NAMESPACE') or hashlib.sha1(
+    f"{os.path.dirname(os.path.abspath(__file__))}|{DATABASE_URL}|{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}".encode()
+).hexdigest()[:16]
+
+# Fitted models persisted by the analysis runner and reused on restart while fresh
+MODEL_ARTIFACT_MAX_AGE = int(os.getenv('ANALYSIS_MODEL_ARTIFACT_MAX_AGE', '86400'))  # seconds
+
+# On-disk memo of fitted models, trimmed (least recently used first) after each fit
+MODEL_CACHE_MAX_BYTES = int(os.getenv('ANALYSIS_MODEL_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+
+# API log level (DEBUG, INFO, WARNING, ...)
+LOG_LEVEL = os.getenv('ANALYSIS_LOG_LEVEL', 'INFO').upper()
 
 # Enhanced Analysis configuration
 PREDICTION_FEATURES = [
@@ -79,6 +108,24 @@ NLP_FEATURES = {
     ]
 }
 
+# Precompiled keyword lookups built from NLP_FEATURES
+NLP_KEYWORD_SETS = {category: frozenset(keywords) for category, keywords in NLP_FEATURES.items()}
+
+try:
+    import ahocorasick
+    
+    # One automaton over every keyword list; each word maps to the categories it belongs to
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    _keyword_categories = {}
+    for _category, _keywords in NLP_FEATURES.items():
+        for _keyword in _keywords:
+            _keyword_categories.setdefault(_keyword, []).append(_category)
+    for _keyword, _categories in _keyword_categories.items():
+        KEYWORD_AUTOMATON.add_word(_keyword, (_keyword, tuple(_categories)))
+    KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    KEYWORD_AUTOMATON = None
+
 DELAY_THRESHOLDS = {
     'minor': 1,      # 1 day delay
     'major': 3,      # 3 days delay
@@ -88,8 +135,8 @@ DELAY_THRESHOLDS = {
 # Enhanced Model configuration
 MODEL_CONFIG = {
     'random_forest': {
-        'n_estimators': 500,
-        'max_depth': 20,
+        'n_estimators': 200,
+        'max_depth': 12,
         'min_samples_split': 2,
         'min_samples_leaf': 1,
         'max_features': 'sqrt',
@@ -97,13 +144,12 @@ MODEL_CONFIG = {
         'random_state': 42,
         'n_jobs': -1
     },
-    'gradient_boosting': {
-        'n_estimators': 300,
+    'hist_gradient_boosting': {
+        'max_iter': 400,
         'learning_rate': 0.1,
         'max_depth': 8,
-        'min_samples_split': 2,
         'min_samples_leaf': 1,
-        'subsample': 0.8,
+        'early_stopping': True,
         'random_state': 42
     },
     'xgboost': {
@@ -117,7 +163,7 @@ MODEL_CONFIG = {
     },
     'ensemble': {
         'voting': 'soft',
-        'weights': [3, 2, 3],  # rf, gb, xgb
+        'weights': [3, 2, 3],  # rf, hist gb, xgb
         'n_jobs': -1
     }
 }
@@ -6,29 +6,137 @@ Integrates with Hugging Face NLP Analysis for comprehensive reporting
 
 import pandas as pd
 import numpy as np
-import json
-from datetime import datetime, timedelta
+from datetime import datetime
+from dateutil import tz
 from pathlib import Path
+from collections import Counter, defaultdict
+from bisect import bisect_left, bisect_right
 import csv
-from huggingface_analyzer import HuggingFaceProjectAnalyzer
+import os
+import re
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from jit_kernels import workload_balance_score, estimation_accuracy_counts
+
+PRIORITY_NUMERIC = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+STATUS_NUMERIC = {'todo': 1, 'in_progress': 2, 'review': 3, 'completed': 4, 'delayed': 5}
+
+# Task health score adjustment per status
+TASK_STATUS_HEALTH = {'completed': 30, 'in_progress': 10, 'todo': 0, 'delayed': -30}
+
+# Delay severity and recommended action per NLP delay category
+DELAY_CATEGORY_SEVERITY = {
+    'technical_complexity': 'high',
+    'dependency_issues': 'high',
+    'requirement_changes': 'medium',
+    'resource_constraints': 'medium'
+}
+DELAY_CATEGORY_ACTIONS = {
+    'technical_complexity': 'allocate_senior_resources',
+    'requirement_changes': 'clarify_requirements',
+    'resource_constraints': 'reallocate_resources',
+    'dependency_issues': 'resolve_blockers',
+    'compliance_requirements': 'engage_compliance_team'
+}
+
+def _task_stats(tasks):
+    """Status counts and estimated/actual hour totals for a task list, in one pass"""
+    status_counts = Counter()
+    total_estimated = total_actual = 0
+    for task in tasks:
+        status_counts[task.get('status')] += 1
+        total_estimated += task.get('estimatedHours', 0) or 0
+        total_actual += task.get('actualHours', 0) or 0
+    return status_counts, total_estimated, total_actual
+
+# Description keywords that mark a task as technically risky
+TECHNICAL_RISK_PATTERN = re.compile(r'integration|architecture|complex|migration', re.IGNORECASE)
+
+# Trailing 'Z' or +hh:mm offset of an ISO timestamp (or of str() of an aware datetime)
+UTC_OFFSET_PATTERN = re.compile(r'(?:Z|[+-]\d{2}:?\d{2})$')
+
+# Alert message keywords for the impact scope, checked in order
+PROJECT_WIDE_ALERT_PATTERN = re.compile(r'project|blocking', re.IGNORECASE)
+TASK_LEVEL_ALERT_PATTERN = re.compile(r'task', re.IGNORECASE)
+
+# Risk score band edges (a score at an edge belongs to the band above it) and the
+# label each risk-report column uses for the bands low / medium / high / critical
+RISK_SCORE_BANDS = [30, 50, 70]
+RISK_LEVEL_LABELS = ('low', 'medium', 'high', 'critical')
+MITIGATION_PRIORITY_LABELS = ('low', 'medium', 'high', 'immediate')
+MITIGATION_ACTION_LABELS = (
+    'continue_monitoring',
+    'increased_monitoring, process_improvement',
+    'additional_resources_needed, timeline_adjustment',
+    'immediate_review_required, escalate_to_management'
+)
+MONITORING_FREQUENCY_LABELS = ('monthly', 'bi_weekly', 'weekly', 'daily')
+POTENTIAL_IMPACT_LABELS = ('minimal_impact', 'minor_delays', 'significant_delays', 'project_failure')
+
+# Rows buffered per write, so only one chunk of a report is held at a time
+CSV_CHUNK_SIZE = 10_000
+
+REPORT_NAMES = [
+    'project_summary', 'task_analysis', 'team_performance',
+    'delay_analysis', 'risk_assessment', 'executive_dashboard'
+]
+
+# Low-cardinality label columns of the DataFrame reports, stored as pandas categoricals
+REPORT_CATEGORY_COLUMNS = [
+    'Status', 'Priority', 'Risk_Level', 'Sentiment_Label', 'Complexity_Level',
+    'Estimation_Category', 'Delay_Category', 'Root_Cause'
+]
+
+# Delay report rows mix delayed-task and open-alert records, so its header is the union of both
+DELAY_REPORT_COLUMNS = [
+    'Task_ID', 'Task_Title', 'Project_ID', 'Assignee_ID', 'Priority', 'Domain',
+    'Estimated_Hours', 'Actual_Hours', 'Hours_Overrun', 'Overrun_Percentage',
+    'Due_Date', 'Days_Overdue', 'Delay_Reason', 'Delay_Category', 'Root_Cause_Type',
+    'Preventability_Score', 'Preventability_Category', 'Impact_on_Project',
+    'Dependency_Count', 'Blocks_Other_Tasks', 'Cost_Impact_Hours', 'Severity_Level',
+    'Recommended_Action', 'Lessons_Learned', 'Generated_Timestamp', 'Alert_ID',
+    'Alert_Type', 'Alert_Title', 'Alert_Message', 'Is_Resolved', 'Notification_Sent',
+    'Alert_Urgency', 'Impact_Scope'
+]
 
 
 class EnhancedCSVReportGenerator:
     """Generate structured, professional CSV reports with NLP insights"""
     
     def __init__(self):
-        self.nlp_analyzer = HuggingFaceProjectAnalyzer()
+        self.nlp_analyzer = None  # created on first report run; importing it loads spaCy/NLTK/matplotlib
         self.insights = None
         self.dataframes = None
+        self._sentiment_by_project = {}
+        self._complexity_by_task = {}
+        self._delay_by_task = {}
+        self._team_skills_by_team = {}
+        self._tasks_by_project = {}
+        self._tasks_by_assignee = {}
+        self._tasks_by_team = {}
+        self._user_by_id = {}
+        self._members_set_by_team = {}
+        self._dependents_by_task = {}
+        self._days_overdue_by_task = {}
+        self._task_totals = None
+        self._tasks = []
+        self._projects = []
+        self._teams = []
+        self._alerts = []
+        self.tasks_df = None
+        self.projects_df = None
+        self._project_metrics = None
+        self._now = None
+        self._now_iso = None
+        self._now_ts = None
         self.results_dir = Path(__file__).parent / 'results'
         self.results_dir.mkdir(exist_ok=True)
         
     def generate_comprehensive_reports(self):
-        """Generate all comprehensive CSV reports"""
+        """Generate all comprehensive CSV reports; returns them as a dict of DataFrames"""
         print("Generating comprehensive CSV reports with NLP analysis...")
-        
-        # Run NLP analysis first
-        self.insights, self.dataframes = self.nlp_analyzer.generate_insights_report()
+        self._prepare_report_run()
         
         # Generate individual reports
         reports = {}
@@ -44,154 +152,360 @@ class EnhancedCSVReportGenerator:
         
         return reports
     
-    def generate_project_summary_report(self):
-        """Generate comprehensive project summary CSV"""
-        projects_data = []
+    def write_comprehensive_reports(self):
+        """Generate all comprehensive CSV reports straight to disk, streaming the row-based
+        reports instead of building DataFrames for them.
+        Returns {report name: {'file', 'rows', 'columns'}} for the reports that had rows."""
+        print("Generating comprehensive CSV reports with NLP analysis...")
+        self._prepare_report_run()
         
-        for project in self.nlp_analyzer.data['projects']:
-            # Get project tasks
-            project_tasks = [t for t in self.nlp_analyzer.data['tasks'] 
-                           if t.get('projectId') == project['id']]
-            
-            # Calculate metrics
-            total_estimated_hours = sum(t.get('estimatedHours', 0) for t in project_tasks)
-            total_actual_hours = sum(t.get('actualHours', 0) for t in project_tasks if t.get('actualHours'))
-            completed_tasks = len([t for t in project_tasks if t.get('status') == 'completed'])
-            delayed_tasks = len([t for t in project_tasks if t.get('status') == 'delayed'])
-            
-            # Get NLP insights for this project
-            sentiment_data = None
-            if not self.dataframes['sentiment_analysis'].empty:
-                sentiment_row = self.dataframes['sentiment_analysis'][
-                    self.dataframes['sentiment_analysis']['project_id'] == project['id']
-                ]
-                if not sentiment_row.empty:
-                    sentiment_data = sentiment_row.iloc[0]
-            
-            project_row = {
-                'Project_ID': project['id'],
-                'Project_Name': project['name'],
-                'Description': project['description'],
-                'Status': project['status'],
-                'Progress_Percentage': project.get('progress', 0),
-                'Total_Tasks': len(project_tasks),
-                'Completed_Tasks': completed_tasks,
-                'Delayed_Tasks': delayed_tasks,
-                'Task_Completion_Rate': (completed_tasks / len(project_tasks) * 100) if project_tasks else 0,
-                'Delay_Rate': (delayed_tasks / len(project_tasks) * 100) if project_tasks else 0,
-                'Total_Estimated_Hours': total_estimated_hours,
-                'Total_Actual_Hours': total_actual_hours,
-                'Estimation_Accuracy': (total_actual_hours / total_estimated_hours) if total_estimated_hours > 0 else 1.0,
-                'Budget_Variance_Percentage': ((total_actual_hours - total_estimated_hours) / total_estimated_hours * 100) if total_estimated_hours > 0 else 0,
-                'Domains': ', '.join(project.get('domains', [])),
-                'Domain_Count': len(project.get('domains', [])),
-                'Team_ID': project.get('teamId', ''),
-                'Manager_ID': project.get('managerId', ''),
-                'Risk_Level': self.assess_project_risk_level(project, project_tasks),
-                'Sentiment_Score': sentiment_data['sentiment_score'] if sentiment_data is not None else 0,
-                'Sentiment_Label': sentiment_data['sentiment_label'] if sentiment_data is not None else 'neutral',
-                'Risk_Keywords_Count': len(sentiment_data['risk_keywords']) if sentiment_data is not None else 0,
-                'Complexity_Level': sentiment_data['complexity_level'] if sentiment_data is not None else 'medium',
-                'Start_Date': project.get('startDate', ''),
-                'End_Date': project.get('endDate', ''),
-                'Days_Duration': self.calculate_project_duration(project),
-                'Days_Remaining': self.calculate_days_remaining(project),
-                'Overall_Health_Score': self.calculate_health_score(project, project_tasks, sentiment_data),
-                'Generated_Timestamp': datetime.now().isoformat()
-            }
-            
-            projects_data.append(project_row)
+        # Row generators stay lazy until saved
+        reports = {}
+        reports['project_summary'] = self.generate_project_summary_report()
+        reports['task_analysis'] = self.generate_task_analysis_report()
+        reports['team_performance'] = self._team_performance_rows()
+        reports['delay_analysis'] = self._delay_analysis_rows()
+        reports['risk_assessment'] = self._risk_assessment_rows()
+        reports['executive_dashboard'] = self.generate_executive_dashboard()
         
-        return pd.DataFrame(projects_data)
+        # The row generators are consumed as they are written
+        return self._save_reports(reports)
+    
+    def _prepare_report_run(self):
+        """Run the NLP analysis and build the lookups, indexes and timestamps every report shares"""
+        # Run NLP analysis first
+        if self.nlp_analyzer is None:
+            from huggingface_analyzer import HuggingFaceProjectAnalyzer
+            self.nlp_analyzer = HuggingFaceProjectAnalyzer()
+        self.insights, self.dataframes = self.nlp_analyzer.generate_insights_report()
+        self._materialize()
+        self._build_nlp_lookups()
+        self._build_task_indexes()
+        self._task_totals = _task_stats(self._tasks)  # (status counts, estimated, actual) over all tasks
+        
+        # One report-run timestamp shared by every generated row
+        self._now = datetime.now()
+        self._now_iso = self._now.isoformat()
+        self._now_ts = pd.Timestamp(self._now)  # naive local, like the parsed date columns
+        self._days_overdue_by_task = self._build_days_overdue()
+        self._project_metrics = self._build_project_metrics()
+    
+    def _materialize(self):
+        """Bind the loaded record lists and build the task and project DataFrames once
+        for the column-based reports to share"""
+        data = self.nlp_analyzer.data
+        self._tasks = data['tasks']
+        self._projects = data['projects']
+        self._teams = data['teams']
+        self._alerts = data['delayAlerts']
+        self.tasks_df = pd.DataFrame(self._tasks)
+        self.projects_df = pd.DataFrame(self._projects)
+    
+    def _build_nlp_lookups(self):
+        """Index the NLP result rows by entity id for O(1) lookups in the report loops"""
+        self._sentiment_by_project = self._index_records('sentiment_analysis', 'project_id')
+        self._complexity_by_task = self._index_records('task_complexity', 'task_id')
+        self._delay_by_task = self._index_records('delay_patterns', 'task_id')
+        self._team_skills_by_team = self._index_records('team_skills', 'team_id')
+    
+    def _build_task_indexes(self):
+        """Group tasks by project, assignee and team in one pass over the task list"""
+        data = self.nlp_analyzer.data
+        self._user_by_id = {u.get('id'): u for u in data['users']}
+        self._members_set_by_team = {t['id']: set(t.get('memberIds', [])) for t in self._teams}
+        
+        # Teams each known user belongs to, so a task can be routed to its teams directly
+        teams_by_member = defaultdict(list)
+        for team_id, members in self._members_set_by_team.items():
+            for member_id in members:
+                if member_id in self._user_by_id:
+                    teams_by_member[member_id].append(team_id)
+        
+        tasks_by_project = defaultdict(list)
+        tasks_by_assignee = defaultdict(list)
+        tasks_by_team = defaultdict(list)
+        dependents_by_task = defaultdict(list)  # task id -> tasks that depend on it
+        for task in self._tasks:
+            assignee_id = task.get('assigneeId')
+            tasks_by_project[task.get('projectId')].append(task)
+            tasks_by_assignee[assignee_id].append(task)
+            for team_id in teams_by_member.get(assignee_id, ()):
+                tasks_by_team[team_id].append(task)
+            for dependency_id in set(task.get('dependencies', [])):
+                dependents_by_task[dependency_id].append(task)
+        
+        self._tasks_by_project = dict(tasks_by_project)
+        self._tasks_by_assignee = dict(tasks_by_assignee)
+        self._tasks_by_team = dict(tasks_by_team)
+        self._dependents_by_task = dict(dependents_by_task)
+    
+    def _build_days_overdue(self):
+        """Days past the due date for every task, parsed in one pass (0 when not yet due or no valid due date)"""
+        if self.tasks_df.empty or 'id' not in self.tasks_df:
+            return {}
+        days_overdue = (self._now_ts - self._parse_dates(self.tasks_df, 'dueDate')).dt.days.clip(lower=0).fillna(0).astype(int)
+        return dict(zip(self.tasks_df['id'].tolist(), days_overdue.tolist()))
+    
+    def _index_records(self, name, key):
+        """Map key -> first matching row (as a dict) of an NLP result DataFrame"""
+        df = self.dataframes.get(name)
+        if df is None or df.empty:
+            return {}
+        
+        lookup = {}
+        for record in df.to_dict('records'):
+            lookup.setdefault(record[key], record)
+        return lookup
+    
+    def generate_project_summary_report(self):
+        """Generate comprehensive project summary CSV"""
+        if self._project_metrics.empty:
+            return pd.DataFrame()
+        
+        # Projects with their task aggregates, plus the first NLP sentiment row per project
+        df = self._project_metrics.merge(
+            self._first_nlp_rows('sentiment_analysis', 'project_id', ['sentiment_score', 'sentiment_label', 'risk_keywords', 'complexity_level']).add_prefix('st_'),
+            left_on='id', right_on='st_project_id', how='left'
+        )
+        has_sentiment = df['st_project_id'].notna()
+        
+        domains = self._column(df, 'domains', np.nan)
+        start_dates = self._parse_dates(df, 'startDate')
+        end_dates = self._parse_dates(df, 'endDate')
+        sentiment_score = df['st_sentiment_score'].where(has_sentiment, 0)
+        total_estimated_hours = df['estimated_hours']
+        total_actual_hours = df['actual_hours']
+        has_estimate = total_estimated_hours > 0
+        
+        return self._shrink_dtypes(pd.DataFrame({
+            'Project_ID': df['id'],
+            'Project_Name': df['name'],
+            'Description': df['description'],
+            'Status': df['status'],
+            'Progress_Percentage': df['progress_value'],
+            'Total_Tasks': df['total_tasks'],
+            'Completed_Tasks': df['completed_tasks'],
+            'Delayed_Tasks': df['delayed_tasks'],
+            'Task_Completion_Rate': df['completed_ratio'] * 100,
+            'Delay_Rate': df['delayed_ratio'] * 100,
+            'Total_Estimated_Hours': total_estimated_hours,
+            'Total_Actual_Hours': total_actual_hours,
+            'Estimation_Accuracy': (total_actual_hours / total_estimated_hours.where(has_estimate)).fillna(1.0),
+            'Budget_Variance_Percentage': ((total_actual_hours - total_estimated_hours) / total_estimated_hours.where(has_estimate) * 100).fillna(0),
+            'Domains': domains.map(', '.join, na_action='ignore').fillna(''),
+            'Domain_Count': domains.map(len, na_action='ignore').fillna(0).astype(int),
+            'Team_ID': self._column(df, 'teamId', ''),
+            'Manager_ID': self._column(df, 'managerId', ''),
+            'Risk_Level': df['risk_level'],
+            'Sentiment_Score': sentiment_score,
+            'Sentiment_Label': df['st_sentiment_label'].where(has_sentiment, 'neutral'),
+            'Risk_Keywords_Count': df['st_risk_keywords'].map(len, na_action='ignore').fillna(0).astype(int),
+            'Complexity_Level': df['st_complexity_level'].where(has_sentiment, 'medium'),
+            'Start_Date': self._column(df, 'startDate', ''),
+            'End_Date': self._column(df, 'endDate', ''),
+            'Days_Duration': (end_dates - start_dates).dt.days.fillna(0).astype(int),
+            'Days_Remaining': (end_dates - self._now_ts).dt.days.fillna(0).astype(int),
+            'Overall_Health_Score': (df['base_health'] + sentiment_score.fillna(0) * 20).clip(0, 100),
+            'Generated_Timestamp': self._now_iso
+        }))
+    
+    def _build_project_metrics(self):
+        """Projects joined with per-project task aggregates (one groupby over all tasks),
+        plus the risk level and sentiment-free health score derived from them"""
+        df = self.projects_df
+        if df.empty:
+            return df
+        
+        tasks_df = self.tasks_df
+        status = self._column(tasks_df, 'status', '')
+        project_ids = self._column(tasks_df, 'projectId', '')
+        stats = pd.DataFrame({
+            'project_id': project_ids,
+            'is_completed': status == 'completed',
+            'is_delayed': status == 'delayed',
+            'is_critical': self._column(tasks_df, 'priority', '') == 'critical',
+            'is_technical': self._column(tasks_df, 'description', '').astype(str).str.contains(TECHNICAL_RISK_PATTERN),
+            'estimated': self._column(tasks_df, 'estimatedHours', 0),
+            'actual': self._column(tasks_df, 'actualHours', 0)
+        }).groupby('project_id').agg(
+            total_tasks=('is_completed', 'size'),
+            completed_tasks=('is_completed', 'sum'),
+            delayed_tasks=('is_delayed', 'sum'),
+            critical_tasks=('is_critical', 'sum'),
+            technical_tasks=('is_technical', 'sum'),
+            estimated_hours=('estimated', 'sum'),
+            actual_hours=('actual', 'sum')
+        )
+        
+        # Largest number of the project's tasks held by one assignee (unassigned tasks excluded)
+        assignees = self._column(tasks_df, 'assigneeId', '')
+        is_assigned = assignees != ''
+        stats['max_assignee_tasks'] = (
+            pd.DataFrame({'project_id': project_ids[is_assigned], 'assignee_id': assignees[is_assigned]})
+            .groupby(['project_id', 'assignee_id']).size()
+            .groupby(level='project_id').max()
+            .reindex(stats.index, fill_value=0)
+        )
+        
+        # Align to the project rows; projects without tasks get zeros
+        df = pd.concat([df, stats.reindex(df['id'], fill_value=0).reset_index(drop=True)], axis=1)
+        
+        has_tasks = df['total_tasks'] > 0
+        df['completed_ratio'] = (df['completed_tasks'] / df['total_tasks'].where(has_tasks)).fillna(0)
+        df['delayed_ratio'] = (df['delayed_tasks'] / df['total_tasks'].where(has_tasks)).fillna(0)
+        df['progress_value'] = self._column(df, 'progress', 0)
+        
+        is_delayed = df['status'] == 'delayed'
+        progress = df['progress_value']
+        
+        # Risk points: delayed status, or low progress on an unfinished project, plus the delayed-task share
+        risk_points = np.where(is_delayed, 30, np.where((progress < 50) & (df['status'] != 'completed'), 20, 0)) + df['delayed_ratio'] * 40
+        df['risk_level'] = np.select([risk_points >= 60, risk_points >= 30], ['high', 'medium'], 'low')
+        
+        # Health before the sentiment adjustment and the 0-100 clamp
+        df['base_health'] = (
+            50
+            + (progress - 50) * 0.5
+            + np.where(has_tasks, (df['completed_ratio'] - 0.5) * 30, 0)
+            - np.where(is_delayed, 25, 0)
+        )
+        return df
     
     def generate_task_analysis_report(self):
         """Generate detailed task analysis CSV"""
-        tasks_data = []
-        
-        for task in self.nlp_analyzer.data['tasks']:
-            # Get NLP complexity analysis
-            complexity_data = None
-            if not self.dataframes['task_complexity'].empty:
-                complexity_row = self.dataframes['task_complexity'][
-                    self.dataframes['task_complexity']['task_id'] == task['id']
-                ]
-                if not complexity_row.empty:
-                    complexity_data = complexity_row.iloc[0]
-            
-            # Get delay analysis if applicable
-            delay_data = None
-            if not self.dataframes['delay_patterns'].empty:
-                delay_row = self.dataframes['delay_patterns'][
-                    self.dataframes['delay_patterns']['task_id'] == task['id']
-                ]
-                if not delay_row.empty:
-                    delay_data = delay_row.iloc[0]
-            
-            task_row = {
-                'Task_ID': task['id'],
-                'Task_Title': task['title'],
-                'Description': task['description'],
-                'Status': task['status'],
-                'Priority': task['priority'],
-                'Domain': task.get('domain', ''),
-                'Project_ID': task.get('projectId', ''),
-                'Assignee_ID': task.get('assigneeId', ''),
-                'Estimated_Hours': task.get('estimatedHours', 0),
-                'Actual_Hours': task.get('actualHours', 0),
-                'Hours_Variance': (task.get('actualHours', 0) - task.get('estimatedHours', 0)),
-                'Estimation_Accuracy_Ratio': (task.get('actualHours', 0) / task.get('estimatedHours', 1)) if task.get('estimatedHours') else 1.0,
-                'Estimation_Category': self.categorize_estimation_accuracy(task),
-                'Dependency_Count': len(task.get('dependencies', [])),
-                'Has_Dependencies': len(task.get('dependencies', [])) > 0,
-                'Start_Date': task.get('startDate', ''),
-                'Due_Date': task.get('dueDate', ''),
-                'Completed_Date': task.get('completedDate', ''),
-                'Days_To_Complete': self.calculate_completion_days(task),
-                'Is_Overdue': self.is_task_overdue(task),
-                'Delay_Reason': task.get('delayReason', ''),
-                'Complexity_Score': complexity_data['complexity_score'] if complexity_data is not None else 0,
-                'Complexity_Level': complexity_data['complexity_level'] if complexity_data is not None else 'low',
-                'Technical_Terms_Count': len(complexity_data['tech_terms']) if complexity_data is not None else 0,
-                'Technical_Terms': ', '.join(complexity_data['tech_terms']) if complexity_data is not None else '',
-                'Domain_Classification': complexity_data['domain'] if complexity_data is not None else task.get('domain', ''),
-                'Delay_Category': delay_data['delay_category'] if delay_data is not None else '',
-                'Root_Cause': delay_data['root_cause'] if delay_data is not None else '',
-                'Preventability_Score': delay_data['preventability_score'] if delay_data is not None else 0,
-                'Task_Health_Score': self.calculate_task_health_score(task, complexity_data, delay_data),
-                'Priority_Numeric': self.convert_priority_to_numeric(task.get('priority', 'medium')),
-                'Status_Numeric': self.convert_status_to_numeric(task.get('status', 'todo')),
-                'Generated_Timestamp': datetime.now().isoformat()
-            }
-            
-            tasks_data.append(task_row)
-        
-        return pd.DataFrame(tasks_data)
+        if self.tasks_df.empty:
+            return pd.DataFrame()
+        
+        # All tasks, with the first NLP complexity/delay row per task joined on
+        df = self.tasks_df.merge(
+            self._first_nlp_rows('task_complexity', 'task_id', ['complexity_score', 'complexity_level', 'tech_terms', 'domain']).add_prefix('cx_'),
+            left_on='id', right_on='cx_task_id', how='left'
+        )
+        df = df.merge(
+            self._first_nlp_rows('delay_patterns', 'task_id', ['delay_category', 'root_cause', 'preventability_score']).add_prefix('dl_'),
+            left_on='id', right_on='dl_task_id', how='left'
+        )
+        has_complexity = df['cx_task_id'].notna()
+        has_delay = df['dl_task_id'].notna()
+        
+        status = self._column(df, 'status', 'todo')
+        domain = self._column(df, 'domain', '')
+        estimated = self._column(df, 'estimatedHours', 0)
+        actual = self._column(df, 'actualHours', 0)
+        
+        # Estimation accuracy; NaN where nothing was estimated
+        ratio = actual / estimated.where(estimated != 0)
+        has_both_hours = (estimated != 0) & (actual != 0)
+        estimation_category = np.select(
+            [~has_both_hours, ratio.between(0.8, 1.2), ratio < 0.8],
+            ['unknown', 'accurate', 'overestimated'],
+            'underestimated'
+        )
+        
+        dependency_count = self._column(df, 'dependencies', np.nan).map(len, na_action='ignore').fillna(0).astype(int)
+        
+        start_dates = self._parse_dates(df, 'startDate')
+        due_dates = self._parse_dates(df, 'dueDate')
+        completed_dates = self._parse_dates(df, 'completedDate')
+        
+        tech_terms = df['cx_tech_terms']
+        preventability = df['dl_preventability_score']
+        
+        # Task health: status bonus/penalty, estimation accuracy, complexity and preventable-delay penalties
+        health = (
+            50
+            + status.map(TASK_STATUS_HEALTH).fillna(0)
+            + np.where(has_both_hours & ratio.between(0.8, 1.2), 20, 0)
+            - np.where(has_both_hours & (ratio > 1.5), 15, 0)
+            - np.where(has_complexity & (df['cx_complexity_level'] == 'high'), 10, 0)
+            - np.where(has_delay & (preventability.fillna(50) > 70), 20, 0)
+        ).clip(0, 100)
+        
+        return self._shrink_dtypes(pd.DataFrame({
+            'Task_ID': df['id'],
+            'Task_Title': df['title'],
+            'Description': df['description'],
+            'Status': df['status'],
+            'Priority': df['priority'],
+            'Domain': domain,
+            'Project_ID': self._column(df, 'projectId', ''),
+            'Assignee_ID': self._column(df, 'assigneeId', ''),
+            'Estimated_Hours': estimated,
+            'Actual_Hours': actual,
+            'Hours_Variance': actual - estimated,
+            'Estimation_Accuracy_Ratio': ratio.fillna(1.0),
+            'Estimation_Category': estimation_category,
+            'Dependency_Count': dependency_count,
+            'Has_Dependencies': dependency_count > 0,
+            'Start_Date': self._column(df, 'startDate', ''),
+            'Due_Date': self._column(df, 'dueDate', ''),
+            'Completed_Date': self._column(df, 'completedDate', ''),
+            'Days_To_Complete': (completed_dates - start_dates).dt.days.fillna(0).astype(int),
+            'Is_Overdue': due_dates.notna() & (status != 'completed') & (due_dates < self._now_ts),
+            'Delay_Reason': self._column(df, 'delayReason', ''),
+            'Complexity_Score': df['cx_complexity_score'].where(has_complexity, 0),
+            'Complexity_Level': df['cx_complexity_level'].where(has_complexity, 'low'),
+            'Technical_Terms_Count': tech_terms.map(len, na_action='ignore').fillna(0).astype(int),
+            'Technical_Terms': tech_terms.map(', '.join, na_action='ignore').fillna(''),
+            'Domain_Classification': df['cx_domain'].where(has_complexity, domain),
+            'Delay_Category': df['dl_delay_category'].where(has_delay, ''),
+            'Root_Cause': df['dl_root_cause'].where(has_delay, ''),
+            'Preventability_Score': preventability.where(has_delay, 0),
+            'Task_Health_Score': health,
+            'Priority_Numeric': self._column(df, 'priority', 'medium').str.lower().map(PRIORITY_NUMERIC).fillna(2).astype('int8'),
+            'Status_Numeric': status.str.lower().map(STATUS_NUMERIC).fillna(1).astype('int8'),
+            'Generated_Timestamp': self._now_iso
+        }))
+    
+    def _first_nlp_rows(self, name, key, columns):
+        """First row per id of an NLP result frame, restricted to the given columns"""
+        df = self.dataframes.get(name)
+        if df is None or df.empty:
+            return pd.DataFrame(columns=[key] + columns)
+        return df.drop_duplicates(key)[[key] + columns]
+    
+    @staticmethod
+    def _shrink_dtypes(df):
+        """Store the report's repeated label columns as categoricals"""
+        return df.astype({name: 'category' for name in REPORT_CATEGORY_COLUMNS if name in df})
+    
+    @staticmethod
+    def _column(df, name, default):
+        """Column with missing values (or a missing column) replaced by a default"""
+        if name in df:
+            return df[name].fillna(default)
+        return pd.Series(default, index=df.index)
+    
+    @staticmethod
+    def _parse_dates(df, name):
+        """Parse an ISO date column to naive local timestamps; naive values keep their wall time,
+        values with an offset are converted to local time, blanks and bad values become NaT"""
+        if name not in df:
+            return pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+        values = df[name]
+        # utc=True lets naive and offset values parse together, but reads naive values as UTC
+        dates = pd.to_datetime(values, errors='coerce', utc=True, format='ISO8601')
+        has_offset = values.astype(str).str.contains(UTC_OFFSET_PATTERN)
+        local = dates.dt.tz_convert(tz.tzlocal()).dt.tz_localize(None)
+        return dates.dt.tz_localize(None).where(~has_offset, local)
     
     def generate_team_performance_report(self):
         """Generate team performance analysis CSV"""
-        teams_data = []
-        
-        for team in self.nlp_analyzer.data['teams']:
+        return pd.DataFrame(list(self._team_performance_rows()))
+    
+    def _team_performance_rows(self):
+        """Yield team performance analysis CSV rows"""
+        for team in self._teams:
             # Get team tasks (simplified - assuming team assignment exists)
-            team_tasks = [t for t in self.nlp_analyzer.data['tasks'] 
-                         if any(member_id in [u.get('id') for u in self.nlp_analyzer.data['users'] 
-                               if u.get('id') in team.get('memberIds', [])] 
-                               for member_id in [t.get('assigneeId')])]
+            team_tasks = self._tasks_by_team.get(team['id'], [])
             
             # Get NLP team analysis
-            team_nlp_data = None
-            if not self.dataframes['team_skills'].empty:
-                team_row = self.dataframes['team_skills'][
-                    self.dataframes['team_skills']['team_id'] == team['id']
-                ]
-                if not team_row.empty:
-                    team_nlp_data = team_row.iloc[0]
+            team_nlp_data = self._team_skills_by_team.get(team['id'])
             
             # Calculate performance metrics
-            completed_tasks = len([t for t in team_tasks if t.get('status') == 'completed'])
-            delayed_tasks = len([t for t in team_tasks if t.get('status') == 'delayed'])
-            total_estimated = sum(t.get('estimatedHours', 0) for t in team_tasks)
-            total_actual = sum(t.get('actualHours', 0) for t in team_tasks if t.get('actualHours'))
+            status_counts, total_estimated, total_actual = _task_stats(team_tasks)
+            completed_tasks = status_counts['completed']
+            delayed_tasks = status_counts['delayed']
             
             team_row = {
                 'Team_ID': team['id'],
@@ -205,80 +519,36 @@ class EnhancedCSVReportGenerator:
                 'Total_Tasks_Assigned': len(team_tasks),
                 'Completed_Tasks': completed_tasks,
                 'Delayed_Tasks': delayed_tasks,
-                'Tasks_In_Progress': len([t for t in team_tasks if t.get('status') == 'in_progress']),
+                'Tasks_In_Progress': status_counts['in_progress'],
                 'Completion_Rate': (completed_tasks / len(team_tasks) * 100) if team_tasks else 0,
                 'Delay_Rate': (delayed_tasks / len(team_tasks) * 100) if team_tasks else 0,
                 'Total_Estimated_Hours': total_estimated,
                 'Total_Actual_Hours': total_actual,
                 'Team_Estimation_Accuracy': (total_actual / total_estimated) if total_estimated > 0 else 1.0,
-                'Productivity_Score': self.calculate_team_productivity(team_tasks),
+                'Productivity_Score': self._team_productivity(status_counts, total_actual),
                 'Specialization_Score': team_nlp_data['specialization_score'] if team_nlp_data is not None else 0,
                 'Primary_Tech_Stack': team_nlp_data['primary_tech_stack'] if team_nlp_data is not None else 'General',
                 'Skill_Diversity': team_nlp_data['skill_diversity'] if team_nlp_data is not None else 0,
                 'Domain_Focus': self.identify_team_domain_focus(team, team_tasks),
-                'Performance_Rating': self.calculate_team_performance_rating(team, team_tasks),
+                'Performance_Rating': self._team_performance_rating(status_counts),
                 'Workload_Balance_Score': self.calculate_workload_balance(team, team_tasks),
-                'Risk_Factors': self.identify_team_risk_factors(team, team_tasks),
-                'Generated_Timestamp': datetime.now().isoformat()
+                'Risk_Factors': self._team_risk_factors(team, status_counts),
+                'Generated_Timestamp': self._now_iso
             }
             
-            teams_data.append(team_row)
-        
-        return pd.DataFrame(teams_data)
+            yield team_row
     
     def generate_delay_analysis_report(self):
         """Generate comprehensive delay analysis CSV"""
-        delay_data = []
-        
+        return pd.DataFrame(list(self._delay_analysis_rows()))
+    
+    def _delay_analysis_rows(self):
+        """Yield comprehensive delay analysis CSV rows"""
         # Analyze delayed tasks
-        delayed_tasks = [t for t in self.nlp_analyzer.data['tasks'] if t.get('status') == 'delayed']
-        
-        for task in delayed_tasks:
-            # Get NLP delay analysis
-            delay_nlp_data = None
-            if not self.dataframes['delay_patterns'].empty:
-                delay_row = self.dataframes['delay_patterns'][
-                    self.dataframes['delay_patterns']['task_id'] == task['id']
-                ]
-                if not delay_row.empty:
-                    delay_nlp_data = delay_row.iloc[0]
-            
-            # Calculate delay impact
-            project_id = task.get('projectId', '')
-            project_tasks = [t for t in self.nlp_analyzer.data['tasks'] if t.get('projectId') == project_id]
-            
-            delay_row = {
-                'Task_ID': task['id'],
-                'Task_Title': task['title'],
-                'Project_ID': project_id,
-                'Assignee_ID': task.get('assigneeId', ''),
-                'Priority': task.get('priority', ''),
-                'Domain': task.get('domain', ''),
-                'Estimated_Hours': task.get('estimatedHours', 0),
-                'Actual_Hours': task.get('actualHours', 0),
-                'Hours_Overrun': (task.get('actualHours', 0) - task.get('estimatedHours', 0)),
-                'Overrun_Percentage': ((task.get('actualHours', 0) - task.get('estimatedHours', 0)) / task.get('estimatedHours', 1) * 100),
-                'Due_Date': task.get('dueDate', ''),
-                'Days_Overdue': self.calculate_days_overdue(task),
-                'Delay_Reason': task.get('delayReason', 'No reason provided'),
-                'Delay_Category': delay_nlp_data['delay_category'] if delay_nlp_data is not None else 'other',
-                'Root_Cause_Type': delay_nlp_data['root_cause'] if delay_nlp_data is not None else 'external_factor',
-                'Preventability_Score': delay_nlp_data['preventability_score'] if delay_nlp_data is not None else 50,
-                'Preventability_Category': self.categorize_preventability(delay_nlp_data['preventability_score'] if delay_nlp_data is not None else 50),
-                'Impact_on_Project': self.calculate_delay_impact_on_project(task, project_tasks),
-                'Dependency_Count': len(task.get('dependencies', [])),
-                'Blocks_Other_Tasks': self.check_if_blocks_others(task, self.nlp_analyzer.data['tasks']),
-                'Cost_Impact_Hours': task.get('actualHours', 0) - task.get('estimatedHours', 0),
-                'Severity_Level': self.assess_delay_severity(task, delay_nlp_data),
-                'Recommended_Action': self.suggest_delay_action(delay_nlp_data),
-                'Lessons_Learned': self.extract_lessons_learned(task, delay_nlp_data),
-                'Generated_Timestamp': datetime.now().isoformat()
-            }
-            
-            delay_data.append(delay_row)
+        yield from self._delayed_task_rows()
         
         # Add delay alerts
-        for alert in self.nlp_analyzer.data['delayAlerts']:
+        for alert in self._alerts:
             if not alert.get('isResolved', True):
                 alert_row = {
                     'Alert_ID': alert['id'],
@@ -291,73 +561,158 @@ class EnhancedCSVReportGenerator:
                     'Notification_Sent': alert.get('notificationSent', False),
                     'Alert_Urgency': self.assess_alert_urgency(alert),
                     'Impact_Scope': self.assess_alert_impact_scope(alert),
-                    'Generated_Timestamp': datetime.now().isoformat()
+                    'Generated_Timestamp': self._now_iso
                 }
-                delay_data.append(alert_row)
-        
-        return pd.DataFrame(delay_data)
+                yield alert_row
+    
+    def _delayed_task_rows(self):
+        """Yield one delay report row per delayed task; the numeric and NLP-derived
+        columns are computed for all delayed tasks at once"""
+        delayed_tasks = [t for t in self._tasks if t.get('status') == 'delayed']
+        if not delayed_tasks:
+            return
+        
+        # Hours overrun for all delayed tasks at once; overrun % is 0 where nothing was estimated
+        delayed_df = self.tasks_df[self._column(self.tasks_df, 'status', '') == 'delayed'].reset_index(drop=True)
+        estimated = self._column(delayed_df, 'estimatedHours', 0)
+        actual = self._column(delayed_df, 'actualHours', 0)
+        hours_overrun = actual - estimated
+        days_overdue = [self.calculate_days_overdue(task) for task in delayed_tasks]
+        estimated_values = estimated.to_numpy(dtype=np.float64)
+        overrun_percentage = np.divide(
+            hours_overrun.to_numpy(dtype=np.float64), estimated_values,
+            out=np.zeros_like(estimated_values), where=estimated_values > 0
+        ) * 100
+        
+        # First NLP delay row per task, and the labels derived from it
+        nlp = delayed_df[['id']].merge(
+            self._first_nlp_rows('delay_patterns', 'task_id', ['delay_category', 'root_cause', 'preventability_score']),
+            left_on='id', right_on='task_id', how='left'
+        )
+        has_delay = nlp['task_id'].notna()
+        category = nlp['delay_category']
+        preventability = nlp['preventability_score'].where(has_delay, 50)
+        preventability_category = np.select(
+            [preventability >= 70, preventability >= 40],
+            ['highly_preventable', 'moderately_preventable'],
+            'difficult_to_prevent'
+        )
+        severity = category.map(DELAY_CATEGORY_SEVERITY).fillna('low').where(has_delay, 'medium')
+        action = category.map(DELAY_CATEGORY_ACTIONS).fillna('general_review').where(has_delay, 'review_and_reassess')
+        lessons = pd.Series(np.select(
+            [preventability > 70, preventability < 30],
+            ['better_planning_needed', 'external_factors_consideration'],
+            'process_improvement_opportunity'
+        )).where(has_delay, 'improve_estimation_process')
+        
+        for task, est, act, overrun, overrun_pct, overdue, delay_category, root_cause, prevent_score, prevent_category, severity_level, recommended_action, lesson in zip(
+            delayed_tasks, estimated.tolist(), actual.tolist(),
+            hours_overrun.tolist(), overrun_percentage.tolist(), days_overdue,
+            category.where(has_delay, 'other').tolist(), nlp['root_cause'].where(has_delay, 'external_factor').tolist(),
+            preventability.tolist(), preventability_category.tolist(),
+            severity.tolist(), action.tolist(), lessons.tolist()
+        ):
+            # Calculate delay impact
+            project_id = task.get('projectId', '')
+            project_tasks = self._tasks_by_project.get(project_id, [])
+            
+            yield {
+                'Task_ID': task['id'],
+                'Task_Title': task['title'],
+                'Project_ID': project_id,
+                'Assignee_ID': task.get('assigneeId', ''),
+                'Priority': task.get('priority', ''),
+                'Domain': task.get('domain', ''),
+                'Estimated_Hours': est,
+                'Actual_Hours': act,
+                'Hours_Overrun': overrun,
+                'Overrun_Percentage': overrun_pct,
+                'Due_Date': task.get('dueDate', ''),
+                'Days_Overdue': overdue,
+                'Delay_Reason': task.get('delayReason', 'No reason provided'),
+                'Delay_Category': delay_category,
+                'Root_Cause_Type': root_cause,
+                'Preventability_Score': prevent_score,
+                'Preventability_Category': prevent_category,
+                'Impact_on_Project': self.calculate_delay_impact_on_project(task, project_tasks),
+                'Dependency_Count': len(task.get('dependencies', [])),
+                'Blocks_Other_Tasks': self.check_if_blocks_others(task),
+                'Cost_Impact_Hours': overrun,
+                'Severity_Level': severity_level,
+                'Recommended_Action': recommended_action,
+                'Lessons_Learned': lesson,
+                'Generated_Timestamp': self._now_iso
+            }
     
     def generate_risk_assessment_report(self):
         """Generate risk assessment CSV"""
-        risk_data = []
-        
-        # Project-level risks
-        for project in self.nlp_analyzer.data['projects']:
-            project_tasks = [t for t in self.nlp_analyzer.data['tasks'] 
-                           if t.get('projectId') == project['id']]
-            
-            # Get sentiment analysis
-            sentiment_data = None
-            if not self.dataframes['sentiment_analysis'].empty:
-                sentiment_row = self.dataframes['sentiment_analysis'][
-                    self.dataframes['sentiment_analysis']['project_id'] == project['id']
-                ]
-                if not sentiment_row.empty:
-                    sentiment_data = sentiment_row.iloc[0]
-            
-            risk_score = self.calculate_comprehensive_risk_score(project, project_tasks, sentiment_data)
+        return pd.DataFrame(list(self._risk_assessment_rows()))
+    
+    def _risk_assessment_rows(self):
+        """Yield risk assessment CSV rows"""
+        if self._project_metrics.empty:
+            return
+        
+        # Project-level risks, from the task aggregates precomputed per project
+        metrics_rows = self._project_metrics[[
+            'total_tasks', 'delayed_tasks', 'delayed_ratio', 'critical_tasks', 'technical_tasks',
+            'max_assignee_tasks', 'estimated_hours', 'actual_hours'
+        ]].to_dict('records')
+        projects = self._projects
+        sentiments = [self._sentiment_by_project.get(project['id']) for project in projects]
+        risk_scores = [
+            self._comprehensive_risk_score(project, metrics['delayed_ratio'], sentiment_data)
+            for project, metrics, sentiment_data in zip(projects, metrics_rows, sentiments)
+        ]
+        # Band every score at once; the score-based columns are label lookups on the band
+        risk_bands = np.searchsorted(RISK_SCORE_BANDS, risk_scores, side='right').tolist()
+        
+        for project, metrics, sentiment_data, risk_score, band in zip(projects, metrics_rows, sentiments, risk_scores, risk_bands):
+            total_tasks = metrics['total_tasks']
+            delayed_ratio = metrics['delayed_ratio']
             
             risk_row = {
                 'Entity_Type': 'Project',
                 'Entity_ID': project['id'],
                 'Entity_Name': project['name'],
                 'Overall_Risk_Score': risk_score,
-                'Risk_Level': self.categorize_risk_level(risk_score),
-                'Schedule_Risk': self.assess_schedule_risk(project, project_tasks),
-                'Budget_Risk': self.assess_budget_risk(project, project_tasks),
-                'Quality_Risk': self.assess_quality_risk(project, project_tasks),
-                'Resource_Risk': self.assess_resource_risk(project, project_tasks),
-                'Technical_Risk': self.assess_technical_risk(project, project_tasks),
+                'Risk_Level': RISK_LEVEL_LABELS[band],
+                'Schedule_Risk': self._schedule_risk(project, metrics['delayed_tasks'], total_tasks),
+                'Budget_Risk': self._budget_risk(metrics['estimated_hours'], metrics['actual_hours']),
+                'Quality_Risk': self._quality_risk(metrics['critical_tasks'], total_tasks),
+                'Resource_Risk': self._resource_risk(metrics['max_assignee_tasks']),
+                'Technical_Risk': self._technical_risk(metrics['technical_tasks'], total_tasks),
                 'Complexity_Risk': sentiment_data['complexity_level'] if sentiment_data is not None else 'medium',
                 'Sentiment_Risk': sentiment_data['sentiment_label'] if sentiment_data is not None else 'neutral',
                 'Risk_Keywords_Count': len(sentiment_data['risk_keywords']) if sentiment_data is not None else 0,
-                'Primary_Risk_Factors': self.identify_primary_risk_factors(project, project_tasks, sentiment_data),
-                'Mitigation_Priority': self.assess_mitigation_priority(risk_score),
-                'Recommended_Actions': self.suggest_risk_mitigation_actions(project, project_tasks, risk_score),
-                'Monitoring_Frequency': self.suggest_monitoring_frequency(risk_score),
-                'Impact_Assessment': self.assess_potential_impact(project, project_tasks, risk_score),
-                'Generated_Timestamp': datetime.now().isoformat()
+                'Primary_Risk_Factors': self._primary_risk_factors(project, delayed_ratio, sentiment_data),
+                'Mitigation_Priority': MITIGATION_PRIORITY_LABELS[band],
+                'Recommended_Actions': MITIGATION_ACTION_LABELS[band],
+                'Monitoring_Frequency': MONITORING_FREQUENCY_LABELS[band],
+                'Impact_Assessment': POTENTIAL_IMPACT_LABELS[band],
+                'Generated_Timestamp': self._now_iso
             }
             
-            risk_data.append(risk_row)
-        
-        return pd.DataFrame(risk_data)
+            yield risk_row
     
     def generate_executive_dashboard(self):
         """Generate executive summary dashboard data CSV"""
         summary_data = []
         
         # Overall metrics
-        total_projects = len(self.nlp_analyzer.data['projects'])
-        total_tasks = len(self.nlp_analyzer.data['tasks'])
-        completed_projects = len([p for p in self.nlp_analyzer.data['projects'] if p.get('status') == 'completed'])
-        delayed_projects = len([p for p in self.nlp_analyzer.data['projects'] if p.get('status') == 'delayed'])
-        completed_tasks = len([t for t in self.nlp_analyzer.data['tasks'] if t.get('status') == 'completed'])
-        delayed_tasks = len([t for t in self.nlp_analyzer.data['tasks'] if t.get('status') == 'delayed'])
-        
-        # Calculate totals
-        total_estimated_hours = sum(t.get('estimatedHours', 0) for t in self.nlp_analyzer.data['tasks'])
-        total_actual_hours = sum(t.get('actualHours', 0) for t in self.nlp_analyzer.data['tasks'] if t.get('actualHours'))
+        projects = self._projects
+        project_status_counts = Counter(p.get('status') for p in projects)
+        task_status_counts, total_estimated_hours, total_actual_hours = self._task_totals
+        total_projects = len(projects)
+        total_tasks = len(self._tasks)
+        completed_projects = project_status_counts['completed']
+        delayed_projects = project_status_counts['delayed']
+        completed_tasks = task_status_counts['completed']
+        delayed_tasks = task_status_counts['delayed']
+        
+        # Scores shared by several dashboard fields, computed once
+        process_maturity = self.calculate_process_maturity_score()
+        high_risk_count = self._count_high_risk_projects()
         
         # NLP insights
         exec_summary = self.insights['executive_summary']
@@ -367,7 +722,7 @@ class EnhancedCSVReportGenerator:
             'Total_Projects': total_projects,
             'Completed_Projects': completed_projects,
             'Delayed_Projects': delayed_projects,
-            'In_Progress_Projects': len([p for p in self.nlp_analyzer.data['projects'] if p.get('status') == 'in_progress']),
+            'In_Progress_Projects': project_status_counts['in_progress'],
             'Project_Completion_Rate': (completed_projects / total_projects * 100) if total_projects > 0 else 0,
             'Project_Delay_Rate': (delayed_projects / total_projects * 100) if total_projects > 0 else 0,
             'Total_Tasks': total_tasks,
@@ -383,14 +738,14 @@ class EnhancedCSVReportGenerator:
             'High_Complexity_Tasks': exec_summary.get('complex_tasks', 0),
             'Average_Project_Health': self.calculate_average_project_health(),
             'Team_Performance_Score': self.calculate_overall_team_performance(),
-            'Risk_Management_Score': self.calculate_risk_management_score(),
-            'Process_Maturity_Score': self.calculate_process_maturity_score(),
-            'Key_Success_Factors': self.identify_key_success_factors(),
-            'Critical_Issues': self.identify_critical_issues(),
+            'Risk_Management_Score': self._risk_management_score(high_risk_count),
+            'Process_Maturity_Score': process_maturity,
+            'Key_Success_Factors': self._key_success_factors(process_maturity),
+            'Critical_Issues': self._critical_issues(process_maturity, high_risk_count),
             'Strategic_Recommendations': ', '.join([r.get('title', '') for r in self.insights.get('recommendations', [])[:3]]),
-            'Report_Generated_Date': datetime.now().strftime('%Y-%m-%d'),
-            'Report_Generated_Time': datetime.now().strftime('%H:%M:%S'),
-            'Generated_Timestamp': datetime.now().isoformat()
+            'Report_Generated_Date': self._now.strftime('%Y-%m-%d'),
+            'Report_Generated_Time': self._now.strftime('%H:%M:%S'),
+            'Generated_Timestamp': self._now_iso
         }
         
         summary_data.append(dashboard_row)
@@ -398,38 +753,89 @@ class EnhancedCSVReportGenerator:
         return pd.DataFrame(summary_data)
     
     def save_all_reports(self, reports):
-        """Save all generated reports to CSV files"""
-        results_dir = Path(__file__).parent / 'results'
-        results_dir.mkdir(exist_ok=True)
-        
+        """Save all generated reports to CSV files; returns the paths of the files written"""
+        return [saved['file'] for saved in self._save_reports(reports).values()]
+    
+    def _save_reports(self, reports):
+        """Save reports to CSV files and return {report name: {'file', 'rows', 'columns'}}.
+
+        Reports are either DataFrames or iterables of row dicts; rows are
+        streamed to disk as they are produced. Each report goes to its own
+        file, so they are written concurrently.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        saved_files = []
-        for report_name, df in reports.items():
-            if not df.empty:
-                filename = f"{report_name}_{timestamp}.csv"
-                filepath = results_dir / filename
-                
-                # Save with proper formatting
-                df.to_csv(filepath, index=False, encoding='utf-8')
-                saved_files.append(str(filepath))
-                print(f"Saved {report_name}: {len(df)} rows to {filepath}")
+        with ThreadPoolExecutor(max_workers=min(len(reports), os.cpu_count() or 1) or 1) as executor:
+            results = list(executor.map(
+                lambda item: self._save_report(item[0], item[1], self.results_dir, timestamp),
+                reports.items()
+            ))
+        
+        saved_reports = {}
+        for report_name, saved in zip(reports, results):
+            if saved is not None:
+                saved_reports[report_name] = saved
+                print(f"Saved {report_name}: {saved['rows']} rows to {saved['file']}")
+        
+        return saved_reports
+    
+    def _save_report(self, report_name, report, results_dir, timestamp):
+        """Write one report to its CSV file; None when it has no rows"""
+        filepath = results_dir / f"{report_name}_{timestamp}.csv"
+        
+        if isinstance(report, pd.DataFrame):
+            if report.empty:
+                return None
+            self._write_csv_frame(filepath, report)
+            row_count, columns = len(report), list(report.columns)
+        else:
+            fieldnames = DELAY_REPORT_COLUMNS if report_name == 'delay_analysis' else None
+            row_count, columns = self._write_csv_rows(filepath, report, fieldnames)
+            if row_count == 0:
+                return None
         
-        return saved_files
+        return {'file': str(filepath), 'rows': row_count, 'columns': columns}
+    
+    @staticmethod
+    def _write_csv_frame(filepath, df):
+        """Write a DataFrame to CSV in chunks of CSV_CHUNK_SIZE rows"""
+        df.to_csv(filepath, index=False, encoding='utf-8', quoting=csv.QUOTE_MINIMAL, lineterminator='\n', chunksize=CSV_CHUNK_SIZE)
+    
+    @staticmethod
+    def _write_csv_rows(filepath, rows, fieldnames=None):
+        """Stream row dicts to a CSV file in chunks of CSV_CHUNK_SIZE, taking the header
+        from the first row unless given.
+        Returns (row_count, columns); no file is created when there are no rows."""
+        rows = iter(rows)
+        chunk = list(islice(rows, CSV_CHUNK_SIZE))
+        if not chunk:
+            return 0, []
+        
+        fieldnames = list(fieldnames or chunk[0].keys())
+        row_count = 0
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='', lineterminator='\n')
+            writer.writeheader()
+            while chunk:
+                writer.writerows(chunk)
+                row_count += len(chunk)
+                chunk = list(islice(rows, CSV_CHUNK_SIZE))
+        
+        return row_count, fieldnames
     
     # Helper methods for calculations
     
+    # Per-entity helpers: scalar forms of the values the reports compute in bulk, for
+    # callers scoring a single project, task or team outside a report run
+    
     def assess_project_risk_level(self, project, tasks):
         """Assess overall project risk level"""
         risk_score = 0
-        
         if project.get('status') == 'delayed':
             risk_score += 30
         elif project.get('progress', 0) < 50 and project.get('status') != 'completed':
             risk_score += 20
-            
-        delayed_task_ratio = len([t for t in tasks if t.get('status') == 'delayed']) / len(tasks) if tasks else 0
-        risk_score += delayed_task_ratio * 40
+        risk_score += self._delayed_ratio(tasks) * 40
         
         if risk_score >= 60:
             return 'high'
@@ -440,62 +846,32 @@ class EnhancedCSVReportGenerator:
     
     def calculate_project_duration(self, project):
         """Calculate project duration in days"""
-        start = project.get('startDate')
-        end = project.get('endDate')
-        if start and end:
-            try:
-                start_date = datetime.fromisoformat(start.replace('Z', '+00:00')) if isinstance(start, str) else start
-                end_date = datetime.fromisoformat(end.replace('Z', '+00:00')) if isinstance(end, str) else end
-                return (end_date - start_date).days
-            except:
-                return 0
-        return 0
+        return self._days_between(project.get('startDate'), project.get('endDate'))
     
     def calculate_days_remaining(self, project):
         """Calculate days remaining for project"""
-        end = project.get('endDate')
-        if end:
-            try:
-                end_date = datetime.fromisoformat(end.replace('Z', '+00:00')) if isinstance(end, str) else end
-                return (end_date - datetime.now()).days
-            except:
-                return 0
-        return 0
+        end_date = self._parse_date(project.get('endDate'))
+        return 0 if pd.isna(end_date) else (end_date - self._report_now()).days
     
     def calculate_health_score(self, project, tasks, sentiment_data):
         """Calculate overall project health score (0-100)"""
-        score = 50  # Base score
-        
-        # Progress factor
-        progress = project.get('progress', 0)
-        score += (progress - 50) * 0.5
-        
-        # Task completion factor
+        score = 50 + (project.get('progress', 0) - 50) * 0.5
         if tasks:
-            completed_ratio = len([t for t in tasks if t.get('status') == 'completed']) / len(tasks)
-            score += (completed_ratio - 0.5) * 30
-        
-        # Sentiment factor
+            score += (_task_stats(tasks)[0]['completed'] / len(tasks) - 0.5) * 30
         if sentiment_data is not None:
-            sentiment_score = sentiment_data.get('sentiment_score', 0)
-            score += sentiment_score * 20
-        
-        # Delay penalty
+            score += sentiment_data.get('sentiment_score', 0) * 20
         if project.get('status') == 'delayed':
             score -= 25
-        
         return max(0, min(100, score))
     
     def categorize_estimation_accuracy(self, task):
         """Categorize estimation accuracy"""
         estimated = task.get('estimatedHours', 0)
         actual = task.get('actualHours', 0)
-        
         if estimated == 0 or actual == 0:
             return 'unknown'
         
         ratio = actual / estimated
-        
         if 0.8 <= ratio <= 1.2:
             return 'accurate'
         elif ratio < 0.8:
@@ -505,39 +881,19 @@ class EnhancedCSVReportGenerator:
     
     def calculate_completion_days(self, task):
         """Calculate days to complete task"""
-        start = task.get('startDate')
-        completed = task.get('completedDate')
-        
-        if start and completed:
-            try:
-                start_date = datetime.fromisoformat(start.replace('Z', '+00:00')) if isinstance(start, str) else start
-                completed_date = datetime.fromisoformat(completed.replace('Z', '+00:00')) if isinstance(completed, str) else completed
-                return (completed_date - start_date).days
-            except:
-                return 0
-        return 0
+        return self._days_between(task.get('startDate'), task.get('completedDate'))
     
     def is_task_overdue(self, task):
         """Check if task is overdue"""
-        due = task.get('dueDate')
-        if due and task.get('status') != 'completed':
-            try:
-                due_date = datetime.fromisoformat(due.replace('Z', '+00:00')) if isinstance(due, str) else due
-                return datetime.now() > due_date
-            except:
-                return False
-        return False
+        if task.get('status') == 'completed':
+            return False
+        due_date = self._parse_date(task.get('dueDate'))
+        return bool(pd.notna(due_date) and due_date < self._report_now())
     
     def calculate_task_health_score(self, task, complexity_data, delay_data):
         """Calculate task health score"""
-        score = 50
+        score = 50 + TASK_STATUS_HEALTH.get(task.get('status', 'todo'), 0)
         
-        # Status bonus/penalty
-        status = task.get('status', 'todo')
-        status_scores = {'completed': 30, 'in_progress': 10, 'todo': 0, 'delayed': -30}
-        score += status_scores.get(status, 0)
-        
-        # Estimation accuracy
         estimated = task.get('estimatedHours', 0)
         actual = task.get('actualHours', 0)
         if estimated > 0 and actual > 0:
@@ -547,41 +903,163 @@ class EnhancedCSVReportGenerator:
             elif ratio > 1.5:
                 score -= 15
         
-        # Complexity penalty
         if complexity_data is not None and complexity_data.get('complexity_level') == 'high':
             score -= 10
-        
-        # Delay penalty
-        if delay_data is not None:
-            preventability = delay_data.get('preventability_score', 50)
-            if preventability > 70:  # Highly preventable
-                score -= 20
+        if delay_data is not None and delay_data.get('preventability_score', 50) > 70:
+            score -= 20
         
         return max(0, min(100, score))
     
     def convert_priority_to_numeric(self, priority):
         """Convert priority to numeric value"""
-        mapping = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
-        return mapping.get(priority.lower(), 2)
+        return PRIORITY_NUMERIC.get(priority.lower(), 2)
     
     def convert_status_to_numeric(self, status):
         """Convert status to numeric value"""
-        mapping = {'todo': 1, 'in_progress': 2, 'review': 3, 'completed': 4, 'delayed': 5}
-        return mapping.get(status.lower(), 1)
+        return STATUS_NUMERIC.get(status.lower(), 1)
     
     def calculate_team_productivity(self, tasks):
         """Calculate team productivity score"""
-        if not tasks:
-            return 0
-        
-        completed_tasks = len([t for t in tasks if t.get('status') == 'completed'])
-        total_actual_hours = sum(t.get('actualHours', 0) for t in tasks if t.get('actualHours'))
+        status_counts, _, total_actual = _task_stats(tasks)
+        return self._team_productivity(status_counts, total_actual)
+    
+    def calculate_team_performance_rating(self, team, tasks):
+        """Calculate team performance rating"""
+        return self._team_performance_rating(_task_stats(tasks)[0])
+    
+    def identify_team_risk_factors(self, team, tasks):
+        """Identify team risk factors"""
+        return self._team_risk_factors(team, _task_stats(tasks)[0])
+    
+    def categorize_preventability(self, score):
+        """Categorize preventability score"""
+        if score >= 70:
+            return 'highly_preventable'
+        elif score >= 40:
+            return 'moderately_preventable'
+        else:
+            return 'difficult_to_prevent'
+    
+    def assess_delay_severity(self, task, delay_data):
+        """Assess delay severity"""
+        if delay_data is None:
+            return 'medium'
+        return DELAY_CATEGORY_SEVERITY.get(delay_data.get('delay_category', ''), 'low')
+    
+    def suggest_delay_action(self, delay_data):
+        """Suggest action for delay"""
+        if delay_data is None:
+            return 'review_and_reassess'
+        return DELAY_CATEGORY_ACTIONS.get(delay_data.get('delay_category', ''), 'general_review')
+    
+    def extract_lessons_learned(self, task, delay_data):
+        """Extract lessons learned from delay"""
+        if delay_data is None:
+            return 'improve_estimation_process'
         
-        if total_actual_hours == 0:
+        preventability = delay_data.get('preventability_score', 50)
+        if preventability > 70:
+            return 'better_planning_needed'
+        elif preventability < 30:
+            return 'external_factors_consideration'
+        else:
+            return 'process_improvement_opportunity'
+    
+    def calculate_comprehensive_risk_score(self, project, tasks, sentiment_data):
+        """Calculate comprehensive risk score"""
+        return self._comprehensive_risk_score(project, self._delayed_ratio(tasks), sentiment_data)
+    
+    def categorize_risk_level(self, risk_score):
+        """Categorize risk level based on score"""
+        return RISK_LEVEL_LABELS[self._risk_band(risk_score)]
+    
+    def assess_schedule_risk(self, project, tasks):
+        """Assess schedule risk"""
+        return self._schedule_risk(project, _task_stats(tasks)[0]['delayed'], len(tasks))
+    
+    def assess_budget_risk(self, project, tasks):
+        """Assess budget risk"""
+        _, total_estimated, total_actual = _task_stats(tasks)
+        return self._budget_risk(total_estimated, total_actual)
+    
+    def assess_quality_risk(self, project, tasks):
+        """Assess quality risk"""
+        return self._quality_risk(sum(1 for t in tasks if t.get('priority') == 'critical'), len(tasks))
+    
+    def assess_resource_risk(self, project, tasks):
+        """Assess resource risk"""
+        assignee_counts = Counter(t.get('assigneeId') for t in tasks if t.get('assigneeId'))
+        return self._resource_risk(max(assignee_counts.values(), default=0))
+    
+    def assess_technical_risk(self, project, tasks):
+        """Assess technical risk"""
+        complex_tasks = sum(1 for t in tasks if TECHNICAL_RISK_PATTERN.search(t.get('description') or ''))
+        return self._technical_risk(complex_tasks, len(tasks))
+    
+    def identify_primary_risk_factors(self, project, tasks, sentiment_data):
+        """Identify primary risk factors"""
+        return self._primary_risk_factors(project, self._delayed_ratio(tasks), sentiment_data)
+    
+    def assess_mitigation_priority(self, risk_score):
+        """Assess mitigation priority"""
+        return MITIGATION_PRIORITY_LABELS[self._risk_band(risk_score)]
+    
+    def suggest_risk_mitigation_actions(self, project, tasks, risk_score):
+        """Suggest risk mitigation actions"""
+        return MITIGATION_ACTION_LABELS[self._risk_band(risk_score)]
+    
+    def suggest_monitoring_frequency(self, risk_score):
+        """Suggest monitoring frequency based on risk"""
+        return MONITORING_FREQUENCY_LABELS[self._risk_band(risk_score)]
+    
+    def assess_potential_impact(self, project, tasks, risk_score):
+        """Assess potential impact of risks"""
+        return POTENTIAL_IMPACT_LABELS[self._risk_band(risk_score)]
+    
+    def calculate_risk_management_score(self):
+        """Calculate risk management effectiveness score"""
+        return self._risk_management_score(self._count_high_risk_projects())
+    
+    def identify_key_success_factors(self):
+        """Identify key success factors"""
+        return self._key_success_factors(self.calculate_process_maturity_score())
+    
+    def identify_critical_issues(self):
+        """Identify critical issues"""
+        return self._critical_issues(self.calculate_process_maturity_score(), self._count_high_risk_projects())
+    
+    @staticmethod
+    def _risk_band(risk_score):
+        """Index of the RISK_SCORE_BANDS band a score falls in, as the risk report bands them"""
+        return bisect_right(RISK_SCORE_BANDS, risk_score)
+    
+    @staticmethod
+    def _delayed_ratio(tasks):
+        """Share of the tasks that are delayed (0 for no tasks)"""
+        return _task_stats(tasks)[0]['delayed'] / len(tasks) if tasks else 0
+    
+    def _parse_date(self, value):
+        """Scalar form of _parse_dates: a naive local timestamp, NaT when missing or invalid"""
+        return self._parse_dates(pd.DataFrame({'date': [value]}), 'date').iloc[0]
+    
+    def _days_between(self, start, end):
+        """Whole days from start to end, 0 unless both parse"""
+        start_date, end_date = self._parse_date(start), self._parse_date(end)
+        if pd.isna(start_date) or pd.isna(end_date):
+            return 0
+        return (end_date - start_date).days
+    
+    def _report_now(self):
+        """The report run's timestamp, or the current time outside a run"""
+        return self._now_ts if self._now_ts is not None else pd.Timestamp(datetime.now())
+    
+    def _team_productivity(self, status_counts, total_actual_hours):
+        """Calculate team productivity score from the team's task status counts and actual hours"""
+        if not status_counts or total_actual_hours == 0:
             return 0
         
         # Tasks completed per hour
-        productivity = completed_tasks / total_actual_hours * 100
+        productivity = status_counts['completed'] / total_actual_hours * 100
         return min(100, productivity)
     
     def identify_team_domain_focus(self, team, tasks):
@@ -591,19 +1069,16 @@ class EnhancedCSVReportGenerator:
         
         domains = [t.get('domain', '') for t in tasks if t.get('domain')]
         if domains:
-            from collections import Counter
             return Counter(domains).most_common(1)[0][0]
         return 'general'
     
-    def calculate_team_performance_rating(self, team, tasks):
-        """Calculate team performance rating"""
-        if not tasks:
+    def _team_performance_rating(self, status_counts):
+        """Calculate team performance rating from the team's task status counts"""
+        total = status_counts.total()
+        if not total:
             return 'unknown'
         
-        completed_ratio = len([t for t in tasks if t.get('status') == 'completed']) / len(tasks)
-        delayed_ratio = len([t for t in tasks if t.get('status') == 'delayed']) / len(tasks)
-        
-        score = completed_ratio * 100 - delayed_ratio * 50
+        score = self._completion_score(status_counts, total)
         
         if score >= 80:
             return 'excellent'
@@ -614,42 +1089,43 @@ class EnhancedCSVReportGenerator:
         else:
             return 'needs_improvement'
     
+    @staticmethod
+    def _completion_score(status_counts, total):
+        """Completed share minus half the delayed share, as a 0-100 based score"""
+        return status_counts['completed'] / total * 100 - status_counts['delayed'] / total * 50
+    
     def calculate_workload_balance(self, team, tasks):
         """Calculate workload balance score"""
-        member_ids = team.get('memberIds', [])
+        member_ids = self._members_set_by_team.get(team['id'], ())
         if not member_ids or not tasks:
             return 50
         
-        # Simple workload distribution check
-        task_counts = {}
-        for task in tasks:
-            assignee = task.get('assigneeId', '')
-            if assignee in member_ids:
-                task_counts[assignee] = task_counts.get(assignee, 0) + 1
+        # Simple workload distribution check; a team task's assignee is a known member,
+        # so each member's count is the size of their bucket in the assignee index
+        task_counts = np.fromiter(
+            (len(self._tasks_by_assignee[member_id]) for member_id in member_ids
+             if member_id in self._user_by_id and member_id in self._tasks_by_assignee),
+            dtype=np.float64
+        )
         
-        if not task_counts:
+        if task_counts.size == 0:
             return 50
         
-        values = list(task_counts.values())
-        if len(set(values)) == 1:  # Perfect balance
+        if task_counts.min() == task_counts.max():  # Perfect balance
             return 100
         
-        # Calculate variance
-        avg_tasks = sum(values) / len(values)
-        variance = sum((v - avg_tasks) ** 2 for v in values) / len(values)
-        
-        # Convert to balance score (lower variance = higher balance)
-        balance_score = max(0, 100 - (variance * 10))
-        return balance_score
+        # Convert the count variance to a balance score (lower variance = higher balance)
+        return workload_balance_score(task_counts)
     
-    def identify_team_risk_factors(self, team, tasks):
+    def _team_risk_factors(self, team, status_counts):
         """Identify team risk factors"""
         risks = []
         
         if len(team.get('memberIds', [])) < 3:
             risks.append('small_team_size')
         
-        delayed_ratio = len([t for t in tasks if t.get('status') == 'delayed']) / len(tasks) if tasks else 0
+        total = status_counts.total()
+        delayed_ratio = status_counts['delayed'] / total if total else 0
         if delayed_ratio > 0.3:
             risks.append('high_delay_rate')
         
@@ -659,37 +1135,24 @@ class EnhancedCSVReportGenerator:
         return ', '.join(risks) if risks else 'none_identified'
     
     def calculate_days_overdue(self, task):
-        """Calculate days overdue for task"""
-        due = task.get('dueDate')
-        if due:
-            try:
-                due_date = datetime.fromisoformat(due.replace('Z', '+00:00')) if isinstance(due, str) else due
-                days_over = (datetime.now() - due_date).days
-                return max(0, days_over)
-            except:
-                return 0
-        return 0
+        """Calculate days overdue for task (looked up from the per-run bulk parse)"""
+        return self._days_overdue_by_task.get(task.get('id'), 0)
     
-    def categorize_preventability(self, score):
-        """Categorize preventability score"""
-        if score >= 70:
-            return 'highly_preventable'
-        elif score >= 40:
-            return 'moderately_preventable'
-        else:
-            return 'difficult_to_prevent'
+    def check_if_blocks_others(self, task, all_tasks=None):
+        """Check if task blocks other tasks (all_tasks is unused; the dependents index covers every task)"""
+        return task['id'] in self._dependents_by_task
     
     def calculate_delay_impact_on_project(self, task, project_tasks):
         """Calculate impact of delay on overall project"""
         if not project_tasks:
             return 'unknown'
         
-        # Check if task blocks others
-        task_id = task['id']
-        blocking_count = 0
-        for other_task in project_tasks:
-            if task_id in other_task.get('dependencies', []):
-                blocking_count += 1
+        # Check if task blocks others in the same project
+        project_id = task.get('projectId')
+        blocking_count = sum(
+            1 for dependent in self._dependents_by_task.get(task['id'], ())
+            if dependent.get('projectId') == project_id
+        )
         
         if blocking_count > 2:
             return 'high'
@@ -698,56 +1161,6 @@ class EnhancedCSVReportGenerator:
         else:
             return 'low'
     
-    def check_if_blocks_others(self, task, all_tasks):
-        """Check if task blocks other tasks"""
-        task_id = task['id']
-        for other_task in all_tasks:
-            if task_id in other_task.get('dependencies', []):
-                return True
-        return False
-    
-    def assess_delay_severity(self, task, delay_data):
-        """Assess delay severity"""
-        if delay_data is None:
-            return 'medium'
-        
-        category = delay_data.get('delay_category', '')
-        if category in ['technical_complexity', 'dependency_issues']:
-            return 'high'
-        elif category in ['requirement_changes', 'resource_constraints']:
-            return 'medium'
-        else:
-            return 'low'
-    
-    def suggest_delay_action(self, delay_data):
-        """Suggest action for delay"""
-        if delay_data is None:
-            return 'review_and_reassess'
-        
-        category = delay_data.get('delay_category', '')
-        actions = {
-            'technical_complexity': 'allocate_senior_resources',
-            'requirement_changes': 'clarify_requirements',
-            'resource_constraints': 'reallocate_resources',
-            'dependency_issues': 'resolve_blockers',
-            'compliance_requirements': 'engage_compliance_team'
-        }
-        
-        return actions.get(category, 'general_review')
-    
-    def extract_lessons_learned(self, task, delay_data):
-        """Extract lessons learned from delay"""
-        if delay_data is None:
-            return 'improve_estimation_process'
-        
-        preventability = delay_data.get('preventability_score', 50)
-        if preventability > 70:
-            return 'better_planning_needed'
-        elif preventability < 30:
-            return 'external_factors_consideration'
-        else:
-            return 'process_improvement_opportunity'
-    
     def assess_alert_urgency(self, alert):
         """Assess alert urgency"""
         alert_type = alert.get('type', 'minor')
@@ -760,18 +1173,18 @@ class EnhancedCSVReportGenerator:
     
     def assess_alert_impact_scope(self, alert):
         """Assess alert impact scope"""
-        message = alert.get('message', '').lower()
-        if 'project' in message or 'blocking' in message:
+        message = alert.get('message', '')
+        if PROJECT_WIDE_ALERT_PATTERN.search(message):
             return 'project_wide'
-        elif 'task' in message:
+        elif TASK_LEVEL_ALERT_PATTERN.search(message):
             return 'task_level'
         else:
             return 'limited'
     
     # Additional helper methods for comprehensive risk assessment
     
-    def calculate_comprehensive_risk_score(self, project, tasks, sentiment_data):
-        """Calculate comprehensive risk score"""
+    def _comprehensive_risk_score(self, project, delayed_task_ratio, sentiment_data):
+        """Calculate comprehensive risk score from the project's delayed-task share and sentiment"""
         score = 0
         
         # Schedule risk
@@ -779,7 +1192,6 @@ class EnhancedCSVReportGenerator:
             score += 25
         
         # Resource risk
-        delayed_task_ratio = len([t for t in tasks if t.get('status') == 'delayed']) / len(tasks) if tasks else 0
         score += delayed_task_ratio * 30
         
         # Complexity risk
@@ -798,35 +1210,16 @@ class EnhancedCSVReportGenerator:
         
         return min(100, score)
     
-    def categorize_risk_level(self, risk_score):
-        """Categorize risk level based on score"""
-        if risk_score >= 70:
-            return 'critical'
-        elif risk_score >= 50:
-            return 'high'
-        elif risk_score >= 30:
-            return 'medium'
-        else:
-            return 'low'
-    
-    def assess_schedule_risk(self, project, tasks):
+    def _schedule_risk(self, project, delayed_tasks, total_tasks):
         """Assess schedule risk"""
         if project.get('status') == 'delayed':
             return 'high'
         
-        delayed_tasks = len([t for t in tasks if t.get('status') == 'delayed'])
-        if delayed_tasks > len(tasks) * 0.3:
-            return 'high'
-        elif delayed_tasks > len(tasks) * 0.1:
-            return 'medium'
-        else:
-            return 'low'
+        # Above 30% of the tasks delayed is high, above 10% medium
+        return ('low', 'medium', 'high')[bisect_left([total_tasks * 0.1, total_tasks * 0.3], delayed_tasks)]
     
-    def assess_budget_risk(self, project, tasks):
-        """Assess budget risk"""
-        total_estimated = sum(t.get('estimatedHours', 0) for t in tasks)
-        total_actual = sum(t.get('actualHours', 0) for t in tasks if t.get('actualHours'))
-        
+    def _budget_risk(self, total_estimated, total_actual):
+        """Assess budget risk from the project's estimated and actual hour totals"""
         if total_estimated == 0:
             return 'medium'
         
@@ -839,47 +1232,29 @@ class EnhancedCSVReportGenerator:
         else:
             return 'low'
     
-    def assess_quality_risk(self, project, tasks):
+    def _quality_risk(self, high_priority_tasks, total_tasks):
         """Assess quality risk"""
-        # Simple quality risk assessment based on rush indicators
-        high_priority_tasks = len([t for t in tasks if t.get('priority') == 'critical'])
-        if high_priority_tasks > len(tasks) * 0.5:
+        # Simple quality risk assessment based on rush indicators (share of critical tasks)
+        if high_priority_tasks > total_tasks * 0.5:
             return 'high'
-        elif high_priority_tasks > len(tasks) * 0.2:
+        elif high_priority_tasks > total_tasks * 0.2:
             return 'medium'
         else:
             return 'low'
     
-    def assess_resource_risk(self, project, tasks):
-        """Assess resource risk"""
+    def _resource_risk(self, max_tasks):
+        """Assess resource risk from the most tasks held by one assignee (0 when none are assigned)"""
         # Check for overloaded assignees
-        assignee_counts = {}
-        for task in tasks:
-            assignee = task.get('assigneeId', '')
-            if assignee:
-                assignee_counts[assignee] = assignee_counts.get(assignee, 0) + 1
-        
-        if assignee_counts:
-            max_tasks = max(assignee_counts.values())
-            if max_tasks > 5:
-                return 'high'
-            elif max_tasks > 3:
-                return 'medium'
-            else:
-                return 'low'
+        if max_tasks:
+            # More than 5 tasks on one person is high, more than 3 medium
+            return ('low', 'medium', 'high')[bisect_left([3, 5], max_tasks)]
         
         return 'medium'
     
-    def assess_technical_risk(self, project, tasks):
+    def _technical_risk(self, complex_tasks, total_tasks):
         """Assess technical risk"""
-        # Based on complexity of tasks
-        complex_tasks = 0
-        for task in tasks:
-            description = task.get('description', '').lower()
-            if any(word in description for word in ['integration', 'architecture', 'complex', 'migration']):
-                complex_tasks += 1
-        
-        complexity_ratio = complex_tasks / len(tasks) if tasks else 0
+        # Based on the share of tasks whose description matches TECHNICAL_RISK_PATTERN
+        complexity_ratio = complex_tasks / total_tasks if total_tasks else 0
         
         if complexity_ratio > 0.3:
             return 'high'
@@ -888,14 +1263,13 @@ class EnhancedCSVReportGenerator:
         else:
             return 'low'
     
-    def identify_primary_risk_factors(self, project, tasks, sentiment_data):
+    def _primary_risk_factors(self, project, delayed_ratio, sentiment_data):
         """Identify primary risk factors"""
         factors = []
         
         if project.get('status') == 'delayed':
             factors.append('project_delays')
         
-        delayed_ratio = len([t for t in tasks if t.get('status') == 'delayed']) / len(tasks) if tasks else 0
         if delayed_ratio > 0.2:
             factors.append('task_delays')
         
@@ -907,96 +1281,30 @@ class EnhancedCSVReportGenerator:
         
         return ', '.join(factors) if factors else 'none_identified'
     
-    def assess_mitigation_priority(self, risk_score):
-        """Assess mitigation priority"""
-        if risk_score >= 70:
-            return 'immediate'
-        elif risk_score >= 50:
-            return 'high'
-        elif risk_score >= 30:
-            return 'medium'
-        else:
-            return 'low'
-    
-    def suggest_risk_mitigation_actions(self, project, tasks, risk_score):
-        """Suggest risk mitigation actions"""
-        actions = []
-        
-        if risk_score >= 70:
-            actions.append('immediate_review_required')
-            actions.append('escalate_to_management')
-        elif risk_score >= 50:
-            actions.append('additional_resources_needed')
-            actions.append('timeline_adjustment')
-        elif risk_score >= 30:
-            actions.append('increased_monitoring')
-            actions.append('process_improvement')
-        
-        return ', '.join(actions) if actions else 'continue_monitoring'
-    
-    def suggest_monitoring_frequency(self, risk_score):
-        """Suggest monitoring frequency based on risk"""
-        if risk_score >= 70:
-            return 'daily'
-        elif risk_score >= 50:
-            return 'weekly'
-        elif risk_score >= 30:
-            return 'bi_weekly'
-        else:
-            return 'monthly'
-    
-    def assess_potential_impact(self, project, tasks, risk_score):
-        """Assess potential impact of risks"""
-        if risk_score >= 70:
-            return 'project_failure'
-        elif risk_score >= 50:
-            return 'significant_delays'
-        elif risk_score >= 30:
-            return 'minor_delays'
-        else:
-            return 'minimal_impact'
-    
     # Executive dashboard calculations
     
     def calculate_average_project_health(self):
         """Calculate average project health score"""
-        health_scores = []
-        
-        for project in self.nlp_analyzer.data['projects']:
-            project_tasks = [t for t in self.nlp_analyzer.data['tasks'] if t.get('projectId') == project['id']]
-            health_score = self.calculate_health_score(project, project_tasks, None)
-            health_scores.append(health_score)
-        
-        return np.mean(health_scores) if health_scores else 50
+        if self._project_metrics.empty:
+            return 50
+        return self._project_metrics['base_health'].clip(0, 100).mean()
     
     def calculate_overall_team_performance(self):
         """Calculate overall team performance score"""
         team_scores = []
         
-        for team in self.nlp_analyzer.data['teams']:
-            team_tasks = [t for t in self.nlp_analyzer.data['tasks'] 
-                         if any(member_id in [u.get('id') for u in self.nlp_analyzer.data['users'] 
-                               if u.get('id') in team.get('memberIds', [])] 
-                               for member_id in [t.get('assigneeId')])]
+        for team in self._teams:
+            team_tasks = self._tasks_by_team.get(team['id'], [])
             
             if team_tasks:
-                completed_ratio = len([t for t in team_tasks if t.get('status') == 'completed']) / len(team_tasks)
-                delayed_ratio = len([t for t in team_tasks if t.get('status') == 'delayed']) / len(team_tasks)
-                score = completed_ratio * 100 - delayed_ratio * 50
-                team_scores.append(max(0, score))
+                status_counts = _task_stats(team_tasks)[0]
+                team_scores.append(max(0, self._completion_score(status_counts, len(team_tasks))))
         
-        return np.mean(team_scores) if team_scores else 50
+        return statistics.fmean(team_scores) if team_scores else 50
     
-    def calculate_risk_management_score(self):
+    def _risk_management_score(self, high_risk_projects):
         """Calculate risk management effectiveness score"""
-        high_risk_projects = 0
-        total_projects = len(self.nlp_analyzer.data['projects'])
-        
-        for project in self.nlp_analyzer.data['projects']:
-            project_tasks = [t for t in self.nlp_analyzer.data['tasks'] if t.get('projectId') == project['id']]
-            risk_level = self.assess_project_risk_level(project, project_tasks)
-            if risk_level == 'high':
-                high_risk_projects += 1
+        total_projects = len(self._projects)
         
         if total_projects == 0:
             return 50
@@ -1004,72 +1312,60 @@ class EnhancedCSVReportGenerator:
         risk_ratio = high_risk_projects / total_projects
         return max(0, 100 - (risk_ratio * 100))
     
+    def _count_high_risk_projects(self):
+        """Number of projects whose risk level is 'high'"""
+        if self._project_metrics.empty:
+            return 0
+        return int((self._project_metrics['risk_level'] == 'high').sum())
+    
     def calculate_process_maturity_score(self):
         """Calculate process maturity score"""
         # Simple process maturity based on estimation accuracy
-        accurate_estimations = 0
-        total_estimations = 0
-        
-        for task in self.nlp_analyzer.data['tasks']:
-            estimated = task.get('estimatedHours', 0)
-            actual = task.get('actualHours', 0)
-            
-            if estimated > 0 and actual > 0:
-                ratio = actual / estimated
-                if 0.8 <= ratio <= 1.2:
-                    accurate_estimations += 1
-                total_estimations += 1
+        accurate_estimations, total_estimations = estimation_accuracy_counts(
+            self._column(self.tasks_df, 'estimatedHours', 0).to_numpy(dtype=np.float64),
+            self._column(self.tasks_df, 'actualHours', 0).to_numpy(dtype=np.float64)
+        )
         
         if total_estimations == 0:
             return 50
         
         return (accurate_estimations / total_estimations) * 100
     
-    def identify_key_success_factors(self):
+    def _key_success_factors(self, process_maturity):
         """Identify key success factors"""
         factors = []
         
         # High completion rate
-        total_tasks = len(self.nlp_analyzer.data['tasks'])
-        completed_tasks = len([t for t in self.nlp_analyzer.data['tasks'] if t.get('status') == 'completed'])
-        if completed_tasks / total_tasks > 0.7:
+        task_status_counts = self._task_totals[0]
+        total_tasks = len(self._tasks)
+        if total_tasks and task_status_counts['completed'] / total_tasks > 0.7:
             factors.append('high_completion_rate')
         
         # Good estimation accuracy
-        process_maturity = self.calculate_process_maturity_score()
         if process_maturity > 70:
             factors.append('accurate_estimations')
         
         # Low delay rate
-        delayed_tasks = len([t for t in self.nlp_analyzer.data['tasks'] if t.get('status') == 'delayed'])
-        if delayed_tasks / total_tasks < 0.2:
+        if total_tasks and task_status_counts['delayed'] / total_tasks < 0.2:
             factors.append('low_delay_rate')
         
         return ', '.join(factors) if factors else 'consistent_execution'
     
-    def identify_critical_issues(self):
+    def _critical_issues(self, process_maturity, high_risk_count):
         """Identify critical issues"""
         issues = []
         
         # High delay rate
-        total_tasks = len(self.nlp_analyzer.data['tasks'])
-        delayed_tasks = len([t for t in self.nlp_analyzer.data['tasks'] if t.get('status') == 'delayed'])
-        if delayed_tasks / total_tasks > 0.3:
+        total_tasks = len(self._tasks)
+        if total_tasks and self._task_totals[0]['delayed'] / total_tasks > 0.3:
             issues.append('high_delay_rate')
         
         # Poor estimation accuracy
-        process_maturity = self.calculate_process_maturity_score()
         if process_maturity < 40:
             issues.append('poor_estimation_accuracy')
         
         # Multiple high-risk projects
-        high_risk_count = 0
-        for project in self.nlp_analyzer.data['projects']:
-            project_tasks = [t for t in self.nlp_analyzer.data['tasks'] if t.get('projectId') == project['id']]
-            if self.assess_project_risk_level(project, project_tasks) == 'high':
-                high_risk_count += 1
-        
-        if high_risk_count > len(self.nlp_analyzer.data['projects']) * 0.3:
+        if high_risk_count > len(self._projects) * 0.3:
             issues.append('multiple_high_risk_projects')
         
         return ', '.join(issues) if issues else 'none_identified'
@@ -1080,15 +1376,17 @@ def main():
     print("Starting Enhanced CSV Report Generation with Hugging Face NLP Analysis...")
     
     generator = EnhancedCSVReportGenerator()
-    reports = generator.generate_comprehensive_reports()
+    # Streamed straight to disk; generate_comprehensive_reports() returns the DataFrames instead
+    reports = generator.write_comprehensive_reports()
     
     print("\n" + "="*80)
     print("CSV REPORT GENERATION COMPLETE")
     print("="*80)
     
-    for report_name, df in reports.items():
-        if not df.empty:
-            print(f"✓ {report_name.replace('_', ' ').title()}: {len(df)} rows, {len(df.columns)} columns")
+    for report_name in REPORT_NAMES:
+        saved = reports.get(report_name)
+        if saved:
+            print(f"✓ {report_name.replace('_', ' ').title()}: {saved['rows']} rows, {len(saved['columns'])} columns")
         else:
             print(f"⚠ {report_name.replace('_', ' ').title()}: No data available")
     
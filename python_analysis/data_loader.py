@@ -8,13 +8,60 @@ import numpy as np
 from datetime import datetime, timedelta
 from sqlalchemy import create_engine, text
 from typing import Dict, List, Tuple, Optional
-import json
-from config import DATABASE_URL, DATABASE_HOST, DATABASE_PORT, DATABASE_NAME, DATABASE_USER, DATABASE_PASSWORD
+import orjson
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config import (
+    DATABASE_URL, DATABASE_HOST, DATABASE_PORT, DATABASE_NAME, DATABASE_USER, DATABASE_PASSWORD,
+    DATABASE_FETCH_CHUNK_SIZE, DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW, DATABASE_POOL_TIMEOUT, DATABASE_POOL_RECYCLE,
+    DATA_CACHE_MAX_AGE
+)
+
+# Pool settings for both engine URLs; pre-ping replaces connections the server has dropped
+ENGINE_POOL_OPTIONS = {
+    'pool_size': DATABASE_POOL_SIZE,
+    'max_overflow': DATABASE_MAX_OVERFLOW,
+    'pool_timeout': DATABASE_POOL_TIMEOUT,
+    'pool_recycle': DATABASE_POOL_RECYCLE,
+    'pool_pre_ping': True
+}
+
+# Ordered levels for the *_numeric encodings (code = position + 1). Unknown or missing values
+# get code 0, so they never look like a real level
+ROLE_LEVELS = ['member', 'leader', 'manager', 'administrator']
+PROJECT_STATUS_LEVELS = ['planning', 'in_progress', 'delayed', 'completed']
+TASK_PRIORITY_LEVELS = ['low', 'medium', 'high', 'critical']
+TASK_STATUS_LEVELS = ['todo', 'in_progress', 'review', 'completed', 'delayed']
+ALERT_TYPE_LEVELS = ['minor', 'major', 'critical']
+
+# Columns fetched from each table, in order. The queries select exactly these and the mock
+# generators build frames with the same columns, so both paths give the same schema
+TABLE_COLUMNS = {
+    'users': ['id', 'name', 'role', 'created_at'],
+    'projects': ['id', 'name', 'status', 'progress', 'start_date', 'end_date', 'domains', 'created_at'],
+    'tasks': ['id', 'title', 'status', 'priority', 'assignee_id', 'project_id', 'domain', 'estimated_hours',
+              'actual_hours', 'start_date', 'due_date', 'completed_date', 'dependencies', 'created_at'],
+    'teams': ['id', 'name', 'member_ids', 'skills', 'created_at'],
+    'delay_alerts': ['id', 'type', 'title', 'task_id', 'project_id', 'is_resolved', 'created_at']
+}
+
+# Timezone that timestamptz values are converted to, so they compare with naive local "now"
+LOCAL_TIMEZONE = datetime.now().astimezone().tzinfo
+
+# Cumulative row-change counters of a table; any insert, update or delete changes them
+FRESHNESS_QUERY = text("""
+    SELECT n_tup_ins, n_tup_upd, n_tup_del
+    FROM pg_stat_user_tables
+    WHERE relname = :table
+""")
 
 class DataLoader:
     def __init__(self):
         """Initialize database connection."""
         self.engine = None
+        self._table_cache = {}  # table -> (freshness token, load time, processed DataFrame)
+        self._table_cache_lock = threading.Lock()
         self.connect_to_database()
     
     def connect_to_database(self):
@@ -22,11 +69,14 @@ class DataLoader:
         try:
             # Try using DATABASE_URL first
             if DATABASE_URL and DATABASE_URL != 'postgresql://localhost:5432/smartprojectpulse':
-                self.engine = create_engine(DATABASE_URL)
+                self.engine = create_engine(DATABASE_URL, **ENGINE_POOL_OPTIONS)
             else:
                 # Fall back to individual parameters
                 connection_string = f"postgresql://{DATABASE_USER}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}"
-                self.engine = create_engine(connection_string)
+                self.engine = create_engine(connection_string, **ENGINE_POOL_OPTIONS)
+            
+            # Server-side cursors, so chunked reads stream rows instead of buffering the whole result
+            self.engine = self.engine.execution_options(stream_results=True)
             
             # Test connection
             with self.engine.connect() as conn:
@@ -44,79 +94,37 @@ class DataLoader:
             return self._generate_mock_users()
         
         try:
-            query = """
-            SELECT 
-                id,
-                email,
-                name,
-                role,
-                created_at
-            FROM users
-            """
-            df = pd.read_sql(query, self.engine)
-            return self._process_users_data(df)
+            query = self._select_query('users')
+            return self._load_table('users', query, self._process_users_data)
         except Exception as e:
             print(f"Error loading users data: {e}")
             return self._generate_mock_users()
     
-    def load_projects_data(self) -> pd.DataFrame:
-        """Load and process projects data."""
+    def load_projects_data(self, since: Optional[datetime] = None, project_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load and process projects data, optionally only rows created since a date or in the given projects."""
         if self.engine is None:
-            return self._generate_mock_projects()
+            return self._filter_frame(self._generate_mock_projects(), since, project_ids, 'id')
         
         try:
-            query = """
-            SELECT 
-                id,
-                name,
-                description,
-                status,
-                progress,
-                start_date,
-                end_date,
-                team_id,
-                manager_id,
-                domains,
-                created_at
-            FROM projects
-            """
-            df = pd.read_sql(query, self.engine)
-            return self._process_projects_data(df)
+            query = self._select_query('projects')
+            query, params = self._filtered_query(query, since, project_ids, 'id')
+            return self._load_table('projects', query, self._process_projects_data, params)
         except Exception as e:
             print(f"Error loading projects data: {e}")
-            return self._generate_mock_projects()
+            return self._filter_frame(self._generate_mock_projects(), since, project_ids, 'id')
     
-    def load_tasks_data(self) -> pd.DataFrame:
-        """Load and process tasks data."""
+    def load_tasks_data(self, since: Optional[datetime] = None, project_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load and process tasks data, optionally only rows created since a date or in the given projects."""
         if self.engine is None:
-            return self._generate_mock_tasks()
+            return self._filter_frame(self._generate_mock_tasks(), since, project_ids, 'project_id')
         
         try:
-            query = """
-            SELECT 
-                id,
-                title,
-                description,
-                status,
-                priority,
-                assignee_id,
-                project_id,
-                domain,
-                estimated_hours,
-                actual_hours,
-                start_date,
-                due_date,
-                completed_date,
-                dependencies,
-                delay_reason,
-                created_at
-            FROM tasks
-            """
-            df = pd.read_sql(query, self.engine)
-            return self._process_tasks_data(df)
+            query = self._select_query('tasks')
+            query, params = self._filtered_query(query, since, project_ids, 'project_id')
+            return self._load_table('tasks', query, self._process_tasks_data, params)
         except Exception as e:
             print(f"Error loading tasks data: {e}")
-            return self._generate_mock_tasks()
+            return self._filter_frame(self._generate_mock_tasks(), since, project_ids, 'project_id')
     
     def load_teams_data(self) -> pd.DataFrame:
         """Load and process teams data."""
@@ -124,97 +132,189 @@ class DataLoader:
             return self._generate_mock_teams()
         
         try:
-            query = """
-            SELECT 
-                id,
-                name,
-                description,
-                leader_id,
-                member_ids,
-                skills,
-                created_at
-            FROM teams
-            """
-            df = pd.read_sql(query, self.engine)
-            return self._process_teams_data(df)
+            query = self._select_query('teams')
+            return self._load_table('teams', query, self._process_teams_data)
         except Exception as e:
             print(f"Error loading teams data: {e}")
             return self._generate_mock_teams()
     
-    def load_delay_alerts_data(self) -> pd.DataFrame:
-        """Load and process delay alerts data."""
+    def load_delay_alerts_data(self, since: Optional[datetime] = None, project_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load and process delay alerts data, optionally only rows created since a date or in the given projects."""
         if self.engine is None:
-            return self._generate_mock_delay_alerts()
+            return self._filter_frame(self._generate_mock_delay_alerts(), since, project_ids, 'project_id')
         
         try:
-            query = """
-            SELECT 
-                id,
-                type,
-                title,
-                message,
-                task_id,
-                project_id,
-                is_resolved,
-                notification_sent,
-                created_at
-            FROM delay_alerts
-            """
-            df = pd.read_sql(query, self.engine)
-            return self._process_delay_alerts_data(df)
+            query = self._select_query('delay_alerts')
+            query, params = self._filtered_query(query, since, project_ids, 'project_id')
+            return self._load_table('delay_alerts', query, self._process_delay_alerts_data, params)
         except Exception as e:
             print(f"Error loading delay alerts data: {e}")
-            return self._generate_mock_delay_alerts()
+            return self._filter_frame(self._generate_mock_delay_alerts(), since, project_ids, 'project_id')
+    
+    def _load_table(self, table: str, query: str, process, params: Optional[Dict] = None) -> pd.DataFrame:
+        """Load and process a table, reusing the last result while the table is unchanged and fresh.
+        Filtered reads (params given) are partial tables, so they bypass the cache."""
+        if params:
+            return self._read_processed(text(query).bindparams(**params), process)
+        
+        token = self._freshness_token(table)
+        with self._table_cache_lock:
+            cached = self._table_cache.get(table)
+        if token is not None and cached is not None and cached[0] == token and time.time() - cached[1] < DATA_CACHE_MAX_AGE:
+            return cached[2].copy()
+        
+        loaded_at = time.time()
+        df = self._read_processed(query, process)
+        if token is not None:
+            with self._table_cache_lock:
+                self._table_cache[table] = (token, loaded_at, df)
+            return df.copy()
+        return df
+    
+    def _freshness_token(self, table: str) -> Optional[Tuple[int, int, int]]:
+        """Write counters for a table, or None when they are unavailable (no caching then)."""
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(FRESHNESS_QUERY, {'table': table}).first()
+            return tuple(row) if row is not None else None
+        except Exception as e:
+            print(f"Could not read freshness of {table}: {e}")
+            return None
+    
+    def _read_processed(self, query, process) -> pd.DataFrame:
+        """Stream a query in DATABASE_FETCH_CHUNK_SIZE chunks, processing each chunk before the next fetch.
+        Empty chunks are skipped; a query matching no rows gives an empty frame with the processed columns."""
+        processed = []
+        empty_chunk = None
+        for chunk in pd.read_sql(query, self.engine, chunksize=DATABASE_FETCH_CHUNK_SIZE):
+            if chunk.empty:
+                if empty_chunk is None:
+                    empty_chunk = chunk
+                continue
+            processed.append(process(chunk))
+        
+        if not processed:
+            # Processing the empty chunk keeps the schema, derived columns included
+            return process(empty_chunk) if empty_chunk is not None else pd.DataFrame()
+        return pd.concat(processed, ignore_index=True)
+    
+    @staticmethod
+    def _select_query(table: str) -> str:
+        """SELECT of the table's TABLE_COLUMNS."""
+        columns = ',\n                '.join(TABLE_COLUMNS[table])
+        return f"""
+            SELECT 
+                {columns}
+            FROM {table}
+            """
+    
+    @staticmethod
+    def _filtered_query(query: str, since: Optional[datetime], project_ids: Optional[List[str]],
+                        project_column: str) -> Tuple[str, Dict]:
+        """Append WHERE conditions for the optional filters; returns the query and its bind parameters."""
+        conditions = []
+        params = {}
+        if since is not None:
+            conditions.append("created_at >= :since")
+            params['since'] = since
+        if project_ids is not None:
+            conditions.append(f"{project_column} = ANY(:project_ids)")
+            params['project_ids'] = list(project_ids)
+        if conditions:
+            query = f"{query.rstrip()}\n            WHERE {' AND '.join(conditions)}\n            "
+        return query, params
+    
+    @staticmethod
+    def _filter_frame(df: pd.DataFrame, since: Optional[datetime], project_ids: Optional[List[str]],
+                      project_column: str) -> pd.DataFrame:
+        """Apply the optional loader filters to an already-loaded frame (mock data path)."""
+        if since is not None:
+            df = df[df['created_at'] >= pd.Timestamp(since)]
+        if project_ids is not None:
+            df = df[df[project_column].isin(project_ids)]
+        return df.reset_index(drop=True)
+    
+    @staticmethod
+    def _to_local_datetime(values: pd.Series) -> pd.Series:
+        """Parse a column to naive datetime64; timezone-aware values (timestamptz columns come back
+        from psycopg2 with an offset) are converted to local wall time first."""
+        try:
+            dates = pd.to_datetime(values)
+        except ValueError:
+            dates = None
+        if dates is None or dates.dtype == object:
+            # Offsets that differ between rows (e.g. across DST) only parse via UTC
+            dates = pd.to_datetime(values, utc=True)
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_convert(LOCAL_TIMEZONE).dt.tz_localize(None)
+        return dates
+    
+    @staticmethod
+    def _encode_levels(values: pd.Series, levels: List[str]) -> pd.Series:
+        """1-based position of each value in levels, always int8; unknown or missing values are 0."""
+        codes = pd.Index(levels).get_indexer(values)
+        return pd.Series(codes.astype(np.int8) + 1, index=values.index)
+    
+    @staticmethod
+    def _json_list_length(values: pd.Series) -> pd.Series:
+        """Element count of a column holding JSON array strings or already-decoded lists;
+        nulls and strings that are not JSON arrays count as 0."""
+        is_str = values.map(type).eq(str)
+        lengths = values.where(~is_str).map(len, na_action='ignore')
+        
+        # Only array literals reach the decoder; blank or 'null' strings stay at 0
+        strings = values[is_str]
+        arrays = strings[strings.str.lstrip().str.startswith('[')]
+        lengths[arrays.index] = arrays.map(orjson.loads).map(len)
+        return lengths.fillna(0).astype(int)
     
     def _process_users_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process users data for analysis."""
-        df['created_at'] = pd.to_datetime(df['created_at'])
-        role_mapping = {
-            'administrator': 4,
-            'manager': 3,
-            'leader': 2,
-            'member': 1
-        }
-        df['role_numeric'] = df['role'].map(role_mapping)
+        df['created_at'] = self._to_local_datetime(df['created_at'])
+        df['role_numeric'] = self._encode_levels(df['role'], ROLE_LEVELS)
         return df
     
     def _process_projects_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process projects data for analysis."""
-        df['start_date'] = pd.to_datetime(df['start_date'])
-        df['end_date'] = pd.to_datetime(df['end_date'])
-        df['created_at'] = pd.to_datetime(df['created_at'])
+        df['start_date'] = self._to_local_datetime(df['start_date'])
+        df['end_date'] = self._to_local_datetime(df['end_date'])
+        df['created_at'] = self._to_local_datetime(df['created_at'])
+        now = pd.Timestamp.now()
         
         # Calculate project duration and complexity
         df['duration_days'] = (df['end_date'] - df['start_date']).dt.days
-        df['days_elapsed'] = (datetime.now() - df['start_date']).dt.days
-        df['days_remaining'] = (df['end_date'] - datetime.now()).dt.days
+        # Missing start/end dates count as 0 days, keeping these columns integer
+        df['days_elapsed'] = (now - df['start_date']).dt.days.fillna(0).astype(np.int64)
+        df['days_remaining'] = (df['end_date'] - now).dt.days.fillna(0).astype(np.int64)
         
         # Parse domains if it's a JSON string
         if 'domains' in df.columns:
-            df['domain_count'] = df['domains'].apply(lambda x: len(json.loads(x)) if isinstance(x, str) else len(x) if x else 0)
+            df['domain_count'] = self._json_list_length(df['domains'])
         
         # Status numeric mapping
-        status_mapping = {
-            'planning': 1,
-            'in_progress': 2,
-            'delayed': 3,
-            'completed': 4
-        }
-        df['status_numeric'] = df['status'].map(status_mapping)
+        df['status_numeric'] = self._encode_levels(df['status'], PROJECT_STATUS_LEVELS)
         
         return df
     
     def _process_tasks_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process tasks data for analysis."""
-        df['start_date'] = pd.to_datetime(df['start_date'])
-        df['due_date'] = pd.to_datetime(df['due_date'])
-        df['completed_date'] = pd.to_datetime(df['completed_date'])
-        df['created_at'] = pd.to_datetime(df['created_at'])
+        df['start_date'] = self._to_local_datetime(df['start_date'])
+        df['due_date'] = self._to_local_datetime(df['due_date'])
+        df['completed_date'] = self._to_local_datetime(df['completed_date'])
+        df['created_at'] = self._to_local_datetime(df['created_at'])
+        now = pd.Timestamp.now()
         
         # Calculate time-based features
+        # The due date delta is taken once and shared by the overdue and delay columns.
+        # Whole days are floored as timedelta.days does, so a deadline later today is
+        # 0 days away; a missing due date counts as 0 days (never overdue, no delay)
+        to_deadline = df['due_date'] - now
+        days_to_deadline = to_deadline.dt.days.fillna(0).to_numpy(np.int64)
+        days_past_due = (-to_deadline).dt.days.fillna(0).to_numpy(np.int64)
+        days_completed_late = (df['completed_date'] - df['due_date']).dt.days.fillna(0).to_numpy(np.int64)
         df['planned_duration'] = (df['due_date'] - df['start_date']).dt.days
-        df['days_to_deadline'] = (df['due_date'] - datetime.now()).dt.days
-        df['is_overdue'] = df['days_to_deadline'] < 0
+        df['days_to_deadline'] = days_to_deadline
+        df['is_overdue'] = days_to_deadline < 0
         
         # Calculate actual duration for completed tasks
         df['actual_duration'] = np.where(
@@ -224,109 +324,84 @@ class DataLoader:
         )
         
         # Calculate delay days
-        df['delay_days'] = np.where(
+        df['delay_days'] = np.maximum(0, np.where(
             df['completed_date'].notna(),
-            np.maximum(0, (df['completed_date'] - df['due_date']).dt.days),
-            np.maximum(0, (datetime.now() - df['due_date']).dt.days)
-        )
+            days_completed_late,
+            days_past_due
+        ))
         
         # Priority and status numeric mapping
-        priority_mapping = {
-            'low': 1,
-            'medium': 2,
-            'high': 3,
-            'critical': 4
-        }
-        df['priority_numeric'] = df['priority'].map(priority_mapping)
-        
-        status_mapping = {
-            'todo': 1,
-            'in_progress': 2,
-            'review': 3,
-            'completed': 4,
-            'delayed': 5
-        }
-        df['status_numeric'] = df['status'].map(status_mapping)
+        df['priority_numeric'] = self._encode_levels(df['priority'], TASK_PRIORITY_LEVELS)
+        df['status_numeric'] = self._encode_levels(df['status'], TASK_STATUS_LEVELS)
         
         # Parse dependencies
         if 'dependencies' in df.columns:
-            df['dependency_count'] = df['dependencies'].apply(
-                lambda x: len(json.loads(x)) if isinstance(x, str) else len(x) if x else 0
-            )
+            df['dependency_count'] = self._json_list_length(df['dependencies'])
         
         # Progress ratio
-        df['progress_ratio'] = df.apply(lambda row: 
-            min(row.get('actual_hours', 0) / max(row.get('estimated_hours', 1), 1), 2.0), axis=1
-        )
+        actual_hours = pd.to_numeric(df['actual_hours'], errors='coerce').to_numpy(dtype=np.float64)
+        estimated_hours = pd.to_numeric(df['estimated_hours'], errors='coerce').to_numpy(dtype=np.float64)
+        df['progress_ratio'] = np.minimum(actual_hours / np.maximum(estimated_hours, 1), 2.0)
         
         return df
     
     def _process_teams_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process teams data for analysis."""
-        df['created_at'] = pd.to_datetime(df['created_at'])
+        df['created_at'] = self._to_local_datetime(df['created_at'])
         
         # Parse member_ids and skills if they're JSON strings
         if 'member_ids' in df.columns:
-            df['team_size'] = df['member_ids'].apply(
-                lambda x: len(json.loads(x)) if isinstance(x, str) else len(x) if x else 0
-            )
+            df['team_size'] = self._json_list_length(df['member_ids'])
         
         if 'skills' in df.columns:
-            df['skill_count'] = df['skills'].apply(
-                lambda x: len(json.loads(x)) if isinstance(x, str) else len(x) if x else 0
-            )
+            df['skill_count'] = self._json_list_length(df['skills'])
         
         return df
     
     def _process_delay_alerts_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process delay alerts data for analysis."""
-        df['created_at'] = pd.to_datetime(df['created_at'])
+        df['created_at'] = self._to_local_datetime(df['created_at'])
         
         # Type numeric mapping
-        type_mapping = {
-            'minor': 1,
-            'major': 2,
-            'critical': 3
-        }
-        df['type_numeric'] = df['type'].map(type_mapping)
+        df['type_numeric'] = self._encode_levels(df['type'], ALERT_TYPE_LEVELS)
         
         return df
     
     def _generate_mock_users(self) -> pd.DataFrame:
         """Generate mock users data for testing when database is unavailable."""
         mock_users = [
-            {'id': 'usr1', 'email': 'admin@company.com', 'name': 'System Administrator', 'role': 'administrator', 'created_at': datetime.now() - timedelta(days=365)},
-            {'id': 'usr2', 'email': 'manager@company.com', 'name': 'Alex Manager', 'role': 'manager', 'created_at': datetime.now() - timedelta(days=300)},
-            {'id': 'usr3', 'email': 'leader1@company.com', 'name': 'Sarah Johnson', 'role': 'leader', 'created_at': datetime.now() - timedelta(days=250)},
-            {'id': 'usr4', 'email': 'mike@company.com', 'name': 'Mike Chen', 'role': 'member', 'created_at': datetime.now() - timedelta(days=200)},
-            {'id': 'usr5', 'email': 'emma@company.com', 'name': 'Emma Davis', 'role': 'member', 'created_at': datetime.now() - timedelta(days=150)},
+            {'id': 'usr1', 'name': 'System Administrator', 'role': 'administrator', 'created_at': datetime.now() - timedelta(days=365)},
+            {'id': 'usr2', 'name': 'Alex Manager', 'role': 'manager', 'created_at': datetime.now() - timedelta(days=300)},
+            {'id': 'usr3', 'name': 'Sarah Johnson', 'role': 'leader', 'created_at': datetime.now() - timedelta(days=250)},
+            {'id': 'usr4', 'name': 'Mike Chen', 'role': 'member', 'created_at': datetime.now() - timedelta(days=200)},
+            {'id': 'usr5', 'name': 'Emma Davis', 'role': 'member', 'created_at': datetime.now() - timedelta(days=150)},
         ]
-        df = pd.DataFrame(mock_users)
+        df = pd.DataFrame(mock_users, columns=TABLE_COLUMNS['users'])
         return self._process_users_data(df)
     
     def _generate_mock_projects(self) -> pd.DataFrame:
         """Generate mock projects data for testing."""
         mock_projects = [
             {
-                'id': 'proj1', 'name': 'E-commerce Redesign', 'description': 'Complete redesign of e-commerce platform',
+                'id': 'proj1', 'name': 'E-commerce Redesign',
                 'status': 'in_progress', 'progress': 65, 'start_date': datetime.now() - timedelta(days=90),
-                'end_date': datetime.now() + timedelta(days=30), 'team_id': 'team1', 'manager_id': 'usr2',
+                'end_date': datetime.now() + timedelta(days=30),
                 'domains': '["frontend", "backend", "ui/ux"]', 'created_at': datetime.now() - timedelta(days=100)
             },
             {
-                'id': 'proj2', 'name': 'Mobile App Development', 'description': 'New mobile application',
+                'id': 'proj2', 'name': 'Mobile App Development',
                 'status': 'delayed', 'progress': 40, 'start_date': datetime.now() - timedelta(days=120),
-                'end_date': datetime.now() + timedelta(days=60), 'team_id': 'team1', 'manager_id': 'usr2',
+                'end_date': datetime.now() + timedelta(days=60),
                 'domains': '["mobile", "api", "testing"]', 'created_at': datetime.now() - timedelta(days=130)
             },
             {
-                'id': 'proj3', 'name': 'Data Analytics Dashboard', 'description': 'Business intelligence dashboard',
+                'id': 'proj3', 'name': 'Data Analytics Dashboard',
                 'status': 'completed', 'progress': 100, 'start_date': datetime.now() - timedelta(days=200),
-                'end_date': datetime.now() - timedelta(days=30), 'team_id': 'team1', 'manager_id': 'usr2',
+                'end_date': datetime.now() - timedelta(days=30),
                 'domains': '["analytics", "visualization", "data"]', 'created_at': datetime.now() - timedelta(days=210)
             }
         ]
-        df = pd.DataFrame(mock_projects)
+        df = pd.DataFrame(mock_projects, columns=TABLE_COLUMNS['projects'])
         return self._process_projects_data(df)
     
     def _generate_mock_tasks(self) -> pd.DataFrame:
@@ -347,7 +422,6 @@ class DataLoader:
             mock_tasks.append({
                 'id': f'task{i+1}',
                 'title': title,
-                'description': f'Description for {title}',
                 'status': np.random.choice(statuses),
                 'priority': np.random.choice(priorities),
                 'assignee_id': f'usr{np.random.randint(3, 6)}',
@@ -359,24 +433,23 @@ class DataLoader:
                 'due_date': datetime.now() + timedelta(days=np.random.randint(-10, 30)),
                 'completed_date': datetime.now() - timedelta(days=np.random.randint(1, 10)) if np.random.random() > 0.6 else None,
                 'dependencies': '[]',
-                'delay_reason': 'Technical complexity' if np.random.random() > 0.8 else None,
                 'created_at': datetime.now() - timedelta(days=np.random.randint(10, 100))
             })
         
-        df = pd.DataFrame(mock_tasks)
+        df = pd.DataFrame(mock_tasks, columns=TABLE_COLUMNS['tasks'])
         return self._process_tasks_data(df)
     
     def _generate_mock_teams(self) -> pd.DataFrame:
         """Generate mock teams data for testing."""
         mock_teams = [
             {
-                'id': 'team1', 'name': 'Development Team Alpha', 'description': 'Primary development team',
-                'leader_id': 'usr3', 'member_ids': '["usr4", "usr5"]', 
+                'id': 'team1', 'name': 'Development Team Alpha',
+                'member_ids': '["usr4", "usr5"]', 
                 'skills': '["React", "Node.js", "TypeScript", "UI/UX", "Testing"]',
                 'created_at': datetime.now() - timedelta(days=200)
             }
         ]
-        df = pd.DataFrame(mock_teams)
+        df = pd.DataFrame(mock_teams, columns=TABLE_COLUMNS['teams'])
         return self._process_teams_data(df)
     
     def _generate_mock_delay_alerts(self) -> pd.DataFrame:
@@ -389,23 +462,28 @@ class DataLoader:
                 'id': f'alert{i+1}',
                 'type': np.random.choice(alert_types),
                 'title': f'Delay Alert {i+1}',
-                'message': f'Task is delayed due to various reasons',
                 'task_id': f'task{np.random.randint(1, 13)}',
                 'project_id': f'proj{np.random.randint(1, 4)}',
                 'is_resolved': np.random.choice([True, False]),
-                'notification_sent': True,
                 'created_at': datetime.now() - timedelta(days=np.random.randint(1, 30))
             })
         
-        df = pd.DataFrame(mock_alerts)
+        df = pd.DataFrame(mock_alerts, columns=TABLE_COLUMNS['delay_alerts'])
         return self._process_delay_alerts_data(df)
     
-    def get_comprehensive_dataset(self) -> Dict[str, pd.DataFrame]:
-        """Load all data and return as a dictionary of DataFrames."""
-        return {
-            'users': self.load_users_data(),
-            'projects': self.load_projects_data(),
-            'tasks': self.load_tasks_data(),
-            'teams': self.load_teams_data(),
-            'delay_alerts': self.load_delay_alerts_data()
-        }
\ No newline at end of file
+    def get_comprehensive_dataset(self, since: Optional[datetime] = None,
+                                  project_ids: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """Load all data and return as a dictionary of DataFrames.
+        The loaders are independent, so they run concurrently, each on its own pooled connection.
+        since/project_ids narrow the projects, tasks and delay alerts; users and teams are always loaded in full."""
+        filters = {'since': since, 'project_ids': project_ids}
+        loaders = {
+            'users': (self.load_users_data, {}),
+            'projects': (self.load_projects_data, filters),
+            'tasks': (self.load_tasks_data, filters),
+            'teams': (self.load_teams_data, {}),
+            'delay_alerts': (self.load_delay_alerts_data, filters)
+        }
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = {name: executor.submit(loader, **kwargs) for name, (loader, kwargs) in loaders.items()}
+            return {name: future.result() for name, future in futures.items()}
\ No newline at end of file
@@ -3,8 +3,17 @@ Data visualization module for creating insightful charts and plots.
 Generates various visualizations for project delay analysis and predictions.
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Use the non-interactive Agg backend for batch/server runs so no GUI toolkit is loaded
+if not sys.stdout.isatty() or (sys.platform.startswith('linux') and
+                               not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
@@ -85,7 +94,7 @@ class DataVisualizer:
         # Create timeline bars
         y_positions = range(len(projects_df))
         
-        for i, (_, project) in enumerate(projects_df.iterrows()):
+        for i, project in enumerate(projects_df.to_dict('records')):
             # Determine color based on status
             color = {
                 'planning': '#FFE66D',
@@ -391,7 +400,7 @@ class DataVisualizer:
         
         y_positions = range(len(timeline_projects))
         
-        for i, (_, project) in enumerate(timeline_projects.iterrows()):
+        for i, project in enumerate(timeline_projects.to_dict('records')):
             color = {
                 'planning': '#FFE66D',
                 'in_progress': '#4ECDC4', 
@@ -11,23 +11,87 @@ from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.metrics import mean_squared_error, classification_report, confusion_matrix
 from datetime import datetime, timedelta
 import joblib
+from joblib import Memory
 import warnings
 from typing import Dict, List, Tuple, Optional, Any
 from data_loader import DataLoader
-from config import PREDICTION_FEATURES, DELAY_THRESHOLDS, MODEL_CONFIG, TRAINING_CONFIG
+from jit_kernels import task_feature_matrix, delay_risk_scores
+from config import PREDICTION_FEATURES, DELAY_THRESHOLDS, MODEL_CONFIG, TRAINING_CONFIG, MODEL_CACHE_MAX_BYTES
 
 warnings.filterwarnings('ignore')
 
+# Default values for features missing from a task
+FEATURE_DEFAULTS = {
+    'estimated_hours': 24,
+    'progress_ratio': 0.5,
+    'dependency_count': 0,
+    'team_size': 3,
+    'priority_numeric': 2,
+    'domain_complexity_score': 25,
+    'assignee_experience_score': 50,
+    'project_complexity_score': 30
+}
+
+def _fit_estimators(X: pd.DataFrame, y_delay_days: pd.Series, y_delay_category: pd.Series,
+                    model_config: Dict[str, Any], training_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Split, scale and fit the delay models. Pure function so results can be memoized."""
+    # Split data
+    X_train, X_test, y_delay_train, y_delay_test, y_cat_train, y_cat_test = train_test_split(
+        X, y_delay_days, y_delay_category, 
+        test_size=training_config['test_size'], 
+        random_state=training_config['random_state']
+    )
+    
+    # Scale features
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+    
+    # Train duration predictor
+    print("Training delay duration predictor...")
+    duration_predictor = RandomForestRegressor(**model_config)
+    duration_predictor.fit(X_train_scaled, y_delay_train)
+    
+    # Train delay classifier
+    print("Training delay classification model...")
+    delay_classifier = RandomForestClassifier(**model_config)
+    delay_classifier.fit(X_train_scaled, y_cat_train)
+    
+    # Evaluate models
+    duration_pred = duration_predictor.predict(X_test_scaled)
+    
+    return {
+        "duration_predictor": duration_predictor,
+        "delay_classifier": delay_classifier,
+        "scaler": scaler,
+        "duration_rmse": np.sqrt(mean_squared_error(y_delay_test, duration_pred)),
+        "training_samples": len(X_train),
+        "test_samples": len(X_test)
+    }
+
+def training_fingerprint(X: pd.DataFrame, y_delay_days: pd.Series, y_delay_category: pd.Series) -> str:
+    """Hash of everything the fitted models depend on: model/training configuration,
+    the feature list and the training rows themselves (features and both targets)."""
+    return joblib.hash((
+        MODEL_CONFIG, TRAINING_CONFIG, PREDICTION_FEATURES, list(X.columns),
+        pd.util.hash_pandas_object(X, index=False).to_numpy(),
+        pd.util.hash_pandas_object(y_delay_days, index=False).to_numpy(),
+        pd.util.hash_pandas_object(y_delay_category, index=False).to_numpy()
+    ))
+
 class DelayPredictor:
     def __init__(self):
         """Initialize the delay predictor with data loader and models."""
         self.data_loader = DataLoader()
-        self.delay_classifier = RandomForestClassifier(**MODEL_CONFIG)
-        self.duration_predictor = RandomForestRegressor(**MODEL_CONFIG)
+        self.delay_classifier = RandomForestClassifier(**MODEL_CONFIG['random_forest'])
+        self.duration_predictor = RandomForestRegressor(**MODEL_CONFIG['random_forest'])
         self.scaler = StandardScaler()
         self.label_encoder = LabelEncoder()
         self.feature_columns = []
         self.is_trained = False
+        self.training_fingerprint = None  # training_fingerprint() of the data the models were fitted on
+        self._fit_estimators = _fit_estimators
+        self._model_cache = None
         
     def prepare_features(self, data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """Prepare features for machine learning models."""
@@ -50,11 +114,13 @@ class DelayPredictor:
                                       how='left', suffixes=('', '_team'))
         
         # Create feature engineering columns
-        features_df['assignee_experience_score'] = features_df['role_numeric'] * 25
-        features_df['project_complexity_score'] = (
-            features_df['duration_days'].fillna(30) * 0.1 + 
-            features_df['domain_count'].fillna(1) * 10
+        engineered = task_feature_matrix(
+            features_df['role_numeric'].to_numpy(dtype=np.float64),
+            features_df['duration_days'].to_numpy(dtype=np.float64),
+            features_df['domain_count'].to_numpy(dtype=np.float64)
         )
+        features_df['assignee_experience_score'] = engineered[:, 0]
+        features_df['project_complexity_score'] = engineered[:, 1]
         domain_complexity_mapping = {
             'frontend': 20, 'backend': 30, 'mobile': 35, 'testing': 15,
             'ui/ux': 25, 'api': 30, 'database': 40, 'devops': 45
@@ -96,64 +162,51 @@ class DelayPredictor:
         features_df['is_delayed'] = (features_df['delay_days'].fillna(0) > 0).astype(int)
         
         # Risk score (0-100)
-        features_df['risk_score'] = np.clip(
-            features_df['delay_days'].fillna(0) * 10 + 
-            features_df['priority_numeric'] * 15 +
-            (100 - features_df['progress_ratio'] * 50), 
-            0, 100
+        features_df['risk_score'] = delay_risk_scores(
+            features_df['delay_days'].to_numpy(dtype=np.float64),
+            features_df['priority_numeric'].to_numpy(dtype=np.float64),
+            features_df['progress_ratio'].to_numpy(dtype=np.float64)
         )
         
         return features_df
     
-    def train_models(self, data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
-        """Train delay prediction models."""
-        print("Preparing features for model training...")
+    def prepare_training_data(self, data: Dict[str, pd.DataFrame]) -> Tuple[pd.DataFrame, pd.Series, pd.Series]:
+        """Feature matrix (the PREDICTION_FEATURES present in the data) and the delay-days and
+        delay-category targets the models are fitted on."""
         features_df = self.prepare_features(data)
         features_df = self.create_delay_labels(features_df)
         
         # Select feature columns
         available_features = [col for col in PREDICTION_FEATURES if col in features_df.columns]
-        self.feature_columns = available_features
-        
-        if not self.feature_columns:
-            print("Warning: No valid features found for training")
-            return {"error": "No valid features available"}
-        
-        X = features_df[self.feature_columns].fillna(0)
+        X = features_df[available_features].fillna(0)
         
         # Prepare targets
         y_delay_days = features_df['delay_days'].fillna(0)
         y_delay_category = features_df['delay_category'].fillna('no_delay')
+        return X, y_delay_days, y_delay_category
+    
+    def train_models(self, data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+        """Train delay prediction models."""
+        print("Preparing features for model training...")
+        X, y_delay_days, y_delay_category = self.prepare_training_data(data)
+        self.feature_columns = list(X.columns)
+        self.training_fingerprint = training_fingerprint(X, y_delay_days, y_delay_category)
+        
+        if not self.feature_columns:
+            print("Warning: No valid features found for training")
+            return {"error": "No valid features available"}
         
         if len(X) < 10:
             print("Warning: Insufficient data for training")
             return {"error": "Insufficient training data"}
         
-        # Split data
-        X_train, X_test, y_delay_train, y_delay_test, y_cat_train, y_cat_test = train_test_split(
-            X, y_delay_days, y_delay_category, 
-            test_size=TRAINING_CONFIG['test_size'], 
-            random_state=TRAINING_CONFIG['random_state']
-        )
-        
-        # Scale features
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
-        
-        # Train duration predictor
-        print("Training delay duration predictor...")
-        self.duration_predictor.fit(X_train_scaled, y_delay_train)
-        
-        # Train delay classifier
-        print("Training delay classification model...")
-        self.delay_classifier.fit(X_train_scaled, y_cat_train)
-        
-        # Evaluate models
-        duration_pred = self.duration_predictor.predict(X_test_scaled)
-        category_pred = self.delay_classifier.predict(X_test_scaled)
-        
-        # Calculate metrics
-        duration_rmse = np.sqrt(mean_squared_error(y_delay_test, duration_pred))
+        # Fit estimators (possibly served from the on-disk model cache)
+        fitted = self._fit_estimators(X, y_delay_days, y_delay_category, MODEL_CONFIG['random_forest'], TRAINING_CONFIG)
+        if self._model_cache is not None:
+            self._model_cache.reduce_size(bytes_limit=MODEL_CACHE_MAX_BYTES)
+        self.duration_predictor = fitted['duration_predictor']
+        self.delay_classifier = fitted['delay_classifier']
+        self.scaler = fitted['scaler']
         
         self.is_trained = True
         
@@ -166,36 +219,35 @@ class DelayPredictor:
         print("Model training completed successfully!")
         
         return {
-            "duration_rmse": duration_rmse,
+            "duration_rmse": fitted['duration_rmse'],
             "feature_importance": feature_importance,
-            "training_samples": len(X_train),
-            "test_samples": len(X_test),
+            "training_samples": fitted['training_samples'],
+            "test_samples": fitted['test_samples'],
             "features_used": self.feature_columns
         }
     
+    def fingerprint_training_data(self, data: Dict[str, pd.DataFrame]) -> str:
+        """training_fingerprint() of the rows train_models would fit on for this data."""
+        return training_fingerprint(*self.prepare_training_data(data))
+    
+    def enable_model_cache(self, cache_dir: str):
+        """Memoize model fitting on disk, keyed on the training data and configuration.
+        The cache is trimmed to MODEL_CACHE_MAX_BYTES after every fit.
+        
+        This serves explicit retraining (the train endpoint, full analysis runs) on data
+        that was fitted before. Process start-up instead loads AnalysisRunner's single
+        model artifact, which skips calling train_models at all."""
+        self._model_cache = Memory(cache_dir, verbose=0)
+        self._fit_estimators = self._model_cache.cache(_fit_estimators)
+    
     def predict_task_delay(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Predict delay for a specific task."""
         if not self.is_trained:
             return {"error": "Model not trained yet"}
         
-        # Convert task data to feature vector
-        features = []
-        for feature in self.feature_columns:
-            if feature in task_data:
-                features.append(task_data[feature])
-            else:
-                # Default values for missing features
-                default_values = {
-                    'estimated_hours': 24,
-                    'progress_ratio': 0.5,
-                    'dependency_count': 0,
-                    'team_size': 3,
-                    'priority_numeric': 2,
-                    'domain_complexity_score': 25,
-                    'assignee_experience_score': 50,
-                    'project_complexity_score': 30
-                }
-                features.append(default_values.get(feature, 0))
+        # Convert task data to feature vector, falling back to defaults for missing features
+        values = {**FEATURE_DEFAULTS, **task_data}
+        features = [values.get(feature, 0) for feature in self.feature_columns]
         
         # Scale features and predict
         features_scaled = self.scaler.transform([features])
@@ -218,6 +270,66 @@ class DelayPredictor:
             "recommendation": self._get_recommendation(risk_score, predicted_delay_days)
         }
     
+    def predict_task_delays_batch(self, task_features: Dict[str, Any], n_tasks: int) -> List[Dict[str, Any]]:
+        """Predict delays for many tasks with a single model call.
+
+        ``task_features`` maps feature names to per-task arrays (or Series) of
+        length ``n_tasks``; scalar values are broadcast to every task.
+        """
+        if not self.is_trained or n_tasks == 0:
+            return []
+        
+        # Build the (n_tasks, n_features) matrix column by column
+        X = np.empty((n_tasks, len(self.feature_columns)), dtype=np.float64)
+        values = {**FEATURE_DEFAULTS, **task_features}
+        for j, feature in enumerate(self.feature_columns):
+            X[:, j] = values.get(feature, 0)
+        
+        X_scaled = self.scaler.transform(X)
+        
+        predicted_delays = self.duration_predictor.predict(X_scaled)
+        predicted_categories = self.delay_classifier.predict(X_scaled)
+        probabilities = self.delay_classifier.predict_proba(X_scaled)
+        
+        risk_scores = np.clip(predicted_delays * 15, 0, 100)
+        classes = self.delay_classifier.classes_
+        
+        return [
+            {
+                "predicted_delay_days": max(0, delay),
+                "predicted_category": category,
+                "risk_score": risk,
+                "category_probabilities": dict(zip(classes, probs)),
+                "recommendation": self._get_recommendation(risk, delay)
+            }
+            for delay, category, risk, probs in zip(
+                predicted_delays.tolist(), predicted_categories.tolist(),
+                risk_scores.tolist(), probabilities.tolist()
+            )
+        ]
+    
+    def predict_task_delays(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Predict delays for a list of task dicts with a single model call."""
+        if not self.is_trained:
+            return [{"error": "Model not trained yet"} for _ in tasks]
+        if not tasks:
+            return []
+        
+        tasks_df = pd.DataFrame.from_records(tasks)
+        # Features missing (or null) in some of the dicts fall back to their defaults;
+        # a value that is present but not numeric is rejected, as the per-task path does
+        task_features = {}
+        for feature in self.feature_columns:
+            if feature not in tasks_df.columns:
+                continue
+            given = tasks_df[feature]
+            values = pd.to_numeric(given, errors='coerce')
+            invalid = values.isna() & given.notna()
+            if invalid.any():
+                raise ValueError(f"Feature '{feature}' must be numeric, got {given[invalid].iloc[0]!r}")
+            task_features[feature] = values.fillna(FEATURE_DEFAULTS.get(feature, 0))
+        return self.predict_task_delays_batch(task_features, len(tasks_df))
+    
     def analyze_project_risks(self, data: Dict[str, pd.DataFrame], project_id: str = None) -> Dict[str, Any]:
         """Analyze delay risks for projects."""
         tasks_df = data['tasks'].copy()
@@ -192,7 +192,7 @@ class EnhancedLocalAnalyzer:
         delayed_tasks = len([t for t in self.tasks if t['status'] == 'delayed'])
         
         # Calculate average progress
-        avg_progress = np.mean([p['progress'] for p in self.projects]) if self.projects else 0
+        avg_progress = np.fromiter((p['progress'] for p in self.projects), dtype=np.float64, count=len(self.projects)).mean() if self.projects else 0
         
         return {
             'total_projects': total_projects,
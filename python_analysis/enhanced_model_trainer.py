@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 from sklearn.ensemble import (
     RandomForestClassifier, RandomForestRegressor,
-    GradientBoostingClassifier, GradientBoostingRegressor,
+    HistGradientBoostingClassifier, HistGradientBoostingRegressor,
     VotingClassifier, VotingRegressor
 )
 from sklearn.model_selection import (
@@ -41,10 +41,23 @@ except ImportError:
     XGB_AVAILABLE = False
     print("XGBoost not available - using alternative models")
 
-from config import MODEL_CONFIG, TRAINING_CONFIG, NLP_FEATURES
+from config import MODEL_CONFIG, TRAINING_CONFIG, NLP_FEATURES, NLP_KEYWORD_SETS, KEYWORD_AUTOMATON
 from datetime import datetime
 import json
 
+def count_keyword_matches(text: str) -> dict:
+    """Count the distinct NLP_FEATURES keywords of each category contained in lower-cased text."""
+    if KEYWORD_AUTOMATON is None:
+        return {category: sum(1 for kw in keywords if kw in text)
+                for category, keywords in NLP_KEYWORD_SETS.items()}
+    
+    # Single Aho-Corasick pass finds every keyword of every category
+    found = {category: set() for category in NLP_KEYWORD_SETS}
+    for _, (keyword, categories) in KEYWORD_AUTOMATON.iter(text):
+        for category in categories:
+            found[category].add(keyword)
+    return {category: len(keywords) for category, keywords in found.items()}
+
 class EnhancedModelTrainer:
     """Advanced model trainer with ensemble methods and feature engineering"""
     
@@ -66,24 +79,14 @@ class EnhancedModelTrainer:
                 df[f'{text_col}_length'] = df[text_col].fillna('').astype(str).str.len()
                 df[f'{text_col}_word_count'] = df[text_col].fillna('').astype(str).str.split().str.len()
                 
-                # Keyword analysis
-                for keyword_type, keywords in NLP_FEATURES.items():
-                    if keyword_type == 'technical_keywords':
-                        df[f'{text_col}_technical_count'] = df[text_col].fillna('').astype(str).str.lower().apply(
-                            lambda x: sum(1 for kw in keywords if kw in x)
-                        )
-                    elif keyword_type == 'complexity_indicators':
-                        df[f'{text_col}_complexity_indicators'] = df[text_col].fillna('').astype(str).str.lower().apply(
-                            lambda x: sum(1 for kw in keywords if kw in x)
-                        )
-                    elif keyword_type == 'urgency_indicators':
-                        df[f'{text_col}_urgency_indicators'] = df[text_col].fillna('').astype(str).str.lower().apply(
-                            lambda x: sum(1 for kw in keywords if kw in x)
-                        )
-                    elif keyword_type == 'risk_indicators':
-                        df[f'{text_col}_risk_indicators'] = df[text_col].fillna('').astype(str).str.lower().apply(
-                            lambda x: sum(1 for kw in keywords if kw in x)
-                        )
+                # Keyword analysis: one scan per text covers all keyword categories
+                lowered = df[text_col].fillna('').astype(str).str.lower()
+                keyword_counts = pd.DataFrame([count_keyword_matches(text) for text in lowered],
+                                              index=df.index, columns=list(NLP_FEATURES))
+                df[f'{text_col}_technical_count'] = keyword_counts['technical_keywords']
+                df[f'{text_col}_complexity_indicators'] = keyword_counts['complexity_indicators']
+                df[f'{text_col}_urgency_indicators'] = keyword_counts['urgency_indicators']
+                df[f'{text_col}_risk_indicators'] = keyword_counts['risk_indicators']
         
         # Numerical feature engineering
         if 'estimatedHours' in df.columns and 'actualHours' in df.columns:
@@ -180,8 +183,8 @@ class EnhancedModelTrainer:
             rf = RandomForestClassifier(**MODEL_CONFIG['random_forest'])
             models.append(('rf', rf))
             
-            # Gradient Boosting
-            gb = GradientBoostingClassifier(**MODEL_CONFIG['gradient_boosting'])
+            # Histogram-based Gradient Boosting
+            gb = HistGradientBoostingClassifier(**MODEL_CONFIG['hist_gradient_boosting'])
             models.append(('gb', gb))
             
             # XGBoost if available
@@ -202,8 +205,8 @@ class EnhancedModelTrainer:
             rf = RandomForestRegressor(**MODEL_CONFIG['random_forest'])
             models.append(('rf', rf))
             
-            # Gradient Boosting
-            gb = GradientBoostingRegressor(**MODEL_CONFIG['gradient_boosting'])
+            # Histogram-based Gradient Boosting
+            gb = HistGradientBoostingRegressor(**MODEL_CONFIG['hist_gradient_boosting'])
             models.append(('gb', gb))
             
             # XGBoost if available
@@ -0,0 +1,111 @@
+"""
+Numeric kernels shared by the analysis modules.
+Compiled with Numba when it is installed; the per-row feature kernels and the
+estimation accuracy count fall back to equivalent vectorized NumPy, the other
+reductions to plain Python loops.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so kernels still run without Numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def summarize_predictions(delays: np.ndarray, risks: np.ndarray, high_risk_threshold: float):
+    """Return (high_risk_count, average_delay) in a single pass over the predictions."""
+    n = delays.shape[0]
+    high_risk = 0
+    total_delay = 0.0
+    for i in range(n):
+        total_delay += delays[i]
+        if risks[i] > high_risk_threshold:
+            high_risk += 1
+    return high_risk, total_delay / max(n, 1)
+
+
+@njit(cache=True)
+def workload_balance_score(task_counts: np.ndarray) -> float:
+    """Balance score (0-100) from per-member task counts: 100 minus ten times their variance."""
+    n = task_counts.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += task_counts[i]
+    mean /= n
+    variance = 0.0
+    for i in range(n):
+        variance += (task_counts[i] - mean) ** 2
+    variance /= n
+    return max(0.0, 100.0 - variance * 10)
+
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: the kernels are called from request and worker threads, and Numba's
+    # default threading layer aborts when two threads enter parallel regions at once
+    @njit(cache=True)
+    def task_feature_matrix(role_numeric: np.ndarray, duration_days: np.ndarray, domain_count: np.ndarray) -> np.ndarray:
+        """Return the (n, 2) [assignee_experience_score, project_complexity_score] matrix."""
+        n = role_numeric.shape[0]
+        out = np.empty((n, 2), dtype=np.float64)
+        for i in range(n):
+            duration = duration_days[i] if not np.isnan(duration_days[i]) else 30.0
+            domains = domain_count[i] if not np.isnan(domain_count[i]) else 1.0
+            out[i, 0] = role_numeric[i] * 25
+            out[i, 1] = duration * 0.1 + domains * 10
+        return out
+
+    @njit(cache=True)
+    def delay_risk_scores(delay_days: np.ndarray, priority_numeric: np.ndarray, progress_ratio: np.ndarray) -> np.ndarray:
+        """Risk score (0-100) per task from delay, priority and progress; missing delays count as 0."""
+        n = delay_days.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            delay = delay_days[i] if not np.isnan(delay_days[i]) else 0.0
+            score = delay * 10 + priority_numeric[i] * 15 + (100 - progress_ratio[i] * 50)
+            out[i] = min(max(score, 0.0), 100.0) if not np.isnan(score) else score
+        return out
+
+    @njit(cache=True)
+    def estimation_accuracy_counts(estimated: np.ndarray, actual: np.ndarray):
+        """Return (accurate, total) over tasks with both hours set; accurate means actual/estimated in [0.8, 1.2]."""
+        accurate = 0
+        total = 0
+        for i in range(estimated.shape[0]):
+            if estimated[i] > 0 and actual[i] > 0:
+                total += 1
+                ratio = actual[i] / estimated[i]
+                if 0.8 <= ratio <= 1.2:
+                    accurate += 1
+        return accurate, total
+else:
+    def task_feature_matrix(role_numeric: np.ndarray, duration_days: np.ndarray, domain_count: np.ndarray) -> np.ndarray:
+        """Return the (n, 2) [assignee_experience_score, project_complexity_score] matrix."""
+        return np.column_stack((
+            role_numeric * 25,
+            np.where(np.isnan(duration_days), 30.0, duration_days) * 0.1 +
+            np.where(np.isnan(domain_count), 1.0, domain_count) * 10
+        ))
+
+    def delay_risk_scores(delay_days: np.ndarray, priority_numeric: np.ndarray, progress_ratio: np.ndarray) -> np.ndarray:
+        """Risk score (0-100) per task from delay, priority and progress; missing delays count as 0."""
+        return np.clip(
+            np.where(np.isnan(delay_days), 0.0, delay_days) * 10 +
+            priority_numeric * 15 +
+            (100 - progress_ratio * 50),
+            0, 100
+        )
+
+    def estimation_accuracy_counts(estimated: np.ndarray, actual: np.ndarray):
+        """Return (accurate, total) over tasks with both hours set; accurate means actual/estimated in [0.8, 1.2]."""
+        has_both = (estimated > 0) & (actual > 0)
+        ratio = actual[has_both] / estimated[has_both]
+        return int(np.count_nonzero((ratio >= 0.8) & (ratio <= 1.2))), int(np.count_nonzero(has_both))
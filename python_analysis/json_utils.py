@@ -0,0 +1,26 @@
+"""
+JSON serialization helpers shared by the analysis modules.
+Wraps orjson with the options needed for pandas/numpy analysis output.
+"""
+
+import orjson
+
+# numpy scalars/arrays are encoded natively; int keys from groupby/value_counts are stringified
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def json_default(obj):
+    """Fallback for values orjson cannot encode natively (pandas/numpy leftovers)."""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'item'):
+        return obj.item()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize analysis output to JSON bytes."""
+    option = (ORJSON_OPTIONS | orjson.OPT_INDENT_2) if indent else ORJSON_OPTIONS
+    return orjson.dumps(obj, option=option, default=json_default)
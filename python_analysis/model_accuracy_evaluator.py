@@ -82,7 +82,7 @@ class NLPModelAccuracyEvaluator:
         y_pred = []
         sentiment_score_errors = []
         
-        for _, row in sentiment_predictions.iterrows():
+        for row in sentiment_predictions.to_dict('records'):
             project_id = row['project_id']
             if project_id in self.ground_truth['sentiment_ground_truth']:
                 gt = self.ground_truth['sentiment_ground_truth'][project_id]
@@ -129,7 +129,7 @@ class NLPModelAccuracyEvaluator:
         y_pred_class = []
         complexity_score_errors = []
         
-        for _, row in complexity_predictions.iterrows():
+        for row in complexity_predictions.to_dict('records'):
             task_id = row['task_id']
             if task_id in self.ground_truth['complexity_ground_truth']:
                 gt = self.ground_truth['complexity_ground_truth'][task_id]
@@ -148,13 +148,15 @@ class NLPModelAccuracyEvaluator:
         precision, recall, f1, _ = precision_recall_fscore_support(y_true_class, y_pred_class, average='weighted') if y_true_class else (0, 0, 0, 0)
         
         # Calculate regression metrics for complexity scores
-        mae_complexity = np.mean(complexity_score_errors) if complexity_score_errors else 0
-        rmse_complexity = np.sqrt(np.mean(np.array(complexity_score_errors) ** 2)) if complexity_score_errors else 0
-        r2_complexity = 1 - (np.sum(np.array(complexity_score_errors) ** 2) / 
-                            np.sum((np.array([self.ground_truth['complexity_ground_truth'][task]['complexity_score'] 
-                                            for task in self.ground_truth['complexity_ground_truth']]) - 
-                                   np.mean([self.ground_truth['complexity_ground_truth'][task]['complexity_score'] 
-                                           for task in self.ground_truth['complexity_ground_truth']])) ** 2)) if complexity_score_errors else 0
+        errors = np.fromiter(complexity_score_errors, dtype=np.float64, count=len(complexity_score_errors))
+        complexity_gt = self.ground_truth['complexity_ground_truth']
+        gt_scores = np.fromiter((gt['complexity_score'] for gt in complexity_gt.values()),
+                                dtype=np.float64, count=len(complexity_gt))
+        
+        mae_complexity = errors.mean() if complexity_score_errors else 0
+        rmse_complexity = np.sqrt(np.mean(errors ** 2)) if complexity_score_errors else 0
+        r2_complexity = 1 - (np.sum(errors ** 2) / 
+                            np.sum((gt_scores - gt_scores.mean()) ** 2)) if complexity_score_errors else 0
         
         return {
             'model_type': 'complexity_scoring',
@@ -181,7 +183,7 @@ class NLPModelAccuracyEvaluator:
         y_true = []
         y_pred = []
         
-        for _, row in complexity_predictions.iterrows():
+        for row in complexity_predictions.to_dict('records'):
             task_id = row['task_id']
             if task_id in self.ground_truth['domain_classification_ground_truth']:
                 gt_domain = self.ground_truth['domain_classification_ground_truth'][task_id]
@@ -289,7 +291,7 @@ class NLPModelAccuracyEvaluator:
         actual_ratios = []
         predicted_complexity_scores = []
         
-        for _, row in complexity_predictions.iterrows():
+        for row in complexity_predictions.to_dict('records'):
             task_id = row['task_id']
             task_data = next((t for t in self.analyzer.data['tasks'] if t['id'] == task_id), None)
             
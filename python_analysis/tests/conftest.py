@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures for the analysis modules.
+The modules import each other as top-level modules, so their directory goes on sys.path.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import delay_predictor
+from data_loader import DataLoader
+
+
+@pytest.fixture(autouse=True)
+def offline_data(monkeypatch):
+    """Never touch a database: loaders fall back to their (seeded) mock data."""
+    monkeypatch.setattr(DataLoader, 'connect_to_database', lambda self: None)
+    np.random.seed(7)
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """AnalysisRunner with data loaded, writing its results under a temporary directory
+    and fitting models without the on-disk model cache."""
+    monkeypatch.chdir(tmp_path)
+    from analysis_runner import AnalysisRunner
+
+    runner = AnalysisRunner()
+    runner.predictor._fit_estimators = delay_predictor._fit_estimators
+    runner.predictor._model_cache = None
+    assert runner.load_all_data()
+    return runner
+
+
+@pytest.fixture
+def trained_runner(runner):
+    """Runner whose delay models are trained on the mock data."""
+    assert "error" not in runner.train_prediction_models()
+    return runner
@@ -0,0 +1,209 @@
+"""Tests for batched prediction, its per-task fallback, recommendations, the model artifact and the shared data snapshot."""
+
+import json
+import os
+import time
+
+import joblib
+import pandas as pd
+import pytest
+
+from analysis_runner import PER_TASK_FEATURES, SHARED_DATA_MANIFEST, SHARED_DATASETS, SHARED_DATA_MAX_AGE
+from config import MODEL_CONFIG
+from delay_predictor import FEATURE_DEFAULTS
+
+
+def _task_data(task):
+    """Feature dict for one task row, as the per-task path builds it."""
+    return {**FEATURE_DEFAULTS, **{feature: task[feature] for feature in PER_TASK_FEATURES if feature in task}}
+
+
+def test_batch_predictions_match_per_task_predictions(trained_runner):
+    tasks = trained_runner.data['tasks'].to_dict('records')
+    predictions = list(trained_runner.iter_predictions(batch_size=5))
+
+    assert len(predictions) == len(tasks)
+    for task, prediction in zip(tasks, predictions):
+        expected = trained_runner.predictor.predict_task_delay(_task_data(task))
+        assert prediction['task_id'] == task['id']
+        assert prediction['predicted_delay_days'] == pytest.approx(expected['predicted_delay_days'])
+        assert prediction['risk_score'] == pytest.approx(expected['risk_score'])
+        assert prediction['predicted_category'] == expected['predicted_category']
+        assert prediction['recommendation'] == expected['recommendation']
+
+
+def test_predict_task_delays_matches_predict_task_delay(trained_runner):
+    predictor = trained_runner.predictor
+    # Missing (or NaN, which the list path coerces) features fall back to their defaults in both paths
+    tasks = [
+        {feature: value for feature, value in _task_data(task).items() if pd.notna(value)}
+        for task in trained_runner.data['tasks'].to_dict('records')
+    ]
+    tasks.append({'estimated_hours': 40})
+
+    batched = predictor.predict_task_delays(tasks)
+
+    assert len(batched) == len(tasks)
+    for task, prediction in zip(tasks, batched):
+        expected = predictor.predict_task_delay(task)
+        assert prediction['predicted_delay_days'] == pytest.approx(expected['predicted_delay_days'])
+        assert prediction['predicted_category'] == expected['predicted_category']
+
+
+def test_predict_task_delays_rejects_non_numeric_features(trained_runner):
+    predictor = trained_runner.predictor
+
+    with pytest.raises(ValueError, match="estimated_hours"):
+        predictor.predict_task_delays([{'estimated_hours': 16}, {'estimated_hours': 'abc'}])
+    # Null values are treated as missing and take the default
+    assert len(predictor.predict_task_delays([{'estimated_hours': None}])) == 1
+
+
+def test_failed_batch_is_retried_task_by_task(trained_runner, monkeypatch):
+    predictor = trained_runner.predictor
+    tasks = trained_runner.data['tasks'].to_dict('records')
+    failing_id = tasks[3]['id']
+    predict_one = predictor.predict_task_delay
+    calls = []
+
+    def reject_batch(task_features, n_tasks):
+        raise ValueError("batch rejected")
+
+    def predict_failing_fourth(task_data):
+        # Tasks are retried in order, so the fourth call is tasks[3]
+        calls.append(task_data)
+        if len(calls) == 4:
+            raise ValueError("bad task")
+        return predict_one(task_data)
+
+    monkeypatch.setattr(predictor, 'predict_task_delays_batch', reject_batch)
+    monkeypatch.setattr(predictor, 'predict_task_delay', predict_failing_fourth)
+
+    predictions = trained_runner.generate_predictions_for_all_tasks()
+
+    assert [p['task_id'] for p in predictions] == [t['id'] for t in tasks if t['id'] != failing_id]
+    assert trained_runner.failed_prediction_task_ids == [failing_id]
+
+
+def test_high_risk_recommendations_tolerate_missing_fields(trained_runner):
+    trained_runner.set_predictions([
+        {'task_id': 't1', 'risk_score': 85.0, 'predicted_delay_days': 6.0},
+        {'task_id': 't2', 'risk_score': 65.0},
+        {'task_id': 't3', 'risk_score': 10.0},
+        {'error': 'Model not trained yet'}
+    ])
+
+    recommendations = trained_runner.get_high_risk_recommendations()
+
+    assert [rec['task_id'] for rec in recommendations] == ['t1', 't2']
+    assert recommendations[0]['recommendation'] is None
+    assert recommendations[1]['predicted_delay'] is None
+    assert type(recommendations[0]['risk_score']) is float
+    assert len(recommendations[0]['actions']) == 4
+
+
+def test_training_prepares_features_once_for_fit_and_artifact(runner, monkeypatch):
+    predictor = runner.predictor
+    prepare = predictor.prepare_training_data
+    calls = []
+    monkeypatch.setattr(predictor, 'prepare_training_data', lambda data: calls.append(True) or prepare(data))
+
+    assert "error" not in runner.train_prediction_models()
+
+    assert len(calls) == 1
+    assert joblib.load(runner.model_artifact_path)['fingerprint'] == predictor.training_fingerprint
+
+
+def test_cached_models_rejected_after_config_change(trained_runner, monkeypatch):
+    assert trained_runner.model_artifact_path.exists()
+    trained_runner.predictor.is_trained = False
+    assert trained_runner.try_load_cached_models()
+
+    monkeypatch.setitem(MODEL_CONFIG['random_forest'], 'n_estimators', 7)
+    trained_runner.predictor.is_trained = False
+    assert not trained_runner.try_load_cached_models()
+    assert not trained_runner.predictor.is_trained
+
+
+
+def test_cached_models_rejected_after_data_change(trained_runner):
+    tasks = trained_runner.data['tasks']
+    # Same row counts, different hours and deadlines
+    tasks['estimated_hours'] = tasks['estimated_hours'] * 2
+    tasks['delay_days'] = tasks['delay_days'] + 3
+    trained_runner.predictor.is_trained = False
+
+    assert not trained_runner.try_load_cached_models()
+    assert not trained_runner.predictor.is_trained
+
+
+@pytest.fixture
+def shared_runner(runner, tmp_path):
+    pytest.importorskip('pyarrow')
+    runner.shared_data_dir = tmp_path / 'shared'
+    return runner
+
+
+def test_shared_snapshot_round_trip(shared_runner):
+    shared_runner.export_shared_data()
+    # A stray file in the snapshot directory is never picked up as a dataset
+    (shared_runner.shared_data_dir / 'stray.arrow').write_bytes(b'')
+
+    snapshot = shared_runner._load_shared_snapshot()
+
+    assert set(snapshot) == set(SHARED_DATASETS)
+    pd.testing.assert_frame_equal(snapshot['tasks'], shared_runner.data['tasks'], check_dtype=False)
+
+
+def test_incomplete_shared_snapshot_is_ignored(shared_runner):
+    shared_runner.export_shared_data()
+    manifest_path = shared_runner.shared_data_dir / SHARED_DATA_MANIFEST
+    manifest = json.loads(manifest_path.read_text())
+    del manifest['files']['teams']
+    manifest_path.write_text(json.dumps(manifest))
+
+    assert shared_runner._load_shared_snapshot() is None
+
+
+def test_export_without_every_dataset_publishes_nothing(shared_runner):
+    del shared_runner.data['delay_alerts']
+
+    shared_runner.export_shared_data()
+
+    assert not (shared_runner.shared_data_dir / SHARED_DATA_MANIFEST).exists()
+
+
+def test_export_prunes_only_generations_readers_would_reject(shared_runner):
+    shared_runner.export_shared_data()
+    first, = shared_runner.shared_data_dir.glob('snapshot-*')
+    shared_runner.export_shared_data()
+    # A superseded but recent generation may still be read by another process
+    assert first.exists()
+
+    stale = time.time() - SHARED_DATA_MAX_AGE - 1
+    os.utime(first, (stale, stale))
+    shared_runner.export_shared_data()
+
+    assert not first.exists()
+    assert len(list(shared_runner.shared_data_dir.glob('snapshot-*'))) == 2
+
+
+def test_load_all_data_uses_snapshot_only_when_asked(shared_runner, monkeypatch):
+    shared_runner.export_shared_data()
+    loaded_from_source = []
+    load = shared_runner.data_loader.get_comprehensive_dataset
+    monkeypatch.setattr(shared_runner.data_loader, 'get_comprehensive_dataset',
+                        lambda: loaded_from_source.append(True) or load())
+
+    assert shared_runner.load_all_data(use_shared_snapshot=True)
+    assert not loaded_from_source
+    assert shared_runner.load_all_data()
+    assert loaded_from_source == [True]
+
+
+def test_comprehensive_analysis_collects_every_stage(runner):
+    results = runner.run_comprehensive_analysis(save_results=False)
+
+    assert results['predictions']['total_predictions'] == len(runner.data['tasks'])
+    assert results['risk_analysis'] == runner.analyze_project_risks()
+    assert results['trends'] == runner.get_delay_trends()
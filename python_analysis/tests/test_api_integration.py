@@ -0,0 +1,204 @@
+"""Tests for the micro-batched predictor and the API's job and streaming endpoints."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
+
+import analysis_runner
+import api_integration
+import delay_predictor
+from api_integration import BatchPredictor, PythonAnalysisAPI
+
+
+def _predict_all(tasks):
+    if any(task.get('bad') for task in tasks):
+        raise ValueError("bad task in batch")
+    return [{'hours': task['hours']} for task in tasks]
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """API instance writing its results under a temporary directory, without the model cache."""
+    monkeypatch.chdir(tmp_path)
+    api = PythonAnalysisAPI()
+    api.analysis_runner.predictor._fit_estimators = delay_predictor._fit_estimators
+    api.analysis_runner.predictor._model_cache = None
+    return api
+
+
+@pytest.fixture
+def client(api):
+    return api.app.test_client()
+
+
+def test_batch_predictor_isolates_a_bad_task():
+    predictor = BatchPredictor(_predict_all, max_wait=0.05)
+    tasks = [{'hours': 1}, {'hours': 2, 'bad': True}, {'hours': 3}]
+
+    def predict(task):
+        try:
+            return predictor.predict(task)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        results = list(pool.map(predict, tasks))
+
+    assert results[0] == {'hours': 1}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {'hours': 3}
+
+
+def test_batch_predictor_short_results_do_not_hang_callers():
+    predictor = BatchPredictor(lambda tasks: [], timeout=5)
+
+    with pytest.raises(ValueError, match="Expected 1 predictions"):
+        predictor.predict({'hours': 1})
+
+
+def test_batch_predictor_rejects_non_dict_task():
+    predictor = BatchPredictor(_predict_all)
+
+    with pytest.raises(TypeError):
+        predictor.predict(5)
+
+    # The worker is unaffected
+    assert predictor.predict({'hours': 4}) == {'hours': 4}
+
+
+def test_batch_predictor_works_in_forked_child():
+    predictor = BatchPredictor(_predict_all, timeout=5)
+    assert predictor.predict({'hours': 1}) == {'hours': 1}
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: the parent's worker thread is gone, a new one must serve this call
+        try:
+            os.write(write_fd, orjson.dumps(predictor.predict({'hours': 2})))
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as pipe:
+        child_result = pipe.read()
+    os.waitpid(pid, 0)
+
+    assert orjson.loads(child_result) == {'hours': 2}
+    assert predictor.predict({'hours': 3}) == {'hours': 3}
+
+
+def _poll(client, status_url, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get(status_url)
+        if response.get_json().get('status') != 'running':
+            return response
+        time.sleep(0.01)
+    raise AssertionError("Analysis job did not finish")
+
+
+def test_full_analysis_job_lifecycle(api, client, monkeypatch):
+    monkeypatch.setattr(api, '_run_full_analysis_job', lambda: {'summary': 'ok'})
+
+    started = client.post('/analyze/full')
+    assert started.status_code == 202
+    body = started.get_json()
+    assert body['status_url'] == f"/analyze/full/status/{body['job_id']}"
+
+    finished = _poll(client, body['status_url'])
+    assert finished.status_code == 200
+    assert finished.get_json()['status'] == 'done'
+    assert finished.get_json()['results'] == {'summary': 'ok'}
+
+    # A finished job is forgotten once its result has been returned
+    assert client.get(body['status_url']).status_code == 404
+
+
+def test_full_analysis_job_failure_is_reported(api, client, monkeypatch):
+    def fail():
+        raise RuntimeError("analysis exploded")
+
+    monkeypatch.setattr(api, '_run_full_analysis_job', fail)
+
+    status_url = client.post('/analyze/full').get_json()['status_url']
+    failed = _poll(client, status_url)
+
+    assert failed.status_code == 500
+    assert failed.get_json()['status'] == 'failed'
+    assert 'analysis exploded' in failed.get_json()['error']
+
+
+def test_finished_jobs_expire_after_ttl(api, client, monkeypatch):
+    monkeypatch.setattr(api, '_run_full_analysis_job', lambda: {})
+    job_id = client.post('/analyze/full').get_json()['job_id']
+    future = api._jobs[job_id][0]
+    future.result(timeout=10)
+    # The finished timestamp is set by a done-callback right after the result
+    deadline = time.monotonic() + 5
+    while api._jobs[job_id][1] is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    monkeypatch.setattr(api_integration, 'ANALYSIS_JOB_TTL', -1)
+
+    assert client.get(f"/analyze/full/status/{job_id}").status_code == 404
+
+
+def test_predictions_stream_as_ndjson(api, client):
+    response = client.get('/analyze/predictions', headers={'Accept': 'application/x-ndjson'})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = response.get_data().splitlines()
+    predictions = [orjson.loads(line) for line in lines]
+    tasks = api.analysis_runner.data['tasks']
+    assert len(predictions) == len(tasks)
+    assert [p['task_id'] for p in predictions] == tasks['id'].tolist()
+    # The streamed predictions back the recommendations endpoint
+    assert api.analysis_runner.predictions == predictions
+
+
+def test_predict_task_rejects_non_object_body(api, client):
+    assert client.post('/analyze/predict_task', json=5).status_code == 400
+    assert client.post('/analyze/predict_tasks', json=[{'estimated_hours': 8}, 5]).status_code == 400
+    # Rejected before any data is loaded or models trained
+    assert not api.analysis_runner.predictor.is_trained
+
+
+def test_predict_task_returns_prediction(client):
+    response = client.post('/analyze/predict_task', json={'estimated_hours': 16, 'dependency_count': 2})
+
+    assert response.status_code == 200
+    assert 'predicted_delay_days' in response.get_json()['prediction']
+
+
+def test_predict_task_fails_only_the_request_with_a_non_numeric_feature(api, client):
+    api._ensure_trained()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        bad, good = pool.map(lambda body: client.post('/analyze/predict_task', json=body),
+                             [{'estimated_hours': 'abc'}, {'estimated_hours': 16}])
+
+    assert not bad.get_json()['success']
+    assert good.status_code == 200
+
+
+def test_workers_warm_up_from_the_published_state(api, tmp_path, monkeypatch):
+    pytest.importorskip('pyarrow')
+    monkeypatch.setattr(analysis_runner, 'SHARED_DATA_DIR', str(tmp_path / 'shared'))
+    monkeypatch.setattr(delay_predictor.DelayPredictor, 'enable_model_cache', lambda self, cache_dir: None)
+    api_integration.publish_startup_state()
+
+    runner = api.analysis_runner
+    runner.shared_data_dir = tmp_path / 'shared' / analysis_runner.SHARED_DATA_NAMESPACE
+    loaded_from_source = []
+    monkeypatch.setattr(runner.data_loader, 'get_comprehensive_dataset', lambda: loaded_from_source.append(True))
+    monkeypatch.setattr(runner, 'train_prediction_models', lambda: pytest.fail("worker retrained"))
+
+    api.warm_up(use_shared_snapshot=True)
+
+    assert not loaded_from_source
+    assert runner.data and runner.predictor.is_trained
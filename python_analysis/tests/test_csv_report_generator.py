@@ -0,0 +1,457 @@
+"""Tests for the vectorized CSV reports, checked against the original per-row helpers on a small fixture."""
+
+import csv
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+import csv_report_generator
+from csv_report_generator import EnhancedCSVReportGenerator, REPORT_NAMES
+
+# Report-run clock, pinned so day counts do not depend on when the tests run
+NOW = datetime(2026, 3, 10, 9, 30)
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW if tz is None else NOW.astimezone(tz)
+
+
+def _date(days):
+    """Naive ISO timestamp `days` from NOW (negative is in the past)."""
+    return (NOW + timedelta(days=days, hours=6)).isoformat()
+
+
+def _task(task_id, project_id, status, priority='medium', estimated=10, actual=0, **extra):
+    task = {
+        'id': task_id, 'title': f"Task {task_id}", 'description': extra.pop('description', 'Routine work'),
+        'status': status, 'priority': priority, 'projectId': project_id,
+        'assigneeId': extra.pop('assigneeId', 'u1'), 'domain': extra.pop('domain', 'web'),
+        'estimatedHours': estimated, 'actualHours': actual, 'dependencies': [],
+        'startDate': _date(-30), 'dueDate': _date(10)
+    }
+    task.update(extra)
+    return task
+
+
+DATA = {
+    'users': [{'id': 'u1', 'name': 'Ada'}, {'id': 'u2', 'name': 'Lin'}, {'id': 'u3', 'name': 'Sam'}],
+    'projects': [
+        {'id': 'p1', 'name': 'Portal', 'description': 'Customer portal', 'status': 'in_progress', 'progress': 40,
+         'domains': ['web', 'api'], 'teamId': 'team1', 'managerId': 'u1', 'startDate': _date(-60), 'endDate': _date(30)},
+        {'id': 'p2', 'name': 'Migration', 'description': 'Data migration', 'status': 'delayed', 'progress': 70,
+         'domains': ['data'], 'teamId': 'team2', 'startDate': _date(-90), 'endDate': _date(-5)},
+        {'id': 'p3', 'name': 'Docs', 'description': 'Documentation', 'status': 'completed', 'progress': 100,
+         'startDate': _date(-40), 'endDate': _date(-10)},
+        {'id': 'p4', 'name': 'Empty', 'description': 'No tasks yet', 'status': 'planning', 'progress': 0}
+    ],
+    'tasks': [
+        _task('t1', 'p1', 'completed', 'high', 10, 11, completedDate=_date(-12)),
+        _task('t2', 'p1', 'delayed', 'critical', 8, 14, dueDate=_date(-4), dependencies=[],
+              description='Complex integration work', delayReason='Waiting on vendor API'),
+        _task('t3', 'p1', 'in_progress', 'low', 20, 5, dependencies=['t2'], assigneeId='u2'),
+        _task('t4', 'p1', 'todo', 'medium', 0, 0, dependencies=['t2', 't1'], assigneeId='u2', dueDate=_date(-2)),
+        _task('t5', 'p2', 'delayed', 'critical', 16, 40, dueDate=_date(-9), assigneeId='u3',
+              description='Schema migration', domain='data'),
+        _task('t6', 'p2', 'delayed', 'high', 5, 4, dueDate=_date(-1), dependencies=['t5'], assigneeId='u3'),
+        _task('t7', 'p2', 'review', 'urgent', 12, 30, assigneeId='u3', dependencies=['t5']),
+        _task('t8', 'p3', 'completed', 'low', 6, 6, completedDate=_date(-11), dueDate=_date(-15))
+    ],
+    'teams': [
+        {'id': 'team1', 'name': 'Web', 'description': 'Web team', 'memberIds': ['u1', 'u2'], 'leaderId': 'u1',
+         'skills': ['react', 'python', 'sql']},
+        {'id': 'team2', 'name': 'Data', 'description': 'Data team', 'memberIds': ['u3'], 'skills': ['sql']}
+    ],
+    'delayAlerts': [
+        {'id': 'a1', 'type': 'critical', 'title': 'Blocked', 'message': 'Blocking the project release',
+         'taskId': 't5', 'projectId': 'p2', 'isResolved': False, 'notificationSent': True},
+        {'id': 'a2', 'type': 'minor', 'title': 'Resolved', 'message': 'Task slipped', 'isResolved': True}
+    ]
+}
+
+NLP_FRAMES = {
+    'sentiment_analysis': pd.DataFrame([
+        {'project_id': 'p1', 'sentiment_score': 0.4, 'sentiment_label': 'positive', 'risk_keywords': ['deadline'], 'complexity_level': 'medium'},
+        {'project_id': 'p2', 'sentiment_score': -0.6, 'sentiment_label': 'negative', 'risk_keywords': ['blocked', 'late'], 'complexity_level': 'high'},
+        {'project_id': 'p2', 'sentiment_score': 0.9, 'sentiment_label': 'positive', 'risk_keywords': [], 'complexity_level': 'low'}
+    ]),
+    'task_complexity': pd.DataFrame([
+        {'task_id': 't2', 'complexity_score': 0.8, 'complexity_level': 'high', 'tech_terms': ['api', 'oauth'], 'domain': 'integration'},
+        {'task_id': 't5', 'complexity_score': 0.6, 'complexity_level': 'medium', 'tech_terms': ['sql'], 'domain': 'data'}
+    ]),
+    'delay_patterns': pd.DataFrame([
+        {'task_id': 't2', 'delay_category': 'dependency_issues', 'root_cause': 'external_factor', 'preventability_score': 30},
+        {'task_id': 't5', 'delay_category': 'technical_complexity', 'root_cause': 'internal_process', 'preventability_score': 80}
+    ]),
+    'team_skills': pd.DataFrame([
+        {'team_id': 'team1', 'specialization_score': 0.7, 'primary_tech_stack': 'React', 'skill_diversity': 3}
+    ])
+}
+
+
+class FakeAnalyzer:
+    """Stands in for the NLP analyzer: fixed data and precomputed NLP result frames."""
+    data = DATA
+
+    def generate_insights_report(self):
+        insights = {
+            'executive_summary': {'high_risk_projects': 1, 'complex_tasks': 1},
+            'recommendations': [{'title': 'Unblock vendor API'}, {'title': 'Re-plan migration'}]
+        }
+        return insights, NLP_FRAMES
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(csv_report_generator, 'datetime', FrozenDatetime)
+    generator = EnhancedCSVReportGenerator()
+    generator.nlp_analyzer = FakeAnalyzer()
+    generator.results_dir = tmp_path
+    return generator
+
+
+@pytest.fixture
+def reports(generator):
+    return generator.generate_comprehensive_reports()
+
+
+# Baseline per-row helpers, as they were before the reports were vectorized
+
+def _parse(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _first_nlp_row(name, key, value):
+    rows = NLP_FRAMES[name][NLP_FRAMES[name][key] == value]
+    return rows.iloc[0] if not rows.empty else None
+
+
+def _project_tasks(project):
+    return [t for t in DATA['tasks'] if t.get('projectId') == project['id']]
+
+
+def _baseline_project_risk_level(project, tasks):
+    risk_score = 0
+    if project.get('status') == 'delayed':
+        risk_score += 30
+    elif project.get('progress', 0) < 50 and project.get('status') != 'completed':
+        risk_score += 20
+    delayed_task_ratio = len([t for t in tasks if t.get('status') == 'delayed']) / len(tasks) if tasks else 0
+    risk_score += delayed_task_ratio * 40
+    if risk_score >= 60:
+        return 'high'
+    elif risk_score >= 30:
+        return 'medium'
+    return 'low'
+
+
+def _baseline_health_score(project, tasks, sentiment_data):
+    score = 50 + (project.get('progress', 0) - 50) * 0.5
+    if tasks:
+        score += (len([t for t in tasks if t.get('status') == 'completed']) / len(tasks) - 0.5) * 30
+    if sentiment_data is not None:
+        score += sentiment_data.get('sentiment_score', 0) * 20
+    if project.get('status') == 'delayed':
+        score -= 25
+    return max(0, min(100, score))
+
+
+def _baseline_days_between(start, end):
+    if start and end:
+        return (_parse(end) - _parse(start)).days
+    return 0
+
+
+def _baseline_estimation_category(task):
+    estimated, actual = task.get('estimatedHours', 0), task.get('actualHours', 0)
+    if estimated == 0 or actual == 0:
+        return 'unknown'
+    ratio = actual / estimated
+    if 0.8 <= ratio <= 1.2:
+        return 'accurate'
+    elif ratio < 0.8:
+        return 'overestimated'
+    return 'underestimated'
+
+
+def _baseline_is_overdue(task):
+    due = task.get('dueDate')
+    return bool(due and task.get('status') != 'completed' and NOW > _parse(due))
+
+
+def _baseline_task_health(task, complexity_data, delay_data):
+    score = 50 + {'completed': 30, 'in_progress': 10, 'todo': 0, 'delayed': -30}.get(task.get('status', 'todo'), 0)
+    estimated, actual = task.get('estimatedHours', 0), task.get('actualHours', 0)
+    if estimated > 0 and actual > 0:
+        ratio = actual / estimated
+        if 0.8 <= ratio <= 1.2:
+            score += 20
+        elif ratio > 1.5:
+            score -= 15
+    if complexity_data is not None and complexity_data.get('complexity_level') == 'high':
+        score -= 10
+    if delay_data is not None and delay_data.get('preventability_score', 50) > 70:
+        score -= 20
+    return max(0, min(100, score))
+
+
+def _baseline_days_overdue(task):
+    due = task.get('dueDate')
+    return max(0, (NOW - _parse(due)).days) if due else 0
+
+
+def _baseline_days_remaining(project):
+    end = project.get('endDate')
+    return (_parse(end) - NOW).days if end else 0
+
+
+def _baseline_blocks_others(task):
+    return any(task['id'] in other.get('dependencies', []) for other in DATA['tasks'])
+
+
+def _baseline_preventability_category(score):
+    if score >= 70:
+        return 'highly_preventable'
+    elif score >= 40:
+        return 'moderately_preventable'
+    return 'difficult_to_prevent'
+
+
+def _baseline_delay_severity(delay_data):
+    if delay_data is None:
+        return 'medium'
+    category = delay_data.get('delay_category', '')
+    if category in ['technical_complexity', 'dependency_issues']:
+        return 'high'
+    elif category in ['requirement_changes', 'resource_constraints']:
+        return 'medium'
+    return 'low'
+
+
+def _baseline_lessons_learned(delay_data):
+    if delay_data is None:
+        return 'improve_estimation_process'
+    preventability = delay_data.get('preventability_score', 50)
+    if preventability > 70:
+        return 'better_planning_needed'
+    elif preventability < 30:
+        return 'external_factors_consideration'
+    return 'process_improvement_opportunity'
+
+
+def _baseline_risk_score(project, tasks, sentiment_data):
+    score = 25 if project.get('status') == 'delayed' else 0
+    score += (len([t for t in tasks if t.get('status') == 'delayed']) / len(tasks) if tasks else 0) * 30
+    if sentiment_data is not None:
+        score += {'high': 20, 'medium': 10}.get(sentiment_data.get('complexity_level', 'medium'), 0)
+        if sentiment_data.get('sentiment_score', 0) < -0.3:
+            score += 15
+    return min(100, score)
+
+
+def _baseline_risk_bands(risk_score):
+    """(risk level, mitigation priority, actions, monitoring frequency, potential impact)"""
+    if risk_score >= 70:
+        return 'critical', 'immediate', 'immediate_review_required, escalate_to_management', 'daily', 'project_failure'
+    elif risk_score >= 50:
+        return 'high', 'high', 'additional_resources_needed, timeline_adjustment', 'weekly', 'significant_delays'
+    elif risk_score >= 30:
+        return 'medium', 'medium', 'increased_monitoring, process_improvement', 'bi_weekly', 'minor_delays'
+    return 'low', 'low', 'continue_monitoring', 'monthly', 'minimal_impact'
+
+
+def _baseline_schedule_risk(project, tasks):
+    if project.get('status') == 'delayed':
+        return 'high'
+    delayed_tasks = len([t for t in tasks if t.get('status') == 'delayed'])
+    if delayed_tasks > len(tasks) * 0.3:
+        return 'high'
+    elif delayed_tasks > len(tasks) * 0.1:
+        return 'medium'
+    return 'low'
+
+
+def _baseline_resource_risk(tasks):
+    assignee_counts = {}
+    for task in tasks:
+        if task.get('assigneeId', ''):
+            assignee_counts[task['assigneeId']] = assignee_counts.get(task['assigneeId'], 0) + 1
+    if not assignee_counts:
+        return 'medium'
+    max_tasks = max(assignee_counts.values())
+    return 'high' if max_tasks > 5 else 'medium' if max_tasks > 3 else 'low'
+
+
+def test_project_summary_matches_baseline(reports):
+    report = reports['project_summary'].set_index('Project_ID')
+
+    assert list(report.index) == [p['id'] for p in DATA['projects']]
+    for project in DATA['projects']:
+        row = report.loc[project['id']]
+        tasks = _project_tasks(project)
+        sentiment = _first_nlp_row('sentiment_analysis', 'project_id', project['id'])
+        assert row['Total_Tasks'] == len(tasks)
+        assert row['Delayed_Tasks'] == len([t for t in tasks if t['status'] == 'delayed'])
+        assert row['Total_Estimated_Hours'] == sum(t['estimatedHours'] for t in tasks)
+        assert row['Risk_Level'] == _baseline_project_risk_level(project, tasks)
+        assert row['Overall_Health_Score'] == pytest.approx(_baseline_health_score(project, tasks, sentiment))
+        assert row['Sentiment_Label'] == (sentiment['sentiment_label'] if sentiment is not None else 'neutral')
+        assert row['Domains'] == ', '.join(project.get('domains', []))
+        assert row['Days_Duration'] == _baseline_days_between(project.get('startDate'), project.get('endDate'))
+
+
+def test_task_analysis_matches_baseline(reports):
+    report = reports['task_analysis'].set_index('Task_ID')
+
+    assert list(report.index) == [t['id'] for t in DATA['tasks']]
+    for task in DATA['tasks']:
+        row = report.loc[task['id']]
+        complexity = _first_nlp_row('task_complexity', 'task_id', task['id'])
+        delay = _first_nlp_row('delay_patterns', 'task_id', task['id'])
+        assert row['Estimation_Category'] == _baseline_estimation_category(task)
+        assert row['Is_Overdue'] == _baseline_is_overdue(task)
+        assert row['Days_To_Complete'] == _baseline_days_between(task.get('startDate'), task.get('completedDate'))
+        assert row['Task_Health_Score'] == pytest.approx(_baseline_task_health(task, complexity, delay))
+        assert row['Dependency_Count'] == len(task['dependencies'])
+        assert row['Priority_Numeric'] == {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}.get(task['priority'], 2)
+        assert row['Complexity_Level'] == (complexity['complexity_level'] if complexity is not None else 'low')
+
+
+def test_delay_analysis_matches_baseline(generator, reports):
+    report = reports['delay_analysis']
+    task_rows = report[report['Task_Title'].notna()].set_index('Task_ID')
+    alert_rows = report[report['Alert_ID'].notna()]
+
+    delayed = [t for t in DATA['tasks'] if t['status'] == 'delayed']
+    assert list(task_rows.index) == [t['id'] for t in delayed]
+    for task in delayed:
+        row = task_rows.loc[task['id']]
+        delay = _first_nlp_row('delay_patterns', 'task_id', task['id'])
+        preventability = delay['preventability_score'] if delay is not None else 50
+        assert row['Days_Overdue'] == _baseline_days_overdue(task)
+        assert generator.calculate_days_overdue(task) == row['Days_Overdue']
+        assert row['Blocks_Other_Tasks'] == _baseline_blocks_others(task)
+        assert generator.check_if_blocks_others(task, DATA['tasks']) == _baseline_blocks_others(task)
+        assert row['Overrun_Percentage'] == pytest.approx((task['actualHours'] - task['estimatedHours']) / task['estimatedHours'] * 100)
+        assert row['Preventability_Category'] == _baseline_preventability_category(preventability)
+        assert row['Severity_Level'] == _baseline_delay_severity(delay)
+        assert row['Lessons_Learned'] == _baseline_lessons_learned(delay)
+
+    assert alert_rows['Alert_ID'].tolist() == ['a1']
+    assert alert_rows['Impact_Scope'].tolist() == ['project_wide']
+
+
+def test_risk_assessment_matches_baseline(reports):
+    report = reports['risk_assessment'].set_index('Entity_ID')
+
+    for project in DATA['projects']:
+        row = report.loc[project['id']]
+        tasks = _project_tasks(project)
+        sentiment = _first_nlp_row('sentiment_analysis', 'project_id', project['id'])
+        risk_score = _baseline_risk_score(project, tasks, sentiment)
+        assert row['Overall_Risk_Score'] == pytest.approx(risk_score)
+        assert tuple(row[['Risk_Level', 'Mitigation_Priority', 'Recommended_Actions', 'Monitoring_Frequency', 'Impact_Assessment']]) \
+            == _baseline_risk_bands(risk_score)
+        assert row['Schedule_Risk'] == _baseline_schedule_risk(project, tasks)
+        assert row['Resource_Risk'] == _baseline_resource_risk(tasks)
+
+
+def test_public_helpers_keep_their_per_entity_signatures(generator):
+    for project in DATA['projects']:
+        tasks = _project_tasks(project)
+        sentiment = _first_nlp_row('sentiment_analysis', 'project_id', project['id'])
+        risk_score = _baseline_risk_score(project, tasks, sentiment)
+        assert generator.assess_project_risk_level(project, tasks) == _baseline_project_risk_level(project, tasks)
+        assert generator.calculate_health_score(project, tasks, sentiment) == pytest.approx(_baseline_health_score(project, tasks, sentiment))
+        assert generator.calculate_project_duration(project) == _baseline_days_between(project.get('startDate'), project.get('endDate'))
+        assert generator.calculate_days_remaining(project) == _baseline_days_remaining(project)
+        assert generator.calculate_comprehensive_risk_score(project, tasks, sentiment) == pytest.approx(risk_score)
+        assert (generator.categorize_risk_level(risk_score), generator.assess_mitigation_priority(risk_score),
+                generator.suggest_risk_mitigation_actions(project, tasks, risk_score),
+                generator.suggest_monitoring_frequency(risk_score),
+                generator.assess_potential_impact(project, tasks, risk_score)) == _baseline_risk_bands(risk_score)
+        assert generator.assess_schedule_risk(project, tasks) == _baseline_schedule_risk(project, tasks)
+        assert generator.assess_resource_risk(project, tasks) == _baseline_resource_risk(tasks)
+
+    for task in DATA['tasks']:
+        complexity = _first_nlp_row('task_complexity', 'task_id', task['id'])
+        delay = _first_nlp_row('delay_patterns', 'task_id', task['id'])
+        assert generator.categorize_estimation_accuracy(task) == _baseline_estimation_category(task)
+        assert generator.is_task_overdue(task) == _baseline_is_overdue(task)
+        assert generator.calculate_completion_days(task) == _baseline_days_between(task.get('startDate'), task.get('completedDate'))
+        assert generator.calculate_task_health_score(task, complexity, delay) == pytest.approx(_baseline_task_health(task, complexity, delay))
+        assert generator.assess_delay_severity(task, delay) == _baseline_delay_severity(delay)
+        assert generator.extract_lessons_learned(task, delay) == _baseline_lessons_learned(delay)
+
+    for score in (0, 39.9, 40, 70, 95):
+        assert generator.categorize_preventability(score) == _baseline_preventability_category(score)
+    assert generator.convert_priority_to_numeric('Critical') == 4
+    assert generator.convert_status_to_numeric('unknown') == 1
+
+
+def test_generate_returns_dataframes_and_saves_them(generator, reports, tmp_path):
+    assert set(reports) == set(REPORT_NAMES)
+    assert all(isinstance(report, pd.DataFrame) for report in reports.values())
+    assert len(list(tmp_path.glob('*.csv'))) == len(REPORT_NAMES)
+
+
+def test_saved_csv_uses_pandas_value_formatting(reports, tmp_path):
+    path, = tmp_path.glob('task_analysis_*.csv')
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = {row['Task_ID']: row for row in csv.DictReader(f)}
+
+    assert rows['t2']['Is_Overdue'] == 'True'
+    assert rows['t1']['Is_Overdue'] == 'False'
+
+
+def test_write_streams_reports_and_returns_metadata(generator, reports, tmp_path):
+    for path in tmp_path.glob('*.csv'):
+        path.unlink()
+
+    saved = generator.write_comprehensive_reports()
+
+    assert set(saved) == set(REPORT_NAMES)
+    for name, meta in saved.items():
+        with open(meta['file'], newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == meta['rows'] == len(reports[name])
+        assert list(rows[0].keys()) == meta['columns']
+        assert set(meta['columns']) == set(reports[name].columns)
+
+
+@pytest.fixture(params=['Asia/Tokyo', 'America/Los_Angeles'])
+def local_timezone(request, monkeypatch):
+    """Run the test with the process in a non-UTC local timezone."""
+    monkeypatch.setenv('TZ', request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_date_columns_match_baseline_outside_utc(local_timezone, generator):
+    reports = generator.generate_comprehensive_reports()
+    projects = reports['project_summary'].set_index('Project_ID')
+    tasks = reports['task_analysis'].set_index('Task_ID')
+    delays = reports['delay_analysis']
+    delays = delays[delays['Task_Title'].notna()].set_index('Task_ID')
+
+    for project in DATA['projects']:
+        assert projects.loc[project['id'], 'Days_Remaining'] == _baseline_days_remaining(project)
+    for task in DATA['tasks']:
+        assert tasks.loc[task['id'], 'Is_Overdue'] == _baseline_is_overdue(task)
+        if task['status'] == 'delayed':
+            assert delays.loc[task['id'], 'Days_Overdue'] == _baseline_days_overdue(task)
+
+
+def test_offset_dates_are_converted_to_local_time(local_timezone):
+    df = pd.DataFrame({'dueDate': ['2026-03-10T09:30:00', '2026-03-10T09:30:00Z', None]})
+
+    dates = EnhancedCSVReportGenerator._parse_dates(df, 'dueDate')
+
+    assert dates[0] == pd.Timestamp('2026-03-10 09:30')
+    assert dates[1] == pd.Timestamp('2026-03-10 09:30', tz='UTC').tz_convert(local_timezone).tz_localize(None)
+    assert pd.isna(dates[2])
@@ -0,0 +1,194 @@
+"""Tests for the DataLoader query filters and vectorized column processing."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+from data_loader import (
+    DataLoader,
+    LOCAL_TIMEZONE,
+    TABLE_COLUMNS,
+    TASK_PRIORITY_LEVELS,
+    TASK_STATUS_LEVELS,
+)
+
+QUERY = """
+            SELECT id, project_id
+            FROM tasks
+            """
+
+
+@pytest.fixture
+def loader():
+    return DataLoader()
+
+
+def test_filtered_query_without_filters_is_unchanged():
+    assert DataLoader._filtered_query(QUERY, None, None, 'project_id') == (QUERY, {})
+
+
+def test_filtered_query_adds_where_clause_and_params():
+    since = datetime(2024, 1, 1)
+
+    query, params = DataLoader._filtered_query(QUERY, since, ('p1', 'p2'), 'project_id')
+
+    assert query.split() == [
+        'SELECT', 'id,', 'project_id', 'FROM', 'tasks',
+        'WHERE', 'created_at', '>=', ':since', 'AND', 'project_id', '=', 'ANY(:project_ids)'
+    ]
+    assert params == {'since': since, 'project_ids': ['p1', 'p2']}
+
+
+def test_filtered_query_uses_the_given_project_column():
+    query, params = DataLoader._filtered_query(QUERY, None, ['p1'], 'id')
+
+    assert query.rstrip().endswith("WHERE id = ANY(:project_ids)")
+    assert params == {'project_ids': ['p1']}
+
+
+def test_filter_frame_matches_the_query_filters():
+    df = pd.DataFrame({
+        'project_id': ['p1', 'p2', 'p1', 'p3'],
+        'created_at': pd.to_datetime(['2024-01-01', '2024-02-01', '2024-03-01', '2024-04-01'])
+    }, index=[10, 11, 12, 13])
+
+    assert DataLoader._filter_frame(df, None, None, 'project_id').equals(df.reset_index(drop=True))
+
+    filtered = DataLoader._filter_frame(df, datetime(2024, 2, 1), ['p1', 'p2'], 'project_id')
+    assert filtered['project_id'].tolist() == ['p2', 'p1']
+    assert filtered.index.tolist() == [0, 1]
+
+    assert DataLoader._filter_frame(df, None, [], 'project_id').empty
+
+
+def test_filtered_mock_dataset(loader):
+    tasks = loader.load_tasks_data()
+    project_id = tasks['project_id'].iloc[0]
+
+    dataset = loader.get_comprehensive_dataset(project_ids=[project_id])
+
+    assert set(dataset['tasks']['project_id']) == {project_id}
+    assert set(dataset['projects']['id']) <= {project_id}
+    assert len(dataset['users']) == len(loader.load_users_data())
+
+
+MOCK_GENERATORS = {
+    'users': '_generate_mock_users',
+    'projects': '_generate_mock_projects',
+    'tasks': '_generate_mock_tasks',
+    'teams': '_generate_mock_teams',
+    'delay_alerts': '_generate_mock_delay_alerts'
+}
+
+
+@pytest.mark.parametrize('table', sorted(TABLE_COLUMNS))
+def test_mock_frames_match_the_selected_columns(loader, table):
+    columns = TABLE_COLUMNS[table]
+    selected = ' '.join(loader._select_query(table).split()[1:-2]).split(', ')
+    mock = getattr(loader, MOCK_GENERATORS[table])()
+
+    assert selected == columns
+    # Source columns come first; processing only appends derived ones
+    assert list(mock.columns[:len(columns)]) == columns
+
+    # A database with the same rows gives the same processed schema as the mock path
+    engine = create_engine('sqlite://')
+    mock[columns].astype(str).to_sql(table, engine, index=False)
+    loader.engine = engine
+    process = getattr(loader, f'_process_{table}_data')
+    assert list(loader._read_processed(loader._select_query(table), process).columns) == list(mock.columns)
+
+
+def test_encode_levels_is_int8_with_zero_for_unknowns():
+    values = pd.Series(['high', 'unknown', None, 'low'], index=[5, 6, 7, 8])
+
+    priority = DataLoader._encode_levels(values, TASK_PRIORITY_LEVELS)
+    assert priority.dtype == np.int8
+    assert priority.index.tolist() == [5, 6, 7, 8]
+    assert priority.tolist() == [3, 0, 0, 1]
+
+    # An unknown status never looks like the first level ('todo')
+    status = DataLoader._encode_levels(pd.Series(['todo', 'archived']), TASK_STATUS_LEVELS)
+    assert status.dtype == np.int8
+    assert status.tolist() == [1, 0]
+
+
+def test_json_list_length():
+    values = pd.Series(['["a", "b"]', '[]', None, 'null', '', ['x', 'y', 'z'], ' [1]'])
+
+    assert DataLoader._json_list_length(values).tolist() == [2, 0, 0, 0, 0, 3, 1]
+
+
+def test_to_local_datetime_converts_aware_values_to_local_wall_time():
+    aware = pd.Series([
+        datetime(2024, 1, 15, 12, tzinfo=timezone.utc),
+        datetime(2024, 7, 15, 12, tzinfo=timezone(timedelta(hours=2))),
+        None
+    ], dtype=object)
+
+    result = DataLoader._to_local_datetime(aware)
+
+    assert result.dt.tz is None
+    expected = pd.to_datetime(aware, utc=True).dt.tz_convert(LOCAL_TIMEZONE).dt.tz_localize(None)
+    assert result.iloc[:2].tolist() == expected.iloc[:2].tolist()
+    assert pd.isna(result.iloc[2])
+
+    naive = DataLoader._to_local_datetime(pd.Series(['2024-01-15 12:00:00']))
+    assert naive.iloc[0] == pd.Timestamp('2024-01-15 12:00:00')
+
+
+def _task_rows(**overrides):
+    now = datetime.now()
+    rows = {
+        'id': ['t1', 't2', 't3', 't4'],
+        'title': ['a', 'b', 'c', 'd'],
+        'status': ['completed', 'in_progress', 'todo', 'todo'],
+        'priority': ['high', 'low', 'urgent', 'medium'],
+        'estimated_hours': [10, 8, None, 2],
+        'actual_hours': [12, 4, None, 0],
+        'start_date': [now - timedelta(days=20), now - timedelta(days=10), None, now],
+        'due_date': [now - timedelta(days=10, hours=-6), now - timedelta(days=3, hours=-6), None, now + timedelta(hours=6)],
+        'completed_date': [now - timedelta(days=7), None, None, None],
+        'dependencies': ['["t2"]', None, '[]', None],
+        'created_at': [now - timedelta(days=30)] * 4
+    }
+    rows.update(overrides)
+    return pd.DataFrame(rows)
+
+
+def test_process_tasks_keeps_integer_columns_with_missing_dates(loader):
+    tasks = loader._process_tasks_data(_task_rows())
+
+    assert tasks['days_to_deadline'].dtype == np.int64
+    assert tasks['delay_days'].dtype == np.int64
+    assert tasks['priority_numeric'].dtype == np.int8
+    # Whole days are floored like timedelta.days: 9 days 18 hours past the deadline is -10
+    assert tasks['days_to_deadline'].tolist() == [-10, -3, 0, 0]
+    # Completed 2 days 18 hours late; open and 2 days 18 hours past due; no due date; due later today
+    assert tasks['delay_days'].tolist() == [2, 2, 0, 0]
+    assert tasks['is_overdue'].tolist() == [True, True, False, False]
+    assert tasks['dependency_count'].tolist() == [1, 0, 0, 0]
+    assert tasks['priority_numeric'].tolist() == [3, 1, 0, 2]
+
+
+def test_read_processed_keeps_schema_for_empty_result(loader):
+    engine = create_engine('sqlite://')
+    rows = _task_rows()
+    for column in ['start_date', 'due_date', 'completed_date', 'created_at']:
+        rows[column] = rows[column].astype(str)
+    rows.to_sql('tasks', engine, index=False)
+    loader.engine = engine
+
+    full = loader._read_processed("SELECT * FROM tasks", loader._process_tasks_data)
+    empty = loader._read_processed(
+        text("SELECT * FROM tasks WHERE id = :id").bindparams(id='missing'),
+        loader._process_tasks_data
+    )
+
+    assert len(full) == 4
+    assert empty.empty
+    assert list(empty.columns) == list(full.columns)
+    assert 'delay_days' in empty.columns